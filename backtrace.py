@@ -0,0 +1,110 @@
+def iter_bits(mask):
+    """
+    Mengiterasi indeks bit aktif pada mask dari yang terkecil.
+    
+    Args:
+        mask (int): Bitmask
+    
+    Yields:
+        int: Indeks bit aktif (ID non-terminal)
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def cell_backpointer(masks, row, col, words, compiled):
+    """
+    Menghitung isi backpointer satu sel dari chart bitmask.
+    Pilihan derivasi sama dengan cyk_parse (eager): split point terakhir yang valid,
+    lalu pasangan (left_id, right_id) terkecil pada split tersebut. Split
+    ditelusuri dari belakang dan berhenti begitu semua parent di sel terisi.
+    
+    Args:
+        masks (BitsetChart): Chart bitmask dari fill_chart
+        row (int): Baris sel (length - 1)
+        col (int): Kolom sel (posisi awal)
+        words (list): List kata
+        compiled (CompiledGrammar): Grammar terkompilasi
+    
+    Returns:
+        dict: {non_terminal: pointer} dengan format yang sama seperti cyk_process
+    """
+    symbols = compiled.symbols
+    result = {}
+    remaining = masks.get(row, col)
+    
+    if row == 0:
+        for nt in iter_bits(remaining):
+            result[symbols[nt]] = ('terminal', words[col], col)
+        return result
+    
+    partner_masks = compiled.partner_masks
+    pair_masks = compiled.pair_masks
+    length = row + 1
+    
+    for k in range(length - 1, 0, -1):
+        if not remaining:
+            break
+        left_row, right_row, right_col = k - 1, length - k - 1, col + k
+        left_mask = masks.get(left_row, col)
+        right_mask = masks.get(right_row, right_col)
+        if not left_mask or not right_mask:
+            continue
+        
+        for left in iter_bits(left_mask):
+            pairs = pair_masks[left]
+            for right in iter_bits(right_mask & partner_masks[left]):
+                new = pairs[right] & remaining
+                if not new:
+                    continue
+                remaining &= ~new
+                combo = compiled.pair_names[(left, right)]
+                for parent in iter_bits(new):
+                    result[symbols[parent]] = (
+                        k, combo, left_row, col, right_row, right_col
+                    )
+    
+    return result
+
+class LazyBackpointer:
+    """
+    Tabel backpointer yang dihitung per sel saat pertama kali diakses.
+    Dapat dipakai langsung oleh build_parse_tree dan get_sentence_pattern
+    (akses backpointer[row][col]), sehingga hanya sel yang dilalui
+    rekonstruksi parse tree yang dihitung. Jika `stats` (ParseStats) diberikan,
+    entri backpointer yang ditulis dihitung di backpointer_writes.
+    """
+    def __init__(self, masks, words, compiled, stats=None):
+        self.masks = masks
+        self.words = words
+        self.compiled = compiled
+        self.stats = stats
+        self._cells = {}
+    
+    def __len__(self):
+        return len(self.words)
+    
+    def __getitem__(self, row):
+        return _LazyBackpointerRow(self, row)
+    
+    def cell(self, row, col):
+        key = (row, col)
+        result = self._cells.get(key)
+        if result is None:
+            result = cell_backpointer(self.masks, row, col, self.words, self.compiled)
+            if self.stats is not None:
+                self.stats.backpointer_writes += len(result)
+            self._cells[key] = result
+        return result
+
+class _LazyBackpointerRow:
+    def __init__(self, backpointer, row):
+        self.backpointer = backpointer
+        self.row = row
+    
+    def __len__(self):
+        return len(self.backpointer)
+    
+    def __getitem__(self, col):
+        return self.backpointer.cell(self.row, col)
@@ -0,0 +1,52 @@
+"""
+Benchmark throughput validasi korpus: cyk_parse per kalimat vs cyk_batch.batch_parse.
+
+Cara menjalankan (dari root project):
+    python benchmarks/batch_throughput.py [--copies=N]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import cyk_process
+    import cyk_batch
+    from engine_speedup import load_sentences
+
+def run_benchmark(dataset_file="evaluation_dataset/evaluation_dataset.txt", copies=50):
+    sentences = load_sentences(dataset_file) * copies
+    
+    print("="*70)
+    print("BENCHMARK THROUGHPUT VALIDASI KORPUS")
+    print("="*70)
+    print(f"Korpus: {len(sentences)} kalimat ({copies}x dataset evaluasi)")
+    
+    start = time.perf_counter()
+    expected = []
+    for words in sentences:
+        table, _ = cyk_process.cyk_parse(words)
+        expected.append(cyk_process.is_valid_sentence(table, len(words)))
+    sequential = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    results = cyk_batch.batch_parse(sentences)
+    batched = time.perf_counter() - start
+    
+    assert [valid for valid, _ in results] == expected, "Hasil batch berbeda dengan cyk_parse"
+    
+    print(f"\n{'Mode':<12} {'Total (s)':>10} {'Kalimat/detik':>15}")
+    print("-" * 70)
+    print(f"{'sequential':<12} {sequential:>10.3f} {len(sentences)/sequential:>15.0f}")
+    print(f"{'batch':<12} {batched:>10.3f} {len(sentences)/batched:>15.0f}")
+    print(f"\nSpeedup: {sequential/batched:.2f}x")
+
+if __name__ == "__main__":
+    copies = 50
+    for arg in sys.argv[1:]:
+        if arg.startswith("--copies="):
+            copies = int(arg.split("=", 1)[1])
+    run_benchmark(copies=copies)
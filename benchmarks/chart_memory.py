@@ -0,0 +1,100 @@
+"""
+Benchmark memori tabel CYK: tabel segitiga flat (chart.py) vs grid n x n
+berisi set()/dict per sel (layout lama create_table/create_backpointer_table).
+Backpointer lama dihitung lengkap dengan tuple pointer-nya, karena
+BackpointerChart menyimpan pointer sebagai integer dalam satu array.
+
+Cara menjalankan (dari root project):
+    python benchmarks/chart_memory.py
+"""
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import cyk_process
+    from engine_speedup import synthetic_sentence
+
+SHARED_SLOTS = ('compiled', 'words')
+
+def deep_sizeof(obj, seen=None):
+    """
+    Menghitung ukuran memori struktur tabel secara rekursif (byte).
+    String dan integer tidak dihitung karena nama non-terminal dan kata
+    di-share dengan grammar, bukan milik tabel.
+    
+    Args:
+        obj: Objek yang diukur
+        seen (set): ID objek yang sudah dihitung
+    
+    Returns:
+        int: Ukuran dalam byte
+    """
+    if seen is None:
+        seen = set()
+    if isinstance(obj, (str, int)) or id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, '__slots__'):
+        for slot in obj.__slots__:
+            # Grammar dan kata di-share, bukan milik tabel
+            if slot not in SHARED_SLOTS:
+                size += deep_sizeof(getattr(obj, slot, None), seen)
+    return size
+
+def to_legacy_layout(table, backpointer, n):
+    """
+    Menyalin hasil parsing ke layout lama: grid n x n set() dan dict.
+    
+    Args:
+        table: Tabel CYK (view segitiga)
+        backpointer: Tabel backpointer segitiga
+        n (int): Panjang kalimat
+    
+    Returns:
+        tuple: (table, backpointer) dalam layout grid n x n
+    """
+    legacy_table = cyk_process.create_table(n)
+    legacy_backpointer = cyk_process.create_backpointer_table(n)
+    for row in range(n):
+        for col in range(n - row):
+            legacy_table[row][col] = set(table[row][col])
+            legacy_backpointer[row][col] = dict(backpointer[row][col])
+    return legacy_table, legacy_backpointer
+
+def run_benchmark(lengths=(10, 20, 40, 80)):
+    print("="*70)
+    print("BENCHMARK MEMORI TABEL CYK")
+    print("="*70)
+    print(f"\n{'Panjang':<8} {'Bagian':<12} {'Grid n x n (KB)':>16} {'Segitiga (KB)':>15} {'Penghematan':>12}")
+    print("-" * 70)
+    
+    for n in lengths:
+        words = synthetic_sentence(n)
+        
+        table, backpointer = cyk_process.cyk_parse(words)
+        legacy_table, legacy_backpointer = to_legacy_layout(table, backpointer, n)
+        
+        # Chart bitmask dipakai bersama oleh table dan backpointer, jadi hanya
+        # dihitung sekali (di table)
+        seen = set()
+        rows = [
+            ("table", deep_sizeof(legacy_table), deep_sizeof(table, seen)),
+            ("backpointer", deep_sizeof(legacy_backpointer), deep_sizeof(backpointer, seen)),
+        ]
+        rows.append(("total", rows[0][1] + rows[1][1], rows[0][2] + rows[1][2]))
+        
+        for part, legacy, compact in rows:
+            print(f"{n:<8} {part:<12} {legacy/1024:>16.1f} {compact/1024:>15.1f} {legacy/compact:>11.1f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
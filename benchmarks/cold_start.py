@@ -0,0 +1,88 @@
+"""
+Benchmark cold start grammar: kompilasi ulang grammar.cfg + kamus vs memuat
+artifact dari .grammar_cache/, serta waktu `import grammar` di proses baru.
+
+Cara menjalankan (dari root project):
+    python benchmarks/cold_start.py [--repeat=N]
+"""
+import os
+import py_compile
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import grammar_compiler
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import grammar; "
+    "print(time.perf_counter() - start)"
+)
+
+def time_call(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def time_import(repeat, clear_cache):
+    """
+    Median waktu `import grammar` di interpreter baru.
+    
+    Args:
+        repeat (int): Jumlah proses
+        clear_cache (bool): Hapus artifact sebelum setiap proses (kompilasi ulang)
+    
+    Returns:
+        float: Median waktu import (detik)
+    """
+    # Bytecode ditulis dulu supaya yang terukur bukan kompilasi source Python
+    for module in ("grammar.py", "grammar_compiler.py"):
+        py_compile.compile(os.path.join(ROOT, module))
+    
+    timings = []
+    for _ in range(repeat):
+        if clear_cache:
+            shutil.rmtree(os.path.join(ROOT, grammar_compiler.ARTIFACT_DIR), ignore_errors=True)
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+def run_benchmark(repeat=20):
+    print("="*70)
+    print("BENCHMARK COLD START GRAMMAR")
+    print("="*70)
+    
+    artifact_dir = tempfile.mkdtemp()
+    try:
+        grammar_compiler.load_grammar(artifact_dir=artifact_dir)
+        rebuild = time_call(lambda: grammar_compiler.load_grammar(use_cache=False), repeat)
+        cached = time_call(lambda: grammar_compiler.load_grammar(artifact_dir=artifact_dir), repeat)
+    finally:
+        shutil.rmtree(artifact_dir, ignore_errors=True)
+    
+    cold_import = time_import(max(1, repeat // 4), clear_cache=True)
+    warm_import = time_import(max(1, repeat // 4), clear_cache=False)
+    
+    print(f"\n{'Langkah':<32} {'Kompilasi (ms)':>15} {'Artifact (ms)':>15}")
+    print("-" * 70)
+    print(f"{'load_grammar':<32} {rebuild*1000:>15.2f} {cached*1000:>15.2f}")
+    print(f"{'import grammar (proses baru)':<32} {cold_import*1000:>15.2f} {warm_import*1000:>15.2f}")
+    print(f"\nSpeedup load_grammar: {rebuild/cached:.2f}x")
+
+if __name__ == "__main__":
+    repeat = 20
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    run_benchmark(repeat=repeat)
@@ -0,0 +1,73 @@
+"""
+Benchmark head-to-head parser Earley (CFG alami) vs CYK (CNF).
+Validitas dan pola kalimat kedua parser dicek sama sebelum waktu dilaporkan.
+
+Cara menjalankan (dari root project):
+    python benchmarks/earley_vs_cyk.py [--repeat=N]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import cyk_process
+    from engine_speedup import load_sentences, synthetic_sentence
+
+ENGINES = ("set", "bitset", "earley")
+
+def analyze(words, engine):
+    """
+    Validasi + pola kalimat untuk satu kalimat.
+    
+    Args:
+        words (list): List kata
+        engine (str): Nama engine
+    
+    Returns:
+        tuple: (is_valid, pattern)
+    """
+    table = cyk_process.recognize(words, engine=engine)
+    if not cyk_process.is_valid_sentence(table, len(words)):
+        return False, None
+    backpointer = cyk_process.lazy_backpointer(table, words)
+    return True, cyk_process.get_sentence_pattern(backpointer, words)['pattern']
+
+def time_workload(sentences, engine, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for words in sentences:
+            analyze(words, engine)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmark(dataset_file="evaluation_dataset/evaluation_dataset.txt", repeat=10):
+    workloads = [("dataset evaluasi", load_sentences(dataset_file), repeat)]
+    for length in (10, 20, 40, 80):
+        workloads.append((f"sintetis {length} kata", [synthetic_sentence(length)], max(1, repeat // 5)))
+    
+    print("="*70)
+    print("BENCHMARK EARLEY vs CYK (validasi + pola kalimat)")
+    print("="*70)
+    print(f"\n{'Workload':<20} " + " ".join(f"{engine + ' (ms)':>14}" for engine in ENGINES))
+    print("-" * 70)
+    
+    for name, sentences, rounds in workloads:
+        for words in sentences:
+            expected = analyze(words, "set")
+            for engine in ENGINES[1:]:
+                assert analyze(words, engine) == expected, f"Hasil {engine} berbeda: {' '.join(words)}"
+        
+        timings = [time_workload(sentences, engine, rounds) for engine in ENGINES]
+        print(f"{name:<20} " + " ".join(f"{elapsed*1000:>14.2f}" for elapsed in timings))
+
+if __name__ == "__main__":
+    repeat = 10
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    run_benchmark(repeat=repeat)
@@ -0,0 +1,141 @@
+"""
+Benchmark perbandingan engine CYK (set vs bitset) pada dataset evaluasi.
+
+Cara menjalankan (dari root project):
+    python benchmarks/engine_speedup.py [path/to/dataset.txt] [--repeat=N]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import general
+    import tokenizer
+    import cyk_process
+    from evaluation import CYKEvaluator
+
+def load_sentences(dataset_file):
+    """
+    Memuat kalimat dari dataset evaluasi yang semua katanya dikenali kamus.
+    
+    Args:
+        dataset_file (str): Path dataset evaluasi
+    
+    Returns:
+        list: List kalimat dalam bentuk list kata
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        test_cases = CYKEvaluator().load_dataset(dataset_file)
+        sentences = []
+        for tc in test_cases:
+            words = tokenizer.tokenize(tc['sentence'])
+            if general.check_alphabet(words)[0]:
+                sentences.append(words)
+    return sentences
+
+def time_engine(sentences, engine, repeat):
+    """
+    Mengukur waktu terbaik (dari beberapa repeat) untuk mem-parse semua kalimat.
+    
+    Args:
+        sentences (list): List kalimat (list kata)
+        engine (str): Nama engine CYK
+        repeat (int): Jumlah pengulangan
+    
+    Returns:
+        float: Waktu terbaik dalam detik
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for words in sentences:
+            table, backpointer = cyk_process.cyk_parse(words, engine=engine)
+            if cyk_process.is_valid_sentence(table, len(words)):
+                cyk_process.get_sentence_pattern(backpointer, words)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def time_recognize(sentences, engine, repeat):
+    """
+    Seperti time_engine, tetapi hanya validasi (recognize + is_valid_sentence).
+    
+    Args:
+        sentences (list): List kalimat (list kata)
+        engine (str): Nama engine CYK
+        repeat (int): Jumlah pengulangan
+    
+    Returns:
+        float: Waktu terbaik dalam detik
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for words in sentences:
+            cyk_process.is_valid_sentence(cyk_process.recognize(words, engine=engine), len(words))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmark(dataset_file="evaluation_dataset/evaluation_dataset.txt", repeat=20):
+    sentences = load_sentences(dataset_file)
+    
+    print("="*70)
+    print("BENCHMARK ENGINE CYK")
+    print("="*70)
+    print(f"Dataset: {dataset_file} ({len(sentences)} kalimat, repeat={repeat})")
+    
+    timings = {engine: time_engine(sentences, engine, repeat) for engine in cyk_process.ENGINES}
+    baseline = timings["set"]
+    
+    print(f"\n{'Engine':<10} {'Total (ms)':>12} {'Per kalimat (µs)':>18} {'Speedup':>9}")
+    print("-" * 70)
+    for engine, elapsed in timings.items():
+        per_sentence = elapsed / len(sentences) * 1e6 if sentences else 0
+        print(f"{engine:<10} {elapsed*1000:>12.2f} {per_sentence:>18.1f} {baseline/elapsed:>8.2f}x")
+    
+    print(f"\nMode rekognisi (recognize, tanpa backpointer):")
+    print(f"{'Engine':<10} {'Total (ms)':>12} {'Per kalimat (µs)':>18} {'Speedup':>9}")
+    print("-" * 70)
+    for engine in cyk_process.ENGINES:
+        elapsed = time_recognize(sentences, engine, repeat)
+        per_sentence = elapsed / len(sentences) * 1e6 if sentences else 0
+        print(f"{engine:<10} {elapsed*1000:>12.2f} {per_sentence:>18.1f} {baseline/elapsed:>8.2f}x")
+    
+    print(f"\nKalimat sintetis panjang (P S dengan subjek berulang):")
+    print(f"{'Panjang':<10} " + " ".join(f"{engine + ' (ms)':>14}" for engine in cyk_process.ENGINES) + f" {'Speedup':>9}")
+    print("-" * 70)
+    for length in (10, 20, 40):
+        words = synthetic_sentence(length)
+        row = {engine: time_engine([words], engine, max(1, repeat // 10)) for engine in cyk_process.ENGINES}
+        print(f"{length:<10} " + " ".join(f"{row[engine]*1000:>14.2f}" for engine in cyk_process.ENGINES)
+              + f" {row['set']/row['bitset']:>8.2f}x")
+    
+    return timings
+
+def synthetic_sentence(length):
+    """
+    Membuat kalimat valid pola P S sepanjang `length` kata:
+    "ring pura i wayan wayan ... ento" (NP_S -> NP_S PropNoun berulang).
+    
+    Args:
+        length (int): Jumlah kata (minimal 4)
+    
+    Returns:
+        list: List kata
+    """
+    return ["ring", "pura", "i"] + ["wayan"] * (length - 4) + ["ento"]
+
+if __name__ == "__main__":
+    dataset_file = "evaluation_dataset/evaluation_dataset.txt"
+    repeat = 20
+    
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+        else:
+            dataset_file = arg
+    
+    run_benchmark(dataset_file, repeat)
@@ -0,0 +1,101 @@
+"""
+Benchmark generator kalimat (generator.py): throughput sampling derivasi saja,
+throughput baris berlabel (campuran, VALID saja, INVALID saja), hit rate cache
+label, serta cek label sampel terhadap parse_cache.parse: validitas harus
+selalu sama; pola hanya dijamin sama dengan parser_patterns=True.
+
+Cara menjalankan (dari root project):
+    python benchmarks/generator_throughput.py [--count=200000] [--lengths=3-8] [--verify=2000]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import generator
+    import parse_cache
+    import tokenizer
+
+def verify(lines):
+    """
+    Membandingkan label dengan parser.
+    
+    Returns:
+        tuple: (jumlah validitas berbeda, jumlah pola VALID berbeda)
+    """
+    validity = patterns = 0
+    for line in lines:
+        label, sentence, *pattern = line.split("|")
+        _, pattern_info = parse_cache.parse(tokenizer.tokenize(sentence))
+        if (label == "VALID") != (pattern_info is not None):
+            validity += 1
+        elif pattern_info is not None:
+            patterns += pattern_info['pattern'].split("→", 1)[1].strip() != pattern[0]
+    return validity, patterns
+
+def line_rate(sampler, count, lengths, invalid_ratio):
+    """Throughput stream() dengan cache label yang sudah hangat (kalimat/s)."""
+    for line in sampler.stream(count // 4, lengths, invalid_ratio):
+        pass
+    start = time.perf_counter()
+    for line in sampler.stream(count, lengths, invalid_ratio):
+        pass
+    return count / (time.perf_counter() - start)
+
+def run_benchmark(count=200000, lengths=generator.DEFAULT_LENGTHS, samples=2000):
+    sampler = generator.SentenceGenerator(max_length=lengths[1], seed=0)
+    start = time.perf_counter()
+    for i in range(count):
+        sampler.sample(lengths[0] + i % (lengths[1] - lengths[0] + 1))
+    sample_rate = count / (time.perf_counter() - start)
+    
+    sampler = generator.SentenceGenerator(max_length=lengths[1], seed=0)
+    rates = []
+    for _ in range(2):
+        start = time.perf_counter()
+        for line in sampler.stream(count, lengths):
+            pass
+        rates.append(count / (time.perf_counter() - start))
+    stats = sampler.stats()
+    valid_rate = line_rate(generator.SentenceGenerator(max_length=lengths[1], seed=0), count, lengths, 0.0)
+    invalid_rate = line_rate(generator.SentenceGenerator(max_length=lengths[1], seed=0), count, lengths, 1.0)
+    parser_rate = line_rate(
+        generator.SentenceGenerator(max_length=lengths[1], seed=0, parser_patterns=True), count, lengths, 0.0
+    )
+    
+    checked = list(generator.SentenceGenerator(max_length=lengths[1], seed=1).stream(samples, lengths))
+    parser_checked = list(
+        generator.SentenceGenerator(max_length=lengths[1], seed=1, parser_patterns=True).stream(samples, lengths)
+    )
+    
+    print("="*70)
+    print(f"BENCHMARK GENERATOR KALIMAT (panjang {lengths[0]}-{lengths[1]})")
+    print("="*70)
+    print("Derivasi K per panjang: " + ", ".join(f"{n}={sampler.count(n):.2e}" for n in range(lengths[0], lengths[1] + 1)))
+    print(f"\nSampling derivasi saja:        {sample_rate:>10.0f} kalimat/s")
+    print(f"Baris berlabel (cache dingin): {rates[0]:>10.0f} kalimat/s")
+    print(f"Baris berlabel (cache hangat): {rates[1]:>10.0f} kalimat/s")
+    print(f"  VALID saja:                  {valid_rate:>10.0f} kalimat/s")
+    print(f"  VALID saja, parser_patterns: {parser_rate:>10.0f} kalimat/s")
+    print(f"  INVALID saja:                {invalid_rate:>10.0f} kalimat/s")
+    print(f"Signature di cache label: {stats['labels']}, span memo hit rate: {stats['span_memo']['hit_rate']*100:.1f}%")
+    for name, lines in (("pola di-sample", checked), ("parser_patterns", parser_checked)):
+        validity, patterns = verify(lines)
+        print(f"\nLabel vs parser ({name}): validitas berbeda {validity}/{samples}, pola berbeda {patterns}/{samples}")
+
+if __name__ == "__main__":
+    options = {}
+    for arg in sys.argv[1:]:
+        name, _, value = arg.partition("=")
+        if name == "--count":
+            options['count'] = int(value)
+        elif name == "--lengths":
+            low, _, high = value.partition("-")
+            options['lengths'] = (int(low), int(high or low))
+        elif name == "--verify":
+            options['samples'] = int(value)
+    run_benchmark(**options)
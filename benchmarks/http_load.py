@@ -0,0 +1,164 @@
+"""
+Load test layanan HTTP parser (server.py) di localhost: throughput dan
+latency (p50/p95/p99) dengan sejumlah koneksi keep-alive paralel.
+
+Tanpa --url, server dijalankan sebagai subprocess (`seken.py serve`) di port
+bebas dan dimatikan setelah selesai.
+
+Cara menjalankan (dari root project):
+    python benchmarks/http_load.py [--requests=2000] [--concurrency=16]
+        [--endpoint=parse|parse_many] [--batch=50] [--workers=N] [--url=http://127.0.0.1:8765]
+"""
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from engine_speedup import load_sentences
+
+# Batas waktu satu request (detik); server sendiri membalas 504 setelah 10 detik
+REQUEST_TIMEOUT = 30.0
+
+async def request(reader, writer, host, method, path, payload=None, timeout=REQUEST_TIMEOUT):
+    """Satu request HTTP/1.1 keep-alive; mengembalikan (status, body JSON)."""
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    
+    async def exchange():
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+        
+        status = int((await reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await reader.readexactly(length))
+    
+    return await asyncio.wait_for(exchange(), timeout)
+
+async def close(writer):
+    writer.close()
+    with contextlib.suppress(OSError):
+        await writer.wait_closed()
+
+async def client(host, port, jobs, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while jobs:
+            path, payload = jobs.pop()
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, host, "POST", path, payload)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        await close(writer)
+
+async def wait_ready(host, port, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), 1.0)
+            try:
+                status, health = await request(reader, writer, host, "GET", "/health", timeout=1.0)
+            finally:
+                await close(writer)
+            if status == 200:
+                return health
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, IndexError, ValueError):
+            if time.perf_counter() > deadline:
+                raise
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"Server http://{host}:{port} tidak siap dalam {timeout:g} detik")
+        await asyncio.sleep(0.1)
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def load_test(host, port, sentences, requests, concurrency, endpoint, batch):
+    health = await wait_ready(host, port)
+    if endpoint == "parse_many":
+        jobs = [
+            ("/parse_many", {"sentences": [" ".join(sentences[(i * batch + j) % len(sentences)]) for j in range(batch)]})
+            for i in range(requests)
+        ]
+    else:
+        jobs = [("/parse", {"sentence": " ".join(sentences[i % len(sentences)])}) for i in range(requests)]
+    jobs.reverse()
+    
+    latencies = []
+    statuses = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, jobs, latencies, statuses) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return health, elapsed, latencies, statuses
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def run_benchmark(requests=2000, concurrency=16, endpoint="parse", batch=50, workers=None, url=None,
+                  dataset_file="evaluation_dataset/evaluation_dataset.txt"):
+    sentences = load_sentences(os.path.join(ROOT, dataset_file))
+    
+    process = None
+    if url is None:
+        host, port = "127.0.0.1", free_port()
+        command = [sys.executable, os.path.join(ROOT, "seken.py"), "serve", f"--port={port}"]
+        if workers:
+            command.append(f"--workers={workers}")
+        process = subprocess.Popen(command, cwd=ROOT, stderr=subprocess.DEVNULL)
+    else:
+        parsed = urlparse(url)
+        host, port = parsed.hostname, parsed.port or 80
+    
+    try:
+        health, elapsed, latencies, statuses = asyncio.run(
+            load_test(host, port, sentences, requests, concurrency, endpoint, batch)
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    
+    per_request = batch if endpoint == "parse_many" else 1
+    print("="*70)
+    print("LOAD TEST LAYANAN HTTP PARSER")
+    print("="*70)
+    print(f"Server: http://{host}:{port} ({health['workers']} worker), endpoint=/{endpoint}"
+          + (f" (batch {batch})" if endpoint == "parse_many" else ""))
+    print(f"Request: {requests}, koneksi paralel: {concurrency}")
+    print(f"Status: {', '.join(f'{status}={count}' for status, count in sorted(statuses.items()))}")
+    print(f"\nThroughput: {requests / elapsed:.0f} request/s ({requests * per_request / elapsed:.0f} kalimat/s)")
+    print(f"Latency p50: {percentile(latencies, 0.50)*1000:.2f}ms")
+    print(f"Latency p95: {percentile(latencies, 0.95)*1000:.2f}ms")
+    print(f"Latency p99: {percentile(latencies, 0.99)*1000:.2f}ms")
+    print(f"Latency max: {max(latencies)*1000:.2f}ms")
+
+if __name__ == "__main__":
+    options = {}
+    for arg in sys.argv[1:]:
+        name, _, value = arg.partition("=")
+        if name in ("--requests", "--concurrency", "--batch", "--workers"):
+            options[name[2:]] = int(value)
+        elif name in ("--endpoint", "--url"):
+            options[name[2:]] = value
+    run_benchmark(**options)
@@ -0,0 +1,75 @@
+"""
+Benchmark evaluasi paralel: run_evaluation sekuensial vs process pool pada
+dataset berlabel besar (dataset evaluasi diulang N kali), sekaligus
+memastikan metrics dan urutan report identik.
+
+Cara menjalankan (dari root project):
+    python benchmarks/parallel_evaluation.py [--copies=50] [--workers=N]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import evaluation
+
+def evaluate(dataset_file, workers):
+    evaluator = evaluation.CYKEvaluator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        test_cases = evaluator.load_dataset(dataset_file)
+    
+    start = time.perf_counter()
+    if workers > 1:
+        evaluator.run_parallel(test_cases, workers)
+    else:
+        for tc in test_cases:
+            with contextlib.redirect_stdout(io.StringIO()):
+                evaluator.test_sentence(tc['sentence'], tc['expected'], tc.get('expected_pattern'), tc['category'])
+    evaluator.calculate_final_metrics()
+    return time.perf_counter() - start, evaluator
+
+def fingerprint(evaluator):
+    """Bagian report yang harus identik antar mode (tanpa waktu dan counter cache)."""
+    return (
+        evaluator.results['accuracy'],
+        (evaluator.true_positive, evaluator.true_negative, evaluator.false_positive, evaluator.false_negative),
+        list(evaluator.category_stats.items()),
+        list(evaluator.pattern_stats.items()),
+        [(tc['sentence'], tc['actual'], tc.get('actual_pattern'), tc.get('derivation_count')) for tc in evaluator.results['test_cases']]
+    )
+
+def run_benchmark(dataset_file="evaluation_dataset/evaluation_dataset.txt", copies=50, workers=None):
+    workers = workers or os.cpu_count() or 1
+    with open(dataset_file, encoding="utf-8") as f:
+        content = f.read()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        big_dataset = os.path.join(tmp, "dataset.txt")
+        with open(big_dataset, "w", encoding="utf-8") as f:
+            f.write("\n".join([content.rstrip("\n")] * copies) + "\n")
+        
+        sequential, expected = evaluate(big_dataset, 1)
+        parallel, evaluator = evaluate(big_dataset, workers)
+    
+    assert fingerprint(evaluator) == fingerprint(expected), "Hasil evaluasi paralel berbeda dengan sekuensial"
+    
+    print("="*70)
+    print("BENCHMARK EVALUASI PARALEL")
+    print("="*70)
+    print(f"Dataset: {expected.results['total_tests']} test case ({copies}x dataset evaluasi), CPU: {os.cpu_count()}")
+    print(f"\nSekuensial:          {sequential:.3f}s")
+    print(f"Paralel ({workers} worker): {parallel:.3f}s ({sequential/parallel:.2f}x)")
+    print(f"Rata-rata parse time: {expected.results['avg_parse_time']*1e6:.1f}us (perf_counter_ns)")
+
+if __name__ == "__main__":
+    copies, workers = 50, None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--copies="):
+            copies = int(arg.split("=", 1)[1])
+        elif arg.startswith("--workers="):
+            workers = int(arg.split("=", 1)[1])
+    run_benchmark(copies=copies, workers=workers)
@@ -0,0 +1,112 @@
+"""
+Benchmark cache hasil parsing: parse tanpa cache vs hit di memori (LRU)
+vs hit di disk (SQLite, mis. setelah aplikasi di-restart), serta hit rate
+kunci per kalimat (token) vs kunci signature kelas kata.
+
+Cara menjalankan (dari root project):
+    python benchmarks/parse_cache_hits.py [--repeat=5] [--requests=2000]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import grammar
+    import parse_cache
+    from engine_speedup import load_sentences
+
+def hit_rate(keys):
+    """Hit rate cache tak terbatas untuk urutan kunci permintaan."""
+    seen = set()
+    hits = 0
+    for key in keys:
+        if key in seen:
+            hits += 1
+        seen.add(key)
+    return hits / len(keys)
+
+def synthetic_requests(sentences, count, rng):
+    """
+    Permintaan sintetis: kalimat dataset dengan setiap kata diganti kata acak
+    dari kelas yang sama (mis. nama orang atau tempat lain).
+    """
+    compiled = grammar.compiled
+    members = {}
+    for word, word_class in compiled.lexical_masks.items():
+        members.setdefault(word_class, []).append(word)
+    for words in members.values():
+        words.sort()
+    return [
+        [rng.choice(members[word_class]) for word_class in parse_cache.word_classes(words, compiled)]
+        for words in (rng.choice(sentences) for _ in range(count))
+    ]
+
+def time_pass(sentences, make_cache, repeat):
+    """Waktu terbaik satu putaran parse semua kalimat (cache dibuat ulang tiap repeat)."""
+    best = None
+    results = None
+    for _ in range(repeat):
+        cache = make_cache()
+        start = time.perf_counter()
+        results = [parse_cache.parse(words, prune=True, cache=cache)[1] for words in sentences]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        if cache is not None:
+            cache.close()
+    return best, results
+
+def run_benchmark(dataset_file="evaluation_dataset/evaluation_dataset.txt", repeat=5, requests=2000):
+    sentences = load_sentences(dataset_file)
+    
+    print("="*70)
+    print("BENCHMARK PARSE CACHE")
+    print("="*70)
+    print(f"Dataset: {len(sentences)} kalimat, repeat={repeat}")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "parse_cache.sqlite3")
+        
+        # Isi cache memori dan disk sekali
+        warm = parse_cache.ParseCache(db_path=db_path)
+        for words in sentences:
+            parse_cache.parse(words, prune=True, cache=warm)
+        
+        uncached, expected = time_pass(sentences, lambda: None, repeat)
+        memory, memory_results = time_pass(sentences, lambda: warm, 1)
+        # Cache baru atas file yang sama: memori kosong, semua hit dari disk
+        disk, disk_results = time_pass(sentences, lambda: parse_cache.ParseCache(db_path=db_path), repeat)
+        warm.close()
+    
+    assert memory_results == expected and disk_results == expected, "Hasil cache berbeda dengan parse langsung"
+    
+    print(f"\n{'Mode':<20} {'Total (ms)':>12} {'Per kalimat (us)':>18} {'Speedup':>9}")
+    print("-" * 70)
+    for name, elapsed in (("tanpa cache", uncached), ("hit memori", memory), ("hit disk", disk)):
+        print(f"{name:<20} {elapsed*1000:>12.2f} {elapsed/len(sentences)*1e6:>18.1f} {uncached/elapsed:>8.1f}x")
+    
+    compiled = grammar.compiled
+    workloads = (
+        ("dataset", sentences),
+        (f"sintetis ({requests})", synthetic_requests(sentences, requests, random.Random(0)))
+    )
+    print(f"\n{'Beban':<20} {'Hit rate token':>16} {'Hit rate signature':>20}")
+    print("-" * 70)
+    for name, workload in workloads:
+        by_tokens = hit_rate([tuple(words) for words in workload])
+        by_signature = hit_rate([parse_cache.cache_key(words, compiled) for words in workload])
+        print(f"{name:<20} {by_tokens*100:>15.1f}% {by_signature*100:>19.1f}%")
+
+if __name__ == "__main__":
+    repeat, requests = 5, 2000
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+        elif arg.startswith("--requests="):
+            requests = int(arg.split("=", 1)[1])
+    run_benchmark(repeat=repeat, requests=requests)
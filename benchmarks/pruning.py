@@ -0,0 +1,79 @@
+"""
+Benchmark pruning reachability + early abort (recognize(prune=True)).
+Jumlah rule lookup diambil dari instrumentasi (parse_stats.ParseStats): setiap
+pasangan (B, C) dari sel kiri x sel kanan pada setiap split point adalah satu
+lookup tabel aturan biner. Angka ini diestimasi dari chart yang sudah terisi
+(sel yang dilewati early abort tidak dihitung), bukan dihitung di dalam loop.
+
+Cara menjalankan (dari root project):
+    python benchmarks/pruning.py [--repeat=N]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import cyk_process
+    import parse_stats
+    from engine_speedup import load_sentences, synthetic_sentence
+
+def measure(sentences, prune, repeat):
+    """
+    Mengukur waktu terbaik, total rule lookup, dan jumlah kalimat valid.
+    
+    Args:
+        sentences (list): List kalimat (list kata)
+        prune (bool): Aktifkan pruning
+        repeat (int): Jumlah pengulangan
+    
+    Returns:
+        tuple: (waktu detik, rule lookup, jumlah valid)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for words in sentences:
+            cyk_process.recognize(words, prune=prune)
+        best = min(best, time.perf_counter() - start)
+    
+    stats = parse_stats.ParseStats()
+    valid = 0
+    for words in sentences:
+        table = cyk_process.recognize(words, prune=prune, stats=stats)
+        valid += cyk_process.is_valid_sentence(table, len(words))
+    return best, stats.rule_lookups, valid
+
+def run_benchmark(dataset_file="evaluation_dataset/evaluation_dataset.txt", repeat=20):
+    workloads = [
+        ("dataset evaluasi", load_sentences(dataset_file)),
+        ("sintetis 20 kata", [synthetic_sentence(20)]),
+        ("sintetis 40 kata", [synthetic_sentence(40)]),
+    ]
+    
+    print("="*70)
+    print("BENCHMARK PRUNING CYK (engine set, mode rekognisi)")
+    print("="*70)
+    print(f"\n{'Workload':<18} {'Prune':<6} {'Waktu (ms)':>11} {'Rule lookup':>12} {'Valid':>6}")
+    print("-" * 70)
+    
+    for name, sentences in workloads:
+        results = {prune: measure(sentences, prune, repeat) for prune in (False, True)}
+        assert results[False][2] == results[True][2], "Pruning mengubah hasil validasi"
+        for prune, (elapsed, lookups, valid) in results.items():
+            print(f"{name:<18} {str(prune):<6} {elapsed*1000:>11.2f} {lookups:>12} {valid:>6}")
+        print(f"{'':<18} {'':<6} {results[False][0]/results[True][0]:>10.2f}x "
+              f"{results[False][1]/max(1, results[True][1]):>11.2f}x")
+    
+    print("\nRule lookup diestimasi dari chart terisi (parse_stats.ParseStats.add_span),")
+    print("bukan dihitung di dalam loop CYK.")
+
+if __name__ == "__main__":
+    repeat = 20
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    run_benchmark(repeat=repeat)
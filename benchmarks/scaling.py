@@ -0,0 +1,176 @@
+"""
+Benchmark skala parser dengan input sintetis dari grammar: panjang kalimat
+terkontrol (5 sampai 200+ token) dan ukuran kamus terkontrol. Setiap fase
+(cyk_parse, get_sentence_pattern, format_parse_tree) diukur terpisah, peak
+memori diukur dengan tracemalloc, dan hasil ditulis ke JSON bersama info
+mesin dan commit, sehingga kurva O(n^3) dan regresi antar commit terlihat.
+
+Cara menjalankan (dari root project):
+    python benchmarks/scaling.py [--lengths=5,10,20,40,80,120,160,200]
+        [--lexicon-scales=1,10,100] [--lexicon-length=40] [--engine=set]
+        [--repeat=3] [--output=scaling_benchmark.json]
+"""
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import cyk_process
+    import general
+    import generator
+    import grammar
+
+def scaled_lexicon(scale):
+    """Kamus in-memory: kamus asli + kata sintetis sehingga tiap kategori `scale` kali lebih besar."""
+    base = general.default_lexicon
+    words = {}
+    for name in base.categories:
+        original = list(base.words(name))
+        extra = [f"{name}{i}" for i in range(len(original) * (scale - 1))]
+        words[name] = original + extra
+    return general.Lexicon(words=words)
+
+def measure(words, compiled, engine, repeat):
+    """Waktu terbaik per fase dan peak memori (tracemalloc, run terpisah)."""
+    n = len(words)
+    timings = {'cyk_parse': None, 'get_sentence_pattern': None, 'format_parse_tree': None}
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        table, backpointer = cyk_process.cyk_parse(words, compiled, engine=engine)
+        parsed = time.perf_counter_ns()
+        pattern_info = cyk_process.get_sentence_pattern(backpointer, words, "K")
+        patterned = time.perf_counter_ns()
+        cyk_process.format_parse_tree(pattern_info['parse_tree'], words)
+        formatted = time.perf_counter_ns()
+        
+        for phase, elapsed in (
+            ('cyk_parse', parsed - start),
+            ('get_sentence_pattern', patterned - parsed),
+            ('format_parse_tree', formatted - patterned)
+        ):
+            if timings[phase] is None or elapsed < timings[phase]:
+                timings[phase] = elapsed
+    
+    assert cyk_process.is_valid_sentence(table, n, "K"), "Kalimat sintetis harus valid"
+    
+    tracemalloc.start()
+    table, backpointer = cyk_process.cyk_parse(words, compiled, engine=engine)
+    pattern_info = cyk_process.get_sentence_pattern(backpointer, words, "K")
+    cyk_process.format_parse_tree(pattern_info['parse_tree'], words)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        'length': n,
+        'time_ms': {phase: elapsed / 1e6 for phase, elapsed in timings.items()},
+        'peak_memory_kb': peak / 1024
+    }
+
+def growth_exponent(points):
+    """Kemiringan log-log (least squares) waktu cyk_parse terhadap panjang."""
+    xs = [math.log(point['length']) for point in points]
+    ys = [math.log(point['time_ms']['cyk_parse']) for point in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance if variance else None
+
+def machine_info():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    return {
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'commit': commit,
+        'dirty': dirty
+    }
+
+def run_benchmark(lengths=(5, 10, 20, 40, 80, 120, 160, 200), lexicon_scales=(1, 10, 100), lexicon_length=40,
+                  engine="set", repeat=3, output="scaling_benchmark.json", seed=0):
+    compiled = grammar.compiled
+    sampler = generator.SentenceGenerator(compiled=compiled, max_length=max(max(lengths), lexicon_length), seed=seed)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * max(lengths) + 100))
+    
+    print("="*70)
+    print(f"BENCHMARK SKALA PARSER (engine={engine}, repeat={repeat})")
+    print("="*70)
+    print(f"\n{'Panjang':>8} {'cyk_parse (ms)':>15} {'pattern (ms)':>13} {'format (ms)':>12} {'Peak (KB)':>11}")
+    print("-" * 70)
+    by_length = []
+    for length in lengths:
+        point = measure(sampler.sample(length), compiled, engine, repeat)
+        by_length.append(point)
+        times = point['time_ms']
+        print(f"{length:>8} {times['cyk_parse']:>15.3f} {times['get_sentence_pattern']:>13.3f} "
+              f"{times['format_parse_tree']:>12.3f} {point['peak_memory_kb']:>11.1f}")
+    
+    large = [point for point in by_length if point['length'] >= 20] or by_length
+    exponent = growth_exponent(large)
+    if exponent is not None:
+        print(f"\nEksponen waktu cyk_parse (log-log, n >= {large[0]['length']}): {exponent:.2f}")
+    
+    print(f"\n{'Kamus':>8} {'Kata':>9} {'cyk_parse (ms)':>15} {'pattern (ms)':>13} {'format (ms)':>12} {'Peak (KB)':>11}")
+    print("-" * 70)
+    by_lexicon = []
+    for scale in lexicon_scales:
+        with contextlib.redirect_stdout(io.StringIO()):
+            lexicon = scaled_lexicon(scale)
+            scaled = grammar.compile_lexicon(lexicon)
+            words = generator.SentenceGenerator(lexicon, scaled, lexicon_length, seed=seed + scale).sample(lexicon_length)
+        point = measure(words, scaled, engine, repeat)
+        point.update({'lexicon_scale': scale, 'lexicon_size': len(lexicon)})
+        by_lexicon.append(point)
+        times = point['time_ms']
+        print(f"{f'{scale}x':>8} {len(lexicon):>9} {times['cyk_parse']:>15.3f} {times['get_sentence_pattern']:>13.3f} "
+              f"{times['format_parse_tree']:>12.3f} {point['peak_memory_kb']:>11.1f}")
+    
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'machine': machine_info(),
+        'engine': engine,
+        'repeat': repeat,
+        'seed': seed,
+        'by_length': by_length,
+        'cyk_parse_exponent': exponent,
+        'by_lexicon': by_lexicon
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nHasil disimpan ke: {output}")
+
+if __name__ == "__main__":
+    options = {}
+    for arg in sys.argv[1:]:
+        name, _, value = arg.partition("=")
+        if name == "--lengths":
+            options['lengths'] = tuple(int(item) for item in value.split(","))
+        elif name == "--lexicon-scales":
+            options['lexicon_scales'] = tuple(int(item) for item in value.split(","))
+        elif name == "--lexicon-length":
+            options['lexicon_length'] = int(value)
+        elif name == "--engine":
+            options['engine'] = value
+        elif name == "--repeat":
+            options['repeat'] = int(value)
+        elif name == "--output":
+            options['output'] = value
+    run_benchmark(**options)
@@ -0,0 +1,84 @@
+"""
+Benchmark memo sub-span lintas kalimat: recognize tanpa memo vs dengan
+SpanMemo pada satu batch kalimat, beserta hit ratio dan estimasi waktu yang
+dihemat per panjang span.
+
+Batch berisi kalimat dataset evaluasi ditambah kalimat gabungan (prefix satu
+kalimat + suffix kalimat lain) sehingga banyak sub-span berulang.
+
+Cara menjalankan (dari root project):
+    python benchmarks/span_memo.py [--repeat=5] [--mixed=500] [--engine=set] [--prune]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import cyk_process
+    import span_memo
+    from engine_speedup import load_sentences
+
+def mixed_sentences(sentences, count, rng):
+    """Kalimat gabungan: prefix kalimat acak + suffix kalimat acak lain."""
+    result = []
+    for _ in range(count):
+        first, second = rng.choice(sentences), rng.choice(sentences)
+        result.append(first[:rng.randint(1, len(first))] + second[rng.randint(0, len(second) - 1):])
+    return result
+
+def time_batch(sentences, engine, prune, repeat, with_memo):
+    """Waktu terbaik mengisi chart seluruh batch (memo baru setiap repeat)."""
+    best = None
+    memo = None
+    for _ in range(repeat):
+        memo = span_memo.SpanMemo() if with_memo else None
+        start = time.perf_counter()
+        charts = [cyk_process.recognize(words, engine=engine, prune=prune, memo=memo).chart.masks for words in sentences]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, charts, memo
+
+def run_benchmark(dataset_file="evaluation_dataset/evaluation_dataset.txt", repeat=5, mixed=500, engine="set", prune=False):
+    sentences = load_sentences(dataset_file)
+    batch = sentences + mixed_sentences(sentences, mixed, random.Random(0))
+    
+    print("="*70)
+    print("BENCHMARK MEMO SUB-SPAN")
+    print("="*70)
+    print(f"Batch: {len(batch)} kalimat ({len(sentences)} dataset + {mixed} gabungan), "
+          f"engine={engine}, prune={prune}, repeat={repeat}")
+    
+    plain, expected, _ = time_batch(batch, engine, prune, repeat, False)
+    memoized, charts, memo = time_batch(batch, engine, prune, repeat, True)
+    assert charts == expected, "Chart dengan memo berbeda dengan tanpa memo"
+    
+    stats = memo.stats()
+    print(f"\n{'Panjang span':<14} {'Hit':>8} {'Miss':>8} {'Hit ratio':>10} {'Hemat (ms)':>12}")
+    print("-" * 70)
+    for length, entry in stats['by_length'].items():
+        print(f"{length:<14} {entry['hits']:>8} {entry['misses']:>8} "
+              f"{entry['hit_rate']*100:>9.1f}% {entry['saved_ms']:>12.2f}")
+    print("-" * 70)
+    print(f"{'total':<14} {stats['hits']:>8} {stats['misses']:>8} "
+          f"{stats['hit_rate']*100:>9.1f}% {stats['saved_ms']:>12.2f}")
+    
+    print(f"\nTanpa memo: {plain*1000:.2f}ms")
+    print(f"Dengan memo: {memoized*1000:.2f}ms ({plain/memoized:.2f}x)")
+
+if __name__ == "__main__":
+    repeat, mixed, engine, prune = 5, 500, "set", False
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+        elif arg.startswith("--mixed="):
+            mixed = int(arg.split("=", 1)[1])
+        elif arg.startswith("--engine="):
+            engine = arg.split("=", 1)[1]
+        elif arg == "--prune":
+            prune = True
+    run_benchmark(repeat=repeat, mixed=mixed, engine=engine, prune=prune)
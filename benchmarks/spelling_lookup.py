@@ -0,0 +1,85 @@
+"""
+Benchmark saran ejaan: index SymSpell vs scan edit distance ke semua kata,
+pada kamus asli dan kamus sintetis N kali lebih besar.
+
+Cara menjalankan (dari root project):
+    python benchmarks/spelling_lookup.py [--scale=100] [--queries=200]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import general
+import spelling
+
+LETTERS = "abcdeghijklmnoprstuwy"
+
+def synthetic_lexicon(words, scale, rng):
+    """Kamus sintetis: kata asli + varian dengan 1-3 huruf tambahan."""
+    lexicon = set(words)
+    while len(lexicon) < len(words) * scale:
+        word = rng.choice(words)
+        lexicon.add(word + "".join(rng.choice(LETTERS) for _ in range(rng.randint(1, 3))))
+    return lexicon
+
+def typo(word, rng):
+    """Satu kesalahan ketik acak (hapus, sisip, ganti, atau tukar huruf)."""
+    i = rng.randrange(len(word))
+    kind = rng.choice(("delete", "insert", "replace", "swap"))
+    if kind == "delete" and len(word) > 1:
+        return word[:i] + word[i + 1:]
+    if kind == "swap" and i + 1 < len(word):
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    if kind == "replace":
+        return word[:i] + rng.choice(LETTERS) + word[i + 1:]
+    return word[:i] + rng.choice(LETTERS) + word[i:]
+
+def brute_force(term, words, limit=5):
+    matches = []
+    for word in words:
+        distance = spelling.edit_distance(term, word, spelling.DEFAULT_MAX_DISTANCE)
+        if distance <= spelling.DEFAULT_MAX_DISTANCE:
+            matches.append((distance, word))
+    matches.sort()
+    return [(word, distance) for distance, word in matches[:limit]]
+
+def run_benchmark(scale=100, queries=200):
+    rng = random.Random(0)
+    words = sorted(general.default_lexicon.alphabet)
+    
+    print("="*70)
+    print("BENCHMARK SARAN EJAAN (SymSpell vs brute force)")
+    print("="*70)
+    print(f"\n{'Kamus':<12} {'Kata':>8} {'Build (s)':>10} {'Index (ms)':>11} {'Brute (ms)':>11}")
+    print("-" * 70)
+    
+    for name, lexicon in (("asli", set(words)), (f"{scale}x", synthetic_lexicon(words, scale, rng))):
+        terms = [typo(rng.choice(words), rng) for _ in range(queries)]
+        
+        start = time.perf_counter()
+        index = spelling.SymSpellIndex(lexicon)
+        build = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        results = [index.lookup(term) for term in terms]
+        indexed = (time.perf_counter() - start) / queries
+        
+        sample = terms[:max(1, queries // 20)]
+        start = time.perf_counter()
+        expected = [brute_force(term, lexicon) for term in sample]
+        brute = (time.perf_counter() - start) / len(sample)
+        
+        assert results[:len(sample)] == expected, "Hasil index berbeda dengan brute force"
+        print(f"{name:<12} {len(lexicon):>8} {build:>10.2f} {indexed*1000:>11.3f} {brute*1000:>11.3f}")
+
+if __name__ == "__main__":
+    scale, queries = 100, 200
+    for arg in sys.argv[1:]:
+        if arg.startswith("--scale="):
+            scale = int(arg.split("=", 1)[1])
+        elif arg.startswith("--queries="):
+            queries = int(arg.split("=", 1)[1])
+    run_benchmark(scale, queries)
@@ -0,0 +1,66 @@
+"""
+Benchmark tokenizer multi-kata: panjang kalimat dan waktu CYK dengan
+sentence.lower().split() vs tokenizer.tokenize() (longest match entri kamus).
+
+Cara menjalankan (dari root project):
+    python benchmarks/tokenizer_length.py [--repeat=N]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import general
+    import tokenizer
+    import cyk_process
+    from evaluation import CYKEvaluator
+
+def load_tokenized(dataset_file, tokenize):
+    with contextlib.redirect_stdout(io.StringIO()):
+        test_cases = CYKEvaluator().load_dataset(dataset_file)
+        sentences = []
+        for tc in test_cases:
+            words = tokenize(tc['sentence'])
+            if general.check_alphabet(words)[0]:
+                sentences.append(words)
+    return sentences
+
+def time_parse(sentences, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for words in sentences:
+            table = cyk_process.recognize(words)
+            cyk_process.is_valid_sentence(table, len(words))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmark(dataset_file="evaluation_dataset/evaluation_dataset.txt", repeat=20):
+    modes = [
+        ("split", lambda sentence: sentence.lower().split()),
+        ("tokenize", tokenizer.tokenize)
+    ]
+    
+    print("="*70)
+    print("BENCHMARK TOKENIZER MULTI-KATA")
+    print("="*70)
+    print(f"\n{'Mode':<10} {'Token':>8} {'Sel chart':>10} {'Waktu CYK (ms)':>16}")
+    print("-" * 70)
+    
+    for name, tokenize in modes:
+        sentences = load_tokenized(dataset_file, tokenize)
+        tokens = sum(len(words) for words in sentences)
+        cells = sum(len(words) * (len(words) + 1) // 2 for words in sentences)
+        elapsed = time_parse(sentences, repeat)
+        print(f"{name:<10} {tokens:>8} {cells:>10} {elapsed*1000:>16.2f}")
+
+if __name__ == "__main__":
+    repeat = 20
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    run_benchmark(repeat=repeat)
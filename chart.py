@@ -0,0 +1,158 @@
+from array import array
+from types import MappingProxyType
+
+EMPTY_POINTERS = MappingProxyType({})
+
+def triangular_size(n):
+    """
+    Jumlah sel yang dipakai tabel CYK bottom-up untuk n kata: n(n+1)/2.
+    
+    Args:
+        n (int): Jumlah kata
+    
+    Returns:
+        int: Jumlah sel
+    """
+    return n * (n + 1) // 2
+
+def triangular_index(n, row, col):
+    """
+    Indeks flat untuk sel (row, col) pada tabel segitiga.
+    Baris ke-r berisi n - r sel, sehingga offset baris r = r*n - r(r-1)/2.
+    
+    Args:
+        n (int): Jumlah kata
+        row (int): Baris (0 = length 1)
+        col (int): Kolom (posisi awal)
+    
+    Returns:
+        int: Indeks pada array flat
+    """
+    return row * n - row * (row - 1) // 2 + col
+
+# Jumlah non-terminal maksimum yang muat dalam satu sel array('Q')
+ARRAY_MASK_BITS = 64
+
+class BitsetChart:
+    """
+    Tabel segitiga dengan setiap sel berupa bitmask non-terminal yang disimpan
+    dalam satu array('Q') flat (8 byte per sel, tanpa objek per sel).
+    Grammar dengan lebih dari ARRAY_MASK_BITS non-terminal tidak muat di 'Q',
+    sehingga sel disimpan sebagai list int Python (tanpa batas lebar mask).
+    """
+    __slots__ = ('n', 'masks')
+    
+    def __init__(self, n, width=ARRAY_MASK_BITS, masks=None):
+        self.n = n
+        if width <= ARRAY_MASK_BITS:
+            self.masks = array('Q', masks if masks is not None else bytes(8 * triangular_size(n)))
+        else:
+            self.masks = list(masks) if masks is not None else [0] * triangular_size(n)
+    
+    def get(self, row, col):
+        return self.masks[triangular_index(self.n, row, col)]
+    
+    def set(self, row, col, mask):
+        self.masks[triangular_index(self.n, row, col)] = mask
+    
+    def __len__(self):
+        return self.n
+
+class BackpointerChart:
+    """
+    Backpointer eager dalam satu array flat berindeks (sel, non-terminal).
+    Setiap slot menyimpan split point dan pasangan (left_id, right_id) yang
+    dikodekan menjadi satu integer ((k * width + left) * width + right), tanpa
+    dict/tuple per sel. Non-terminal mana yang ada di sel dibaca dari chart
+    bitmask, dan baris terminal tidak disimpan karena pointer-nya diturunkan
+    dari kata. Akses backpointer[row][col] membuat dict
+    {non_terminal: pointer} dengan format yang sama seperti sebelumnya.
+    """
+    __slots__ = ('n', 'masks', 'words', 'compiled', 'width', 'codes')
+    
+    def __init__(self, masks, words, compiled):
+        self.n = len(words)
+        self.masks = masks
+        self.words = words
+        self.compiled = compiled
+        self.width = len(compiled.symbols)
+        size = triangular_size(self.n) * self.width
+        typecode = 'I' if (self.n + 1) * self.width * self.width < 1 << 32 else 'Q'
+        self.codes = array(typecode, bytes(array(typecode).itemsize * size))
+    
+    def slot(self, row, col):
+        """Indeks slot non-terminal ke-0 untuk sel (row, col) pada array codes."""
+        return triangular_index(self.n, row, col) * self.width
+    
+    def get(self, row, col):
+        mask = self.masks.get(row, col)
+        if not mask:
+            return EMPTY_POINTERS
+        compiled = self.compiled
+        symbols = compiled.symbols
+        if row == 0:
+            word = self.words[col]
+            return {symbols[nt]: ('terminal', word, col) for nt in compiled.mask_ids(mask)}
+        
+        width = self.width
+        codes = self.codes
+        base = self.slot(row, col)
+        pair_names = compiled.pair_names
+        pointers = {}
+        for nt in compiled.mask_ids(mask):
+            k, pair = divmod(codes[base + nt], width * width)
+            left, right = divmod(pair, width)
+            pointers[symbols[nt]] = (k, pair_names[(left, right)], k - 1, col, row - k, col + k)
+        return pointers
+    
+    def __len__(self):
+        return self.n
+    
+    def __getitem__(self, row):
+        return ChartRow(self, row)
+
+class ChartView:
+    """
+    View read-only atas BitsetChart yang mengembalikan frozenset nama
+    non-terminal, sehingga bisa diiterasi seperti tabel lama: table[row][col].
+    """
+    __slots__ = ('chart', 'compiled')
+    
+    def __init__(self, chart, compiled):
+        self.chart = chart
+        self.compiled = compiled
+    
+    @property
+    def n(self):
+        return self.chart.n
+    
+    def get(self, row, col):
+        return self.compiled.mask_names(self.chart.get(row, col))
+    
+    def __len__(self):
+        return self.chart.n
+    
+    def __getitem__(self, row):
+        return ChartRow(self, row)
+
+class ChartRow:
+    """Satu baris read-only dari tabel segitiga (akses table[row][col])."""
+    __slots__ = ('chart', 'row')
+    
+    def __init__(self, chart, row):
+        if not 0 <= row < chart.n:
+            raise IndexError(f"Baris {row} di luar tabel ukuran {chart.n}")
+        self.chart = chart
+        self.row = row
+    
+    def __len__(self):
+        return self.chart.n - self.row
+    
+    def __getitem__(self, col):
+        if not 0 <= col < self.chart.n - self.row:
+            raise IndexError(f"Kolom {col} di luar baris {self.row}")
+        return self.chart.get(self.row, col)
+    
+    def __iter__(self):
+        for col in range(len(self)):
+            yield self.chart.get(self.row, col)
@@ -0,0 +1,135 @@
+import numpy as np
+
+import grammar
+
+# Batas ukuran tensor per pemanggilan fill_batch (jumlah elemen chart atau
+# pasangan aturan); kelompok panjang yang lebih besar dipecah menjadi beberapa batch
+MAX_BATCH_ELEMENTS = 1 << 25
+
+def build_rule_arrays(compiled):
+    """
+    Mengubah tabel aturan biner menjadi array NumPy untuk aplikasi aturan tervektorisasi.
+    
+    Args:
+        compiled (CompiledGrammar): Grammar terkompilasi
+    
+    Returns:
+        tuple: (left_ids, right_ids, rule_to_parent)
+            left_ids, right_ids: array int [R] simbol kiri/kanan setiap aturan
+            rule_to_parent: matriks float32 [R, N], 1 jika aturan r menghasilkan parent p
+                (float32 agar perkalian matriks memakai BLAS; jumlah pasangan per
+                parent tetap eksak sampai 2^24, jauh di atas jumlah aturan R)
+    """
+    rules = [
+        (left, right, parent)
+        for (left, right), parents in sorted(compiled.binary_rules.items())
+        for parent in parents
+    ]
+    left_ids = np.array([rule[0] for rule in rules], dtype=np.intp)
+    right_ids = np.array([rule[1] for rule in rules], dtype=np.intp)
+    rule_to_parent = np.zeros((len(rules), len(compiled.symbols)), dtype=np.float32)
+    for r, rule in enumerate(rules):
+        rule_to_parent[r, rule[2]] = 1
+    return left_ids, right_ids, rule_to_parent
+
+def fill_batch(batch, compiled, rule_arrays=None):
+    """
+    Mengisi chart CYK untuk sekumpulan kalimat dengan panjang yang sama.
+    Chart berbentuk tensor boolean [batch, span, start, nonterminal] dan setiap
+    panjang span diisi sekaligus untuk semua kalimat dan semua posisi awal.
+    
+    Args:
+        batch (list): List kalimat (list kata) yang panjangnya sama
+        compiled (CompiledGrammar): Grammar terkompilasi
+        rule_arrays (tuple): Hasil build_rule_arrays (opsional, untuk reuse)
+    
+    Returns:
+        numpy.ndarray: Tensor boolean [batch, n, n, N]; chart[b, length-1, col, nt]
+    """
+    if rule_arrays is None:
+        rule_arrays = build_rule_arrays(compiled)
+    left_ids, right_ids, rule_to_parent = rule_arrays
+    
+    size = len(batch)
+    n = len(batch[0])
+    num_symbols = len(compiled.symbols)
+    chart = np.zeros((size, n, n, num_symbols), dtype=bool)
+    
+    lexical = compiled.lexical
+    for b, words in enumerate(batch):
+        for col, word in enumerate(words):
+            chart[b, 0, col, list(lexical.get(word, ()))] = True
+    
+    for length in range(2, n + 1):
+        starts = n - length + 1
+        found = np.zeros((size, starts, len(left_ids)), dtype=bool)
+        
+        for k in range(1, length):
+            left = chart[:, k - 1, :starts, :]
+            right = chart[:, length - k - 1, k:k + starts, :]
+            found |= left[:, :, left_ids] & right[:, :, right_ids]
+        
+        # Hitungan pasangan (B, C) per parent; > 0 berarti parent ada di sel
+        chart[:, length - 1, :starts, :] = (found.astype(np.float32) @ rule_to_parent) > 0
+    
+    return chart
+
+def max_batch_size(n, compiled, rule_arrays):
+    """
+    Jumlah kalimat maksimum per fill_batch untuk panjang n, sehingga chart
+    [batch, n, n, N] dan tensor pasangan [batch, n, R] tidak melebihi MAX_BATCH_ELEMENTS.
+    
+    Args:
+        n (int): Panjang kalimat
+        compiled (CompiledGrammar): Grammar terkompilasi
+        rule_arrays (tuple): Hasil build_rule_arrays
+    
+    Returns:
+        int: Ukuran batch (minimal 1)
+    """
+    per_sentence = max(n * n * len(compiled.symbols), n * len(rule_arrays[0]))
+    return max(1, MAX_BATCH_ELEMENTS // per_sentence)
+
+def batch_parse(sentences, compiled=None, start_symbol="K"):
+    """
+    Parsing CYK (rekognisi) untuk banyak kalimat sekaligus.
+    Kalimat dikelompokkan berdasarkan panjang lalu setiap kelompok diisi
+    dengan fill_batch, paling banyak max_batch_size kalimat sekaligus agar
+    memori tetap terbatas. Urutan hasil sama dengan urutan input.
+    
+    Args:
+        sentences (list): List kalimat (list kata) yang sudah divalidasi
+        compiled (CompiledGrammar): Grammar terkompilasi (default: grammar.compiled)
+        start_symbol (str): Start symbol grammar
+    
+    Returns:
+        list: List tuple (is_valid, top_cell) per kalimat; top_cell berupa
+            frozenset non-terminal di sel paling atas
+    """
+    if compiled is None:
+        compiled = grammar.compiled
+    
+    start_id = compiled.symbol_id[start_symbol]
+    rule_arrays = build_rule_arrays(compiled)
+    
+    groups = {}
+    for index, words in enumerate(sentences):
+        groups.setdefault(len(words), []).append(index)
+    
+    results = [None] * len(sentences)
+    for n, indices in groups.items():
+        if n == 0:
+            for index in indices:
+                results[index] = (False, frozenset())
+            continue
+        
+        size = max_batch_size(n, compiled, rule_arrays)
+        for offset in range(0, len(indices), size):
+            part = indices[offset:offset + size]
+            chart = fill_batch([sentences[i] for i in part], compiled, rule_arrays)
+            top = chart[:, n - 1, 0, :]
+            for row, index in enumerate(part):
+                top_cell = frozenset(compiled.symbols[nt] for nt in np.flatnonzero(top[row]))
+                results[index] = (bool(top[row, start_id]), top_cell)
+    
+    return results
@@ -0,0 +1,138 @@
+import time
+
+import grammar
+from backtrace import LazyBackpointer
+from chart import BitsetChart, ChartView
+from cyk_process import full_span_possible, is_valid_sentence, get_parse_result
+
+COMBINE_CACHE_LIMIT = 100000
+
+def combine_cells(left_mask, right_mask, compiled):
+    """
+    Menerapkan semua aturan A -> B C pada dua sel bitmask.
+    Untuk setiap bit B di sel kiri, pasangan kanan yang mungkin dipotong dengan
+    satu operasi AND terhadap partner_masks[B], lalu mask parent di-OR-kan.
+    Hasil di-cache per pasangan mask karena kombinasi sel sangat sering berulang.
+    
+    Args:
+        left_mask (int): Bitmask sel kiri
+        right_mask (int): Bitmask sel kanan
+        compiled (CompiledGrammar): Grammar terkompilasi
+    
+    Returns:
+        int: Bitmask non-terminal parent
+    """
+    cache = compiled.combine_cache
+    key = (left_mask, right_mask)
+    result = cache.get(key)
+    if result is not None:
+        return result
+    
+    result = 0
+    partner_masks = compiled.partner_masks
+    pair_masks = compiled.pair_masks
+    remaining = left_mask
+    while remaining:
+        low = remaining & -remaining
+        remaining ^= low
+        left = low.bit_length() - 1
+        common = right_mask & partner_masks[left]
+        if common:
+            pairs = pair_masks[left]
+            while common:
+                low_right = common & -common
+                common ^= low_right
+                result |= pairs[low_right.bit_length() - 1]
+    
+    if len(cache) >= COMBINE_CACHE_LIMIT:
+        cache.clear()
+    cache[key] = result
+    return result
+
+def fill_chart(words, compiled, prune=False, memo=None, stats=None):
+    """
+    Mengisi chart CYK dengan setiap sel berupa satu integer bitmask.
+    
+    Args:
+        words (list): List kata
+        compiled (CompiledGrammar): Grammar terkompilasi
+        prune (bool): Pruning per posisi span dan early abort (lihat cyk_process.cyk_parse)
+        memo (SpanMemo): Memo sel lintas kalimat (opsional, lihat span_memo.py)
+        stats (ParseStats): Counter instrumentasi (opsional, lihat parse_stats.py)
+    
+    Returns:
+        BitsetChart: Tabel segitiga berisi bitmask (row=length-1, col=posisi awal)
+    """
+    n = len(words)
+    chart = BitsetChart(n, len(compiled.symbols))
+    
+    if memo is not None:
+        memo.bind(compiled)
+        classes = memo.classes(words)
+    
+    lexical_masks = compiled.lexical_masks
+    for col in range(n):
+        cell = lexical_masks.get(words[col], 0)
+        if prune:
+            cell &= compiled.span_mask(col, 1, n)
+        if stats is not None:
+            stats.add_cell(cell)
+        if prune and not cell:
+            return chart
+        chart.set(0, col, cell)
+    
+    for length in range(2, n + 1):
+        row = length - 1
+        for col in range(n - length + 1):
+            if memo is not None:
+                key = memo.key(classes, col, length, n, prune)
+                cell = memo.get(key)
+                if cell is not None:
+                    if stats is not None:
+                        stats.cells_from_memo += 1
+                    chart.set(row, col, cell)
+                    continue
+                start = time.perf_counter_ns()
+            
+            cell = 0
+            for k in range(1, length):
+                left_mask = chart.get(k - 1, col)
+                if not left_mask:
+                    continue
+                right_mask = chart.get(length - k - 1, col + k)
+                if right_mask:
+                    cell |= combine_cells(left_mask, right_mask, compiled)
+            if prune:
+                cell &= compiled.span_mask(col, length, n)
+            if memo is not None:
+                memo.put(key, cell, time.perf_counter_ns() - start)
+            if stats is not None:
+                stats.add_span(chart, length, col, cell, pairwise=False)
+            chart.set(row, col, cell)
+        
+        if prune and length < n and not full_span_possible(chart, length, compiled):
+            break
+    
+    return chart
+
+def cyk_parse(words, compiled=None, prune=False, stats=None):
+    """
+    Engine CYK berbasis bitset dengan kontrak yang sama seperti
+    cyk_process.cyk_parse: mengembalikan (table, backpointer).
+    Backpointer berupa LazyBackpointer: isi sel dihitung dari chart bitmask
+    hanya ketika parse tree direkonstruksi.
+    
+    Args:
+        words (list): List kata yang sudah divalidasi
+        compiled (CompiledGrammar): Grammar terkompilasi (default: grammar.compiled)
+        prune (bool): Pruning per posisi span dan early abort (lihat cyk_process.cyk_parse)
+        stats (ParseStats): Counter instrumentasi (opsional, lihat parse_stats.py)
+    
+    Returns:
+        tuple: (table, backpointer) - Tabel CYK dan backpointer untuk trace
+    """
+    if compiled is None:
+        compiled = grammar.compiled
+    
+    masks = fill_chart(words, compiled, prune=prune, stats=stats)
+    return ChartView(masks, compiled), LazyBackpointer(masks, words, compiled, stats)
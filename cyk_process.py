@@ -1,4 +1,10 @@
+import time
+
 import grammar
+from backtrace import LazyBackpointer
+from chart import BackpointerChart, BitsetChart, ChartView
+
+ENGINES = ("set", "bitset", "earley")
 
 def create_table(n):
     """
@@ -7,7 +13,7 @@ def create_table(n):
     
     Args:
         n (int): Ukuran tabel (jumlah kata dalam kalimat)
-        
+    
     Returns:
         list: Tabel 2D berisi set() kosong
     """
@@ -16,11 +22,12 @@ def create_table(n):
 def create_backpointer_table(n):
     """
     Membuat tabel backpointer untuk menyimpan informasi derivasi.
-    Setiap sel berisi dictionary: {non_terminal: (split_point, left_NT, right_NT)}
+    Setiap sel berisi dictionary:
+    {non_terminal: (split_point, (left_NT, right_NT), left_row, left_col, right_row, right_col)}
     
     Args:
         n (int): Ukuran tabel
-        
+    
     Returns:
         list: Tabel 2D berisi dictionary kosong
     """
@@ -34,7 +41,7 @@ def get_combinations(set_a, set_b):
     Args:
         set_a (set): Set pertama (dari sel kiri dalam tabel CYK)
         set_b (set): Set kedua (dari sel kanan dalam tabel CYK)
-        
+    
     Returns:
         list: List gabungan string dari kedua set
     """
@@ -47,7 +54,40 @@ def get_combinations(set_a, set_b):
             results.append(a + b)
     return results
 
-def cyk_parse(words):
+def full_span_possible(chart, length, compiled):
+    """
+    Memeriksa (pada chart ter-prune) apakah K masih mungkin menurunkan seluruh
+    kalimat setelah semua baris sampai panjang `length` terisi.
+    Derivasi lengkap selalu berbentuk K -> A [0,k) + B [k,n) dengan A anak kiri
+    langsung dan B anak kanan langsung dari K. Sel dengan panjang <= length
+    sudah final, sel yang lebih panjang dianggap masih mungkin terisi; jika
+    pada setiap split point sisi yang sudah final tidak memuat anak K, sel K
+    pasti kosong.
+    
+    Args:
+        chart (BitsetChart): Chart yang terisi sampai baris length-1
+        length (int): Panjang span terbesar yang sudah terisi
+        compiled (CompiledGrammar): Grammar terkompilasi
+    
+    Returns:
+        bool: False jika tidak ada lagi derivasi K untuk seluruh span
+    """
+    n = chart.n
+    if n > 2 * length + 1:
+        # split k = length + 1 belum punya sisi yang final
+        return True
+    
+    top_left = compiled.top_left_mask
+    top_right = compiled.top_right_mask
+    for k in range(1, n):
+        if k <= length and not chart.get(k - 1, 0) & top_left:
+            continue
+        if n - k <= length and not chart.get(n - k - 1, k) & top_right:
+            continue
+        return True
+    return False
+
+def cyk_parse(words, compiled=None, engine="set", prune=False, stats=None):
     """
     Implementasi Algoritma Cocke-Younger-Kasami (CYK) untuk parsing kalimat.
     Menggunakan bottom-up triangular table (X[i,j] dimana i adalah row dari bawah)
@@ -56,30 +96,79 @@ def cyk_parse(words):
     1. Pengisian baris bawah (length=1): Mengisi berdasarkan aturan terminal
     2. Pengisian ke atas (length 2-n): Mengisi berdasarkan aturan branching
     
+    Selama pengisian, sel berisi ID integer non-terminal dan setiap pasangan
+    (left_id, right_id) dicari langsung di tabel aturan biner terkompilasi,
+    tanpa membuat string gabungan. Untuk setiap parent, backpointer menyimpan
+    split point terakhir yang valid dan pasangan pertama (urutan ID) pada split itu.
+    
+    Tabel disimpan sebagai tabel segitiga flat (lihat chart.py): hanya
+    n(n+1)/2 sel, sel berupa bitmask, dan backpointer berupa satu array
+    integer berindeks (sel, non-terminal) tanpa dict per sel (BackpointerChart). Table yang dikembalikan adalah view read-only yang tetap
+    bisa diakses sebagai table[row][col] -> frozenset non-terminal.
+    
     Args:
         words (list): List kata yang sudah divalidasi
-        
+        compiled (CompiledGrammar): Grammar terkompilasi (default: grammar.compiled)
+        engine (str): "set" (default), "bitset" (lihat cyk_bitset.py), atau
+            "earley" (parser Earley atas CFG alami, lihat earley.py)
+        prune (bool): Buang non-terminal yang tidak mungkin menjadi bagian
+            derivasi K pada posisi span tersebut (lihat CompiledGrammar.span_mask),
+            dan hentikan parsing lebih awal jika ada kata yang tidak bisa
+            diturunkan atau K tidak lagi mungkin mencakup seluruh kalimat
+            (lihat full_span_possible).
+            Validitas dan parse tree tetap sama; isi sel lain bisa lebih sedikit.
+        stats (ParseStats): Counter instrumentasi (opsional, lihat parse_stats.py;
+            diabaikan untuk engine earley)
+    
     Returns:
         tuple: (table, backpointer) - Tabel CYK dan backpointer untuk trace
     """
+    if engine not in ENGINES:
+        raise ValueError(f"Engine tidak dikenal: {engine}. Pilihan: {', '.join(ENGINES)}")
+    
+    if engine == "bitset":
+        import cyk_bitset
+        return cyk_bitset.cyk_parse(words, compiled, prune=prune, stats=stats)
+    
+    if engine == "earley":
+        import earley
+        table = earley.recognize(words, compiled)
+        return table, lazy_backpointer(table, words)
+    
+    if compiled is None:
+        compiled = grammar.compiled
+    
     n = len(words)
+    width = len(compiled.symbols)
+    binary_rules = compiled.binary_rules
+    mask_ids = compiled.mask_ids
     
-    table = create_table(n)
-    backpointer = create_backpointer_table(n)
+    chart = BitsetChart(n, width)
+    backpointer = BackpointerChart(chart, words, compiled)
+    codes = backpointer.codes
     
     for col in range(n):
         word = words[col]
-        produces = grammar.check_production([word])
+        cell = compiled.lexical_masks.get(word, 0)
+        if prune:
+            cell &= compiled.span_mask(col, 1, n)
+        if stats is not None:
+            stats.add_cell(cell)
+            stats.backpointer_writes += len(mask_ids(cell))
         
-        if produces:
-            table[0][col] = set(produces)
-            for nt in produces:
-                backpointer[0][col][nt] = ('terminal', word, col)
-
+        if cell:
+            chart.set(0, col, cell)
+        elif prune:
+            return ChartView(chart, compiled), backpointer
+    
     for length in range(2, n + 1):
         row = length - 1
         
         for col in range(n - length + 1):
+            cell = 0
+            base = backpointer.slot(row, col)
+            allowed = compiled.span_mask(col, length, n) if prune else -1
+            
             for k in range(1, length):
                 left_row = k - 1
                 left_col = col
@@ -87,25 +176,166 @@ def cyk_parse(words):
                 right_row = length - k - 1
                 right_col = col + k
                 
-                left_cell = table[left_row][left_col]
-                right_cell = table[right_row][right_col]
+                left_cell = mask_ids(chart.get(left_row, left_col))
+                right_cell = mask_ids(chart.get(right_row, right_col))
                 
-                combinations = get_combinations(left_cell, right_cell)
+                if not left_cell or not right_cell:
+                    continue
                 
-                if combinations:
-                    valid_parents = grammar.check_production(combinations)
-                    if valid_parents:
-                        table[row][col].update(valid_parents)
-                        
-                        for parent in valid_parents:
-                            for combo in combinations:
-                                if combo in grammar.production.get(parent, []):
-                                    backpointer[row][col][parent] = (
-                                        k, combo, left_row, left_col, right_row, right_col
-                                    )
-                                    break
+                found = 0
+                for left in left_cell:
+                    for right in right_cell:
+                        parents = binary_rules.get((left, right))
+                        if not parents:
+                            continue
+                        for parent in parents:
+                            if found >> parent & 1 or not allowed >> parent & 1:
+                                continue
+                            found |= 1 << parent
+                            codes[base + parent] = (k * width + left) * width + right
+                cell |= found
+            
+            if stats is not None:
+                stats.add_span(chart, length, col, cell)
+                stats.backpointer_writes += len(mask_ids(cell))
+            if cell:
+                chart.set(row, col, cell)
+        
+        if prune and length < n and not full_span_possible(chart, length, compiled):
+            break
+    
+    return ChartView(chart, compiled), backpointer
 
-    return table, backpointer
+def fill_chart(words, compiled, prune=False, memo=None, stats=None):
+    """
+    Mengisi tabel CYK tanpa membangun backpointer (mode rekognisi, engine set).
+    Aturan diterapkan per pasangan (left_id, right_id) seperti cyk_parse,
+    tetapi hanya mask parent yang disimpan.
+    
+    Args:
+        words (list): List kata
+        compiled (CompiledGrammar): Grammar terkompilasi
+        prune (bool): Pruning per posisi span dan early abort (lihat cyk_parse)
+        memo (SpanMemo): Memo sel lintas kalimat (opsional, lihat span_memo.py)
+        stats (ParseStats): Counter instrumentasi (opsional, lihat parse_stats.py)
+    
+    Returns:
+        BitsetChart: Tabel segitiga berisi bitmask
+    """
+    n = len(words)
+    mask_ids = compiled.mask_ids
+    pair_masks = compiled.pair_masks
+    chart = BitsetChart(n, len(compiled.symbols))
+    
+    if memo is not None:
+        memo.bind(compiled)
+        classes = memo.classes(words)
+    
+    for col in range(n):
+        cell = compiled.lexical_masks.get(words[col], 0)
+        if prune:
+            cell &= compiled.span_mask(col, 1, n)
+        if stats is not None:
+            stats.add_cell(cell)
+        if prune and not cell:
+            return chart
+        chart.set(0, col, cell)
+    
+    for length in range(2, n + 1):
+        row = length - 1
+        
+        for col in range(n - length + 1):
+            if memo is not None:
+                key = memo.key(classes, col, length, n, prune)
+                cell = memo.get(key)
+                if cell is not None:
+                    if stats is not None:
+                        stats.cells_from_memo += 1
+                    chart.set(row, col, cell)
+                    continue
+                start = time.perf_counter_ns()
+            
+            cell = 0
+            
+            for k in range(1, length):
+                left_cell = mask_ids(chart.get(k - 1, col))
+                right_cell = mask_ids(chart.get(length - k - 1, col + k))
+                
+                if not left_cell or not right_cell:
+                    continue
+                
+                for left in left_cell:
+                    pairs = pair_masks[left]
+                    for right in right_cell:
+                        cell |= pairs.get(right, 0)
+            
+            if prune:
+                cell &= compiled.span_mask(col, length, n)
+            if memo is not None:
+                memo.put(key, cell, time.perf_counter_ns() - start)
+            if stats is not None:
+                stats.add_span(chart, length, col, cell)
+            chart.set(row, col, cell)
+        
+        if prune and length < n and not full_span_possible(chart, length, compiled):
+            break
+    
+    return chart
+
+def recognize(words, compiled=None, engine="set", prune=False, memo=None, stats=None):
+    """
+    Mode rekognisi CYK: hanya mengisi tabel tanpa backpointer.
+    Cukup untuk is_valid_sentence; jika parse tree dibutuhkan, gunakan
+    lazy_backpointer(table, words) yang menghitung derivasi hanya untuk sel
+    yang dilalui rekonstruksi parse tree.
+    
+    Args:
+        words (list): List kata yang sudah divalidasi
+        compiled (CompiledGrammar): Grammar terkompilasi (default: grammar.compiled)
+        engine (str): "set" (default), "bitset", atau "earley"
+        prune (bool): Pruning per posisi span dan early abort (lihat cyk_parse);
+            diabaikan untuk engine earley yang sudah top-down
+        memo (SpanMemo): Memo sel sub-span lintas kalimat (engine set/bitset;
+            diabaikan untuk engine earley)
+        stats (ParseStats): Counter instrumentasi (engine set/bitset, lihat
+            parse_stats.py; diabaikan untuk engine earley)
+    
+    Returns:
+        ChartView: Tabel CYK read-only (table[row][col] -> frozenset non-terminal)
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Engine tidak dikenal: {engine}. Pilihan: {', '.join(ENGINES)}")
+    
+    if engine == "earley":
+        import earley
+        return earley.recognize(words, compiled)
+    
+    if compiled is None:
+        compiled = grammar.compiled
+    
+    if engine == "bitset":
+        import cyk_bitset
+        chart = cyk_bitset.fill_chart(words, compiled, prune=prune, memo=memo, stats=stats)
+    else:
+        chart = fill_chart(words, compiled, prune=prune, memo=memo, stats=stats)
+    
+    return ChartView(chart, compiled)
+
+def lazy_backpointer(table, words, stats=None):
+    """
+    Membuat backpointer lazy dari tabel hasil recognize (atau cyk_parse).
+    Hasilnya bisa langsung dipakai get_sentence_pattern/build_parse_tree dan
+    memilih derivasi yang sama dengan backpointer eager cyk_parse.
+    
+    Args:
+        table (ChartView): Tabel CYK
+        words (list): List kata
+        stats (ParseStats): Counter instrumentasi (backpointer_writes, opsional)
+    
+    Returns:
+        LazyBackpointer: Tabel backpointer yang dihitung per sel saat diakses
+    """
+    return LazyBackpointer(table.chart, words, table.compiled, stats)
 
 def is_valid_sentence(table, n, start_symbol="K"):
     """
@@ -116,7 +346,7 @@ def is_valid_sentence(table, n, start_symbol="K"):
         table (list): Tabel CYK yang sudah terisi (bisa tuple dari cyk_parse)
         n (int): Panjang kalimat (jumlah kata)
         start_symbol (str): Simbol awal grammar (default: "K")
-        
+    
     Returns:
         bool: True jika kalimat valid, False jika tidak
     """
@@ -134,7 +364,7 @@ def get_parse_result(table, n):
     Args:
         table (list): Tabel CYK yang sudah terisi
         n (int): Panjang kalimat
-        
+    
     Returns:
         set: Set non-terminal di sel paling atas
     """
@@ -151,7 +381,7 @@ def build_parse_tree(non_terminal, row, col, backpointer, words):
         col (int): Kolom (posisi kata awal)
         backpointer (list): Tabel backpointer
         words (list): List kata asli
-        
+    
     Returns:
         dict: Parse tree dalam bentuk nested dictionary
     """
@@ -181,29 +411,7 @@ def build_parse_tree(non_terminal, row, col, backpointer, words):
         }
     
     k, combo, left_row, left_col, right_row, right_col = pointer
-    
-    left_candidates = backpointer[left_row][left_col]
-    right_candidates = backpointer[right_row][right_col]
-    
-    left_nt = None
-    right_nt = None
-    
-    for left in left_candidates:
-        for right in right_candidates:
-            if left + right == combo:
-                left_nt = left
-                right_nt = right
-                break
-        if left_nt and right_nt:
-            break
-    
-    if not left_nt or not right_nt:
-        return {
-            'label': non_terminal,
-            'type': 'non-terminal',
-            'production': combo,
-            'span': (start_idx, end_idx)
-        }
+    left_nt, right_nt = combo
     
     return {
         'label': non_terminal,
@@ -223,7 +431,7 @@ def get_sentence_pattern(backpointer, words, start_symbol="K"):
         backpointer (list): Tabel backpointer
         words (list): List kata
         start_symbol (str): Start symbol grammar
-        
+    
     Returns:
         dict: Informasi pola kalimat
     """
@@ -249,7 +457,7 @@ def extract_pattern(node, depth=0):
     Args:
         node (dict): Node dari parse tree
         depth (int): Kedalaman node
-        
+    
     Returns:
         str: Representasi pola
     """
@@ -274,7 +482,7 @@ def get_derivation_steps(node, depth=0):
     Args:
         node (dict): Node dari parse tree
         depth (int): Kedalaman saat ini
-        
+    
     Returns:
         list: List langkah derivasi
     """
@@ -297,6 +505,51 @@ def get_derivation_steps(node, depth=0):
     
     return steps
 
+def analyze_sentence_components(node, words):
+    """
+    Menganalisis komponen kalimat dari parse tree.
+    
+    Args:
+        node (dict): Parse tree node
+        words (list): List kata
+    
+    Returns:
+        dict: Dictionary komponen kalimat
+    """
+    components = {
+        "Frasa Preposisional (P/PP)": [],
+        "Subjek (S)": [],
+        "Pelengkap (Pel)": [],
+        "Keterangan (Ket)": []
+    }
+    
+    def traverse(n, current_label=None):
+        if n is None:
+            return
+        
+        label = n['label']
+        
+        if label in ['P', 'PP']:
+            current_label = "Frasa Preposisional (P/PP)"
+        elif label == 'S' and current_label != "Frasa Preposisional (P/PP)":
+            current_label = "Subjek (S)"
+        elif label == 'Pel':
+            current_label = "Pelengkap (Pel)"
+        elif label == 'Ket':
+            current_label = "Keterangan (Ket)"
+        
+        if n['type'] == 'terminal' and current_label:
+            if n['word'] not in components[current_label]:
+                components[current_label].append(n['word'])
+        
+        if 'left' in n:
+            traverse(n['left'], current_label)
+        if 'right' in n:
+            traverse(n['right'], current_label)
+    
+    traverse(node)
+    return components
+
 def format_parse_tree(node, words, indent=0, prefix=""):
     """
     Format parse tree menjadi string yang mudah dibaca.
@@ -306,7 +559,7 @@ def format_parse_tree(node, words, indent=0, prefix=""):
         words (list): List kata
         indent (int): Level indentasi
         prefix (str): Prefix untuk garis tree
-        
+    
     Returns:
         str: Parse tree dalam format string
     """
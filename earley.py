@@ -0,0 +1,200 @@
+import grammar
+from chart import ChartView
+
+class EarleyGrammar:
+    """
+    CFG alami (grammar.natural_production) yang sudah diindeks untuk Earley.
+    Simbol memakai ID yang sama dengan CompiledGrammar (CNF), sehingga hasil
+    Earley bisa dibaca sebagai tabel CYK untuk backtrace dan pola kalimat.
+    
+    Attributes:
+        rules (list): (lhs_id, rhs_ids) untuk setiap aturan
+        rules_by_lhs (dict): lhs_id -> list indeks aturan
+        preterminal_mask (int): Bitmask simbol pre-terminal
+        derived_rules (dict): parent_id -> list (left_id, right_id) untuk simbol
+            CNF yang tidak ada di CFG alami (helper X1-X4 dan PP)
+    """
+    def __init__(self, compiled, natural_production, preterminals):
+        symbol_id = compiled.symbol_id
+        self.compiled = compiled
+        self.rules = []
+        self.rules_by_lhs = {}
+        for lhs, alternatives in natural_production.items():
+            for rhs in alternatives:
+                self.rules_by_lhs.setdefault(symbol_id[lhs], []).append(len(self.rules))
+                self.rules.append((symbol_id[lhs], tuple(symbol_id[sym] for sym in rhs)))
+        
+        self.preterminal_mask = sum(1 << symbol_id[name] for name in preterminals)
+        
+        natural = set(self.rules_by_lhs) | {symbol_id[name] for name in preterminals}
+        self.derived_rules = {}
+        for (left, right), parents in compiled.binary_rules.items():
+            for parent in parents:
+                if parent not in natural:
+                    self.derived_rules.setdefault(parent, []).append((left, right))
+
+def build_earley_grammar(compiled=None):
+    """
+    Membuat EarleyGrammar dari grammar.natural_production.
+    
+    Args:
+        compiled (CompiledGrammar): Grammar terkompilasi (default: grammar.compiled)
+    
+    Returns:
+        EarleyGrammar: Grammar untuk parser Earley
+    """
+    if compiled is None:
+        compiled = grammar.compiled
+    return EarleyGrammar(compiled, grammar.natural_production, grammar.preterminals)
+
+_grammars = {}
+
+def get_earley_grammar(compiled=None):
+    """
+    EarleyGrammar untuk sebuah CompiledGrammar, dibuat sekali per objek grammar.
+    Hot reload kamus menghasilkan CompiledGrammar baru sehingga EarleyGrammar
+    ikut dibangun ulang.
+    
+    Args:
+        compiled (CompiledGrammar): Grammar terkompilasi (default: grammar.compiled)
+    
+    Returns:
+        EarleyGrammar: Grammar untuk parser Earley
+    """
+    if compiled is None:
+        compiled = grammar.compiled
+    earley_grammar = _grammars.get(id(compiled))
+    if earley_grammar is None or earley_grammar.compiled is not compiled:
+        earley_grammar = build_earley_grammar(compiled)
+        if len(_grammars) >= 8:
+            _grammars.clear()
+        _grammars[id(compiled)] = earley_grammar
+    return earley_grammar
+
+def earley_spans(words, earley_grammar):
+    """
+    Parser Earley atas CFG alami. Item berbentuk (rule, dot, origin); karena
+    grammar tidak punya aturan epsilon, completion cukup melihat item yang
+    menunggu simbol lhs di chart origin. Rekursi kiri (NP_S -> NP_S Det, dst.)
+    ditangani oleh prediksi yang hanya dilakukan sekali per (simbol, posisi).
+    
+    Args:
+        words (list): List kata
+        earley_grammar (EarleyGrammar): Grammar Earley
+    
+    Returns:
+        dict: (start, end) -> bitmask simbol yang lengkap menurunkan words[start:end]
+    """
+    n = len(words)
+    rules = earley_grammar.rules
+    rules_by_lhs = earley_grammar.rules_by_lhs
+    lexical_masks = earley_grammar.compiled.lexical_masks
+    preterminal_mask = earley_grammar.preterminal_mask
+    
+    categories = [lexical_masks.get(word, 0) & preterminal_mask for word in words]
+    spans = {}
+    for i, mask in enumerate(categories):
+        if mask:
+            spans[(i, i + 1)] = mask
+    
+    start_id = earley_grammar.compiled.start_id
+    items = [[] for _ in range(n + 1)]
+    seen = [set() for _ in range(n + 1)]
+    waiting = [{} for _ in range(n + 1)]
+    
+    def add(position, item):
+        if item not in seen[position]:
+            seen[position].add(item)
+            items[position].append(item)
+    
+    for rule in rules_by_lhs.get(start_id, []):
+        add(0, (rule, 0, 0))
+    
+    for i in range(n + 1):
+        predicted = set()
+        agenda = items[i]
+        index = 0
+        while index < len(agenda):
+            rule, dot, origin = agenda[index]
+            index += 1
+            lhs, rhs = rules[rule]
+            
+            if dot == len(rhs):
+                spans[(origin, i)] = spans.get((origin, i), 0) | (1 << lhs)
+                for waiting_rule, waiting_dot, waiting_origin in waiting[origin].get(lhs, ()):
+                    add(i, (waiting_rule, waiting_dot + 1, waiting_origin))
+                continue
+            
+            symbol = rhs[dot]
+            if preterminal_mask >> symbol & 1:
+                if i < n and categories[i] >> symbol & 1:
+                    add(i + 1, (rule, dot + 1, origin))
+                continue
+            
+            waiting[i].setdefault(symbol, []).append((rule, dot, origin))
+            if symbol not in predicted:
+                predicted.add(symbol)
+                for predicted_rule in rules_by_lhs.get(symbol, []):
+                    add(i, (predicted_rule, 0, i))
+    
+    return spans
+
+class EarleyChart:
+    """
+    View tabel CYK (row = length-1, col = posisi awal) atas hasil Earley.
+    Simbol CFG alami dibaca langsung dari span Earley; simbol CNF turunan
+    (X1-X4, PP) dihitung on-demand dari aturan binernya. Karena Earley hanya
+    melengkapi simbol yang diprediksi top-down, sel bisa berisi lebih sedikit
+    simbol daripada tabel CYK, tetapi semua simbol pada derivasi lengkap K
+    selalu ada. Dengan begitu LazyBackpointer, build_forest, dan
+    is_valid_sentence dapat dipakai tanpa perubahan, dan pola kalimat sama
+    dengan cyk_process.get_sentence_pattern.
+    """
+    def __init__(self, n, spans, earley_grammar):
+        self.n = n
+        self.spans = spans
+        self.earley_grammar = earley_grammar
+        self._cells = {}
+    
+    def __len__(self):
+        return self.n
+    
+    def get(self, row, col):
+        key = (row, col)
+        mask = self._cells.get(key)
+        if mask is not None:
+            return mask
+        
+        mask = self.spans.get((col, col + row + 1), 0)
+        for parent, pairs in self.earley_grammar.derived_rules.items():
+            if self._derives(row, col, pairs):
+                mask |= 1 << parent
+        
+        self._cells[key] = mask
+        return mask
+    
+    def _derives(self, row, col, pairs):
+        for k in range(1, row + 1):
+            left_mask = self.get(k - 1, col)
+            if not left_mask:
+                continue
+            right_mask = self.get(row - k, col + k)
+            for left, right in pairs:
+                if left_mask >> left & 1 and right_mask >> right & 1:
+                    return True
+        return False
+
+def recognize(words, compiled=None):
+    """
+    Rekognisi kalimat dengan parser Earley (kontrak sama dengan cyk_process.recognize).
+    
+    Args:
+        words (list): List kata yang sudah divalidasi
+        compiled (CompiledGrammar): Grammar terkompilasi (default: grammar.compiled)
+    
+    Returns:
+        ChartView: Tabel read-only (table[row][col] -> frozenset non-terminal)
+    """
+    earley_grammar = get_earley_grammar(compiled)
+    spans = earley_spans(words, earley_grammar)
+    return ChartView(EarleyChart(len(words), spans, earley_grammar), earley_grammar.compiled)
@@ -1,11 +1,40 @@
+import contextlib
+import io
 import general
+import grammar
+import tokenizer
 import cyk_process
+import parse_cache
+import parse_forest
+import parse_stats
+import span_memo
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import json
 
 class CYKEvaluator:
-    def __init__(self):
+    def __init__(self, engine="set", lexicon=None, cache=None, memo=None, prune=False, instrument=False):
+        self.engine = engine
+        # Kamus/grammar alternatif (general.Lexicon); None = kamus default
+        self.lexicon = lexicon
+        self.compiled = grammar.compile_lexicon(lexicon) if lexicon is not None else None
+        # Cache hasil parsing (ParseCache, opsional). Default tanpa cache agar
+        # parse_time mengukur parsing, bukan lookup LRU: sebagian besar kalimat
+        # dataset berbagi signature kelas kata
+        self.cache = cache
+        # Memo sub-span (SpanMemo, opsional): prefix/suffix yang sama antar
+        # kalimat diisi sekali. Default nonaktif, seperti cache
+        self.memo = memo
+        # Pruning reachability (lihat cyk_process.recognize)
+        self.prune = prune
+        # Counter cache/memo gabungan dari worker (mode paralel)
+        self.shard_stats = []
+        # Counter CYK dan waktu per fase (per test case + total, lihat parse_stats.py);
+        # opsional karena overhead counting ikut terukur di parse_time. Waktu fase
+        # tetap diukur tanpa instrument untuk memisahkan tree_build dari parse_time.
+        self.instrument = instrument
+        self.instrumentation = parse_stats.ParseStats()
         self.results = {
             'total_tests': 0,
             'passed': 0,
@@ -15,6 +44,8 @@ class CYKEvaluator:
             'recall': 0.0,
             'f1_score': 0.0,
             'avg_parse_time': 0.0,
+            'avg_tree_build_time': 0.0,
+            'ambiguous': 0,
             'test_cases': []
         }
         
@@ -63,7 +94,7 @@ class CYKEvaluator:
             
             print(f"Loaded {len(test_cases)} test cases")
             return test_cases
-            
+        
         except FileNotFoundError:
             print(f"Error: File {filename} not found!")
             return []
@@ -75,7 +106,7 @@ class CYKEvaluator:
         """Normalize pattern untuk perbandingan"""
         if not pattern:
             return None
-
+        
         pattern = pattern.replace('→', '').replace('->', '')
         pattern = ' '.join(pattern.split())
         return pattern.strip()
@@ -105,13 +136,32 @@ class CYKEvaluator:
         return pattern
     
     def test_sentence(self, sentence, expected_valid, expected_pattern=None, category="General"):
-        words = sentence.lower().split()
+        result = self.evaluate_case(sentence, expected_valid, expected_pattern, category)
+        self._update_metrics(result)
+        return result
+    
+    def evaluate_case(self, sentence, expected_valid, expected_pattern=None, category="General"):
+        """
+        Menguji satu kalimat tanpa mengubah metrics (dipakai test_sentence dan
+        worker evaluasi paralel).
         
-        start_time = time.time()
-        is_known, unknown_words = general.check_alphabet(words)
+        parse_time_ns mencakup cek kamus dan pengisian chart (recognition), sama
+        seperti baseline yang berhenti sebelum get_sentence_pattern. Waktu membangun
+        parse tree dicatat terpisah di tree_build_time_ns.
+        
+        Returns:
+            dict: Hasil test case
+        """
+        stats = parse_stats.ParseStats(count_work=self.instrument)
+        with stats.phase("tokenize"):
+            words = tokenizer.tokenize(sentence, self.lexicon)
+        
+        start_time = time.perf_counter_ns()
+        with stats.phase("lexicon_check"):
+            is_known, unknown_words = general.check_alphabet(words, self.lexicon)
         
         if not is_known:
-            parse_time = time.time() - start_time
+            parse_time_ns = time.perf_counter_ns() - start_time
             result = {
                 'sentence': sentence,
                 'expected': expected_valid,
@@ -123,35 +173,44 @@ class CYKEvaluator:
                 'correct': not expected_valid,
                 'pattern_match': expected_pattern is None,
                 'failure_reason': f"Unknown words: {', '.join(unknown_words)}",
-                'parse_time': parse_time,
+                'parse_time': parse_time_ns / 1e9,
+                'parse_time_ns': parse_time_ns,
+                'tree_build_time_ns': 0,
                 'error': f"Unknown words: {', '.join(unknown_words)}",
                 'category': category,
                 'words': words,
-                'parse_tree': None
+                'parse_tree': None,
+                'instrumentation': stats.as_dict() if self.instrument else None
             }
-            self._update_metrics(result)
             return result
         
         try:
-            table, backpointer = cyk_process.cyk_parse(words)
+            table, pattern_info = parse_cache.parse(
+                words, self.compiled, engine=self.engine, prune=self.prune, cache=self.cache, memo=self.memo, stats=stats
+            )
             n = len(words)
             is_valid = cyk_process.is_valid_sentence(table, n, "K")
-            parse_time = time.time() - start_time
+            tree_build_time_ns = stats.phase_ns['tree_build']
+            parse_time_ns = time.perf_counter_ns() - start_time - tree_build_time_ns
             
             parse_tree = None
             actual_pattern = None
             actual_components = None
+            derivation_count = 0
             
             if is_valid:
-                pattern_info = cyk_process.get_sentence_pattern(backpointer, words, "K")
                 if pattern_info:
-                    parse_tree = cyk_process.format_parse_tree(
-                        pattern_info['parse_tree'], 
-                        words, 
-                        prefix=""
-                    )
+                    with stats.phase("render"):
+                        parse_tree = cyk_process.format_parse_tree(
+                            pattern_info['parse_tree'], 
+                            words, 
+                            prefix=""
+                        )
                     actual_pattern = pattern_info['pattern']
                     actual_components = self.extract_components(actual_pattern)
+                
+                forest = parse_forest.build_forest(table, words, "K")
+                derivation_count = forest.count_derivations()
             
             pattern_match = True
             failure_reason = None
@@ -182,19 +241,23 @@ class CYKEvaluator:
                 'correct': final_correct,
                 'pattern_match': pattern_match,
                 'failure_reason': failure_reason,
-                'parse_time': parse_time,
+                'parse_time': parse_time_ns / 1e9,
+                'parse_time_ns': parse_time_ns,
+                'tree_build_time_ns': tree_build_time_ns,
                 'error': None,
                 'category': category,
                 'words': words,
                 'parse_tree': parse_tree,
-                'final_cell': str(cyk_process.get_parse_result(table, n))
+                'derivation_count': derivation_count,
+                'final_cell': ", ".join(sorted(cyk_process.get_parse_result(table, n))),
+                'instrumentation': stats.as_dict() if self.instrument else None
             }
             
-            self._update_metrics(result)
             return result
-            
+        
         except Exception as e:
-            parse_time = time.time() - start_time
+            tree_build_time_ns = stats.phase_ns['tree_build']
+            parse_time_ns = time.perf_counter_ns() - start_time - tree_build_time_ns
             result = {
                 'sentence': sentence,
                 'expected': expected_valid,
@@ -206,18 +269,69 @@ class CYKEvaluator:
                 'correct': not expected_valid,
                 'pattern_match': expected_pattern is None,
                 'failure_reason': f"Exception: {str(e)}",
-                'parse_time': parse_time,
+                'parse_time': parse_time_ns / 1e9,
+                'parse_time_ns': parse_time_ns,
+                'tree_build_time_ns': tree_build_time_ns,
                 'error': str(e),
                 'category': category,
                 'words': words,
-                'parse_tree': None
+                'parse_tree': None,
+                'instrumentation': stats.as_dict() if self.instrument else None
             }
-            self._update_metrics(result)
             return result
     
+    def run_parallel(self, test_cases, workers):
+        """
+        Menguji semua test case di process pool. Test case dibagi menjadi
+        shard berurutan (satu per worker); setiap worker memuat grammar sekali
+        saat start. Hasil digabung sesuai urutan dataset lalu metrics diisi
+        dengan _update_metrics seperti mode sekuensial, sehingga confusion
+        matrix, category_stats, pattern_stats, dan urutan report identik.
+        
+        Args:
+            test_cases (list): Hasil load_dataset
+            workers (int): Jumlah proses
+        
+        Returns:
+            list: Hasil per test case sesuai urutan input
+        """
+        shard_size = max(1, -(-len(test_cases) // workers))
+        shards = [test_cases[i:i + shard_size] for i in range(0, len(test_cases), shard_size)]
+        
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(
+                self.engine, self.lexicon, self.instrument, self.cache is not None, self.memo is not None, self.prune
+            )
+        ) as executor:
+            outputs = list(executor.map(_evaluate_shard, shards))
+        
+        results = []
+        for shard_results, shard_stats in outputs:
+            results.extend(shard_results)
+            self.shard_stats.append(shard_stats)
+        for result in results:
+            self._update_metrics(result)
+        return results
+    
+    def stats(self):
+        """
+        Counter parse cache dan span memo (digabung dari semua worker pada mode paralel).
+        
+        Returns:
+            dict: {'parse_cache': ..., 'span_memo': ...}
+        """
+        if self.shard_stats:
+            return merge_stats(self.shard_stats)
+        return {
+            'parse_cache': self.cache.stats() if self.cache is not None else None,
+            'span_memo': self.memo.stats() if self.memo is not None else None
+        }
+    
     def _update_metrics(self, result):
         self.results['total_tests'] += 1
         self.results['test_cases'].append(result)
+        if result.get('instrumentation'):
+            self.instrumentation.merge(result['instrumentation'])
         
         if result['correct']:
             self.results['passed'] += 1
@@ -303,8 +417,14 @@ class CYKEvaluator:
             else:
                 self.results['f1_score'] = 0
             
-            total_time = sum(tc['parse_time'] for tc in self.results['test_cases'])
-            self.results['avg_parse_time'] = total_time / total
+            self.results['ambiguous'] = sum(
+                1 for tc in self.results['test_cases'] if tc.get('derivation_count', 0) > 1
+            )
+            
+            total_time_ns = sum(tc['parse_time_ns'] for tc in self.results['test_cases'])
+            self.results['avg_parse_time'] = total_time_ns / total / 1e9
+            tree_build_ns = sum(tc.get('tree_build_time_ns', 0) for tc in self.results['test_cases'])
+            self.results['avg_tree_build_time'] = tree_build_ns / total / 1e9
     
     def print_summary(self):
         print("\n" + "="*70)
@@ -334,8 +454,31 @@ class CYKEvaluator:
         print(f"F1 Score:  {self.results['f1_score']:.2f}%")
         
         print(f"\nPerformance Metrics:")
-        print(f"Average Parse Time: {self.results['avg_parse_time']*1000:.2f}ms")
-        print(f"Total Processing Time: {sum(tc['parse_time'] for tc in self.results['test_cases']):.2f}s")
+        print(f"Average Parse Time: {self.results['avg_parse_time']*1000:.2f}ms (cek kamus + chart)")
+        print(f"Average Tree Build Time: {self.results['avg_tree_build_time']*1000:.2f}ms")
+        print(f"Ambiguous Sentences (>1 derivasi): {self.results['ambiguous']}")
+        print(f"Total Processing Time: {sum(tc['parse_time_ns'] for tc in self.results['test_cases'])/1e6:.2f}ms")
+        if self.results.get('wall_time') is not None:
+            print(f"Wall Time: {self.results['wall_time']:.3f}s ({self.results.get('workers', 1)} worker)")
+        cache_stats = self.stats()['parse_cache']
+        if cache_stats is not None:
+            print(f"Parse Cache: {cache_stats['hits']} hit / {cache_stats['misses']} miss ({cache_stats['hit_rate']*100:.1f}%)"
+                  " - parse time termasuk hit cache")
+        memo_stats = self.stats()['span_memo']
+        if memo_stats is not None:
+            print(f"Span Memo: {memo_stats['hits']} hit / {memo_stats['misses']} miss ({memo_stats['hit_rate']*100:.1f}%), "
+                  f"hemat ~{memo_stats['saved_ms']:.2f}ms")
+        
+        if self.instrument:
+            counters = self.instrumentation.as_dict()['counters']
+            mean_cell, max_cell = self.instrumentation.nonterminals_per_cell()
+            print(f"\nInstrumentasi CYK (total):")
+            for name, value in counters.items():
+                print(f"  {name:<20} {value:>10}")
+            print(f"  {'non-terminal/sel':<20} {mean_cell:>10.2f} (maks {max_cell})")
+            print(f"Waktu per fase:")
+            for name, elapsed in self.instrumentation.phase_ns.items():
+                print(f"  {name:<20} {elapsed/1e6:>10.2f}ms")
         
         if self.pattern_stats:
             print(f"\nPattern Accuracy (by Components):")
@@ -408,10 +551,32 @@ class CYKEvaluator:
             print(f"   Parser Result: {'VALID' if tc['actual'] else 'INVALID'}")
             print(f"   Final Result:  ❌ FAILED (component mismatch)")
     
+    def instrumentation_report(self):
+        """
+        Total instrumentasi semua test case untuk report (None jika nonaktif).
+        
+        Returns:
+            dict: counters, cell_sizes, phase_ns, nonterminals_per_cell
+        """
+        if not self.instrument:
+            return None
+        mean_cell, max_cell = self.instrumentation.nonterminals_per_cell()
+        return dict(
+            self.instrumentation.as_dict(),
+            nonterminals_per_cell={'mean': mean_cell, 'max': max_cell}
+        )
+    
     def save_report(self, filename="evaluation_report.json"):
         report = {
             'timestamp': datetime.now().isoformat(),
             'evaluation_mode': 'component_pattern_validation',
+            'engine': self.engine,
+            'options': {
+                'cache': self.cache is not None,
+                'memo': self.memo is not None,
+                'prune': self.prune,
+                'instrument': self.instrument
+            },
             'note': 'Pattern validation checks COMPONENTS only (e.g., P S not K → P S)',
             'summary': {
                 'total_tests': self.results['total_tests'],
@@ -421,7 +586,11 @@ class CYKEvaluator:
                 'precision': self.results['precision'],
                 'recall': self.results['recall'],
                 'f1_score': self.results['f1_score'],
-                'avg_parse_time': self.results['avg_parse_time']
+                'avg_parse_time': self.results['avg_parse_time'],
+                'avg_tree_build_time': self.results['avg_tree_build_time'],
+                'ambiguous': self.results['ambiguous'],
+                'wall_time': self.results.get('wall_time'),
+                'workers': self.results.get('workers', 1)
             },
             'confusion_matrix': {
                 'true_positive': self.true_positive,
@@ -429,6 +598,9 @@ class CYKEvaluator:
                 'false_positive': self.false_positive,
                 'false_negative': self.false_negative
             },
+            'parse_cache': self.stats()['parse_cache'],
+            'span_memo': self.stats()['span_memo'],
+            'instrumentation': self.instrumentation_report(),
             'pattern_stats': self.pattern_stats,
             'category_stats': self.category_stats,
             'test_cases': [
@@ -444,8 +616,12 @@ class CYKEvaluator:
                     'pattern_match': tc.get('pattern_match'),
                     'failure_reason': tc.get('failure_reason'),
                     'parse_time': tc['parse_time'],
+                    'parse_time_ns': tc['parse_time_ns'],
+                    'tree_build_time_ns': tc.get('tree_build_time_ns', 0),
                     'category': tc['category'],
-                    'error': tc['error']
+                    'error': tc['error'],
+                    'derivation_count': tc.get('derivation_count', 0),
+                    'instrumentation': tc.get('instrumentation')
                 }
                 for tc in self.results['test_cases']
             ]
@@ -457,13 +633,85 @@ class CYKEvaluator:
         print(f"\nReport saved to: {filename}")
 
 
-def run_evaluation(dataset_file="evaluation_dataset/evaluation_dataset.txt"):
-    evaluator = CYKEvaluator()
+# Evaluator per proses worker (diisi _init_worker)
+_worker_evaluator = None
+
+def _init_worker(engine, lexicon, instrument=False, cache=False, memo=False, prune=False):
+    global _worker_evaluator
+    _worker_evaluator = CYKEvaluator(
+        engine=engine, lexicon=lexicon, cache=parse_cache.ParseCache() if cache else None,
+        memo=span_memo.SpanMemo() if memo else None, prune=prune, instrument=instrument
+    )
+    if _worker_evaluator.compiled is None:
+        _worker_evaluator.compiled = grammar.compiled
+
+def _evaluate_shard(shard):
+    evaluator = _worker_evaluator
+    # Cache dan memo baru per shard agar counter bisa dijumlahkan di parent
+    if evaluator.cache is not None:
+        evaluator.cache = parse_cache.ParseCache()
+    if evaluator.memo is not None:
+        evaluator.memo = span_memo.SpanMemo()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = [
+            evaluator.evaluate_case(tc['sentence'], tc['expected'], tc.get('expected_pattern'), tc['category'])
+            for tc in shard
+        ]
+    return results, evaluator.stats()
+
+def merge_stats(stats_list):
+    """
+    Menjumlahkan counter stats (dict bersarang) dari beberapa worker;
+    hit_rate dihitung ulang dari hits dan misses gabungan.
+    
+    Args:
+        stats_list (list): List dict stats dengan struktur yang sama
+    
+    Returns:
+        dict: Stats gabungan
+    """
+    merged = {}
+    for stats in stats_list:
+        for key, value in stats.items():
+            if value is None:
+                # Fitur nonaktif (mis. parse cache)
+                merged.setdefault(key, None)
+            elif isinstance(value, dict):
+                merged[key] = merge_stats([merged.get(key) or {}, value])
+            elif key != 'hit_rate':
+                merged[key] = merged.get(key, 0) + value
+    if 'hits' in merged and 'misses' in merged:
+        lookups = merged['hits'] + merged['misses']
+        merged['hit_rate'] = merged['hits'] / lookups if lookups else 0.0
+    return merged
+
+def print_case_result(idx, total, result):
+    print(f"\n[{idx}/{total}] Testing: {result['sentence']}")
+    
+    status = "✅ PASS" if result['correct'] else "❌ FAIL"
+    expected_str = "VALID" if result['expected'] else "INVALID"
+    actual_str = "VALID" if result['actual'] else "INVALID"
+    print(f"   {status}: Expected={expected_str}, Actual={actual_str}")
+    
+    if result.get('expected_components'):
+        if result['pattern_match']:
+            print(f"   Components ✅: {result['expected_components']}")
+        else:
+            print(f"   Components ❌: Expected='{result['expected_components']}', Got='{result.get('actual_components', 'None')}'")
+    elif result.get('actual_components'):
+        print(f"   Components: {result['actual_components']}")
+
+def run_evaluation(dataset_file="evaluation_dataset/evaluation_dataset.txt", engine="set", workers=1, instrument=False,
+                   cache=False, memo=False, prune=False):
+    evaluator = CYKEvaluator(
+        engine=engine, cache=parse_cache.ParseCache() if cache else None,
+        memo=span_memo.SpanMemo() if memo else None, prune=prune, instrument=instrument
+    )
     
     print("\n" + "="*70)
     print("SEKEN App - Evaluation (Component Pattern Validation)")
     print("Sistem Parsing Kalimat Bahasa Bali Berpredikat Frasa Presisi")
-    print("dengan algoritma CYK")
+    print(f"dengan algoritma CYK (engine: {engine})")
     print("="*70)
     
     test_cases = evaluator.load_dataset(dataset_file)
@@ -475,28 +723,22 @@ def run_evaluation(dataset_file="evaluation_dataset/evaluation_dataset.txt"):
     print(f"\nRunning {len(test_cases)} test cases...")
     print("-" * 70)
     
-    for idx, tc in enumerate(test_cases, 1):
-        print(f"\n[{idx}/{len(test_cases)}] Testing: {tc['sentence']}")
-        
-        result = evaluator.test_sentence(
-            sentence=tc['sentence'],
-            expected_valid=tc['expected'],
-            expected_pattern=tc.get('expected_pattern'),
-            category=tc['category']
-        )
-        
-        status = "✅ PASS" if result['correct'] else "❌ FAIL"
-        expected_str = "VALID" if result['expected'] else "INVALID"
-        actual_str = "VALID" if result['actual'] else "INVALID"
-        print(f"   {status}: Expected={expected_str}, Actual={actual_str}")
-        
-        if result.get('expected_components'):
-            if result['pattern_match']:
-                print(f"   Components ✅: {result['expected_components']}")
-            else:
-                print(f"   Components ❌: Expected='{result['expected_components']}', Got='{result.get('actual_components', 'None')}'")
-        elif result.get('actual_components'):
-            print(f"   Components: {result['actual_components']}")
+    start = time.perf_counter_ns()
+    if workers > 1:
+        results = evaluator.run_parallel(test_cases, workers)
+        for idx, result in enumerate(results, 1):
+            print_case_result(idx, len(test_cases), result)
+    else:
+        for idx, tc in enumerate(test_cases, 1):
+            result = evaluator.test_sentence(
+                sentence=tc['sentence'],
+                expected_valid=tc['expected'],
+                expected_pattern=tc.get('expected_pattern'),
+                category=tc['category']
+            )
+            print_case_result(idx, len(test_cases), result)
+    evaluator.results['wall_time'] = (time.perf_counter_ns() - start) / 1e9
+    evaluator.results['workers'] = workers
     
     evaluator.calculate_final_metrics()
     evaluator.print_summary()
@@ -511,11 +753,39 @@ if __name__ == "__main__":
     import sys
     
     dataset_file = "evaluation_dataset/evaluation_dataset.txt"
+    engine = "set"
+    
+    args = sys.argv[1:]
+    workers = 1
+    instrument = False
+    cache = False
+    memo = False
+    prune = False
+    for arg in list(args):
+        if arg.startswith("--engine="):
+            engine = arg.split("=", 1)[1]
+            args.remove(arg)
+        elif arg.startswith("--workers="):
+            workers = int(arg.split("=", 1)[1])
+            args.remove(arg)
+        elif arg == "--instrument":
+            instrument = True
+            args.remove(arg)
+        elif arg == "--cache":
+            cache = True
+            args.remove(arg)
+        elif arg == "--memo":
+            memo = True
+            args.remove(arg)
+        elif arg == "--prune":
+            prune = True
+            args.remove(arg)
     
-    if len(sys.argv) > 1:
-        dataset_file = sys.argv[1]
+    if args:
+        dataset_file = args[0]
     
-    evaluator = run_evaluation(dataset_file)
+    evaluator = run_evaluation(dataset_file, engine=engine, workers=workers, instrument=instrument, cache=cache,
+                               memo=memo, prune=prune)
     
     print("\n" + "="*70)
     print("EVALUATION COMPLETED")
@@ -1,66 +1,319 @@
 import os
+import threading
 
-def load_words(filename):
+ALPHABET_DIR = "alphabets"
+
+# Kategori kamus: nama kategori (= nama file di alphabets/ tanpa .txt),
+# urutannya sama dengan urutan alphabet
+CATEGORIES = (
+    "noun", "propnoun", "pronoun", "prep", "adj",
+    "det", "num", "adv", "verb", "nountime"
+)
+
+# Nama variabel modul lama -> kategori
+LEGACY_NAMES = {
+    "kata_benda": "noun",
+    "proper_noun": "propnoun",
+    "kata_ganti": "pronoun",
+    "kata_preposisi": "prep",
+    "kata_sifat": "adj",
+    "determinan": "det",
+    "numeralia": "num",
+    "adverbia": "adv",
+    "verb": "verb",
+    "kata_benda_waktu": "nountime"
+}
+
+def load_words(filename, alphabet_dir=ALPHABET_DIR):
     """Membaca file txt dari folder alphabets dan mengembalikan list kata"""
     try:
-        filepath = os.path.join("alphabets", filename)
+        filepath = os.path.join(alphabet_dir, filename)
         
         with open(filepath, "r", encoding="utf-8") as file:
             content = file.read().split("\n")
-            clean_content = [word.strip() for word in content if word.strip()]
+            # Entri multi-kata (mis. "gusti ngurah") dinormalisasi ke satu spasi
+            clean_content = [" ".join(word.split()) for word in content if word.strip()]
             return clean_content
-            
+    
     except FileNotFoundError:
         print(f"Warning: File {filename} tidak ditemukan.")
         return []
 
-print("Sedang memuat kamus kata...")
-kata_benda         = load_words("noun.txt")
-proper_noun        = load_words("propnoun.txt")
-kata_ganti         = load_words("pronoun.txt")
-kata_preposisi     = load_words("prep.txt")
-kata_sifat         = load_words("adj.txt")
-determinan         = load_words("det.txt")
-numeralia          = load_words("num.txt")
-adverbia           = load_words("adv.txt")
-verb               = load_words("verb.txt")
-kata_benda_waktu   = load_words("nountime.txt")
+class Lexicon:
+    """
+    Kamus kata per kategori. Tidak ada I/O saat dibuat: setiap kategori baru
+    dibaca dari file saat pertama kali dipakai, lalu disimpan sebagai tuple
+    (urutan file) dan frozenset (cek keanggotaan).
+    
+    Bisa dibuat dari folder kamus lain atau langsung dari dictionary kata
+    (mis. untuk tools atau grammar eksperimen), lalu di-inject ke
+    grammar.compile_lexicon dan CYKEvaluator.
+    
+    Contoh:
+        lexicon = Lexicon()
+        "pura" in lexicon.category("noun")
+        custom = Lexicon(words={"noun": ["pura"], "prep": ["ring"]})
+    """
+    def __init__(self, alphabet_dir=ALPHABET_DIR, categories=None, words=None):
+        if words is not None:
+            self.alphabet_dir = None
+            self.categories = tuple(categories or words)
+            self._words = {name: tuple(words.get(name, ())) for name in self.categories}
+        else:
+            self.alphabet_dir = alphabet_dir
+            self.categories = tuple(categories or CATEGORIES)
+            self._words = {}
+        self._sets = {}
+        self._stats = {}
+        self._alphabet = None
+        self._index = None
+        # Naik setiap kali isi kamus berubah lewat reload_changed()
+        self.version = 0
+    
+    @property
+    def source(self):
+        """Identitas sumber kamus (path folder), None untuk kamus in-memory."""
+        if self.alphabet_dir is None:
+            return None
+        return os.path.abspath(self.alphabet_dir)
+    
+    def words(self, name):
+        """
+        Daftar kata satu kategori sesuai urutan di file (dimuat saat pertama dipakai).
+        
+        Args:
+            name (str): Nama kategori (mis. "noun")
+        
+        Returns:
+            tuple: Kata-kata kategori tersebut
+        """
+        words = self._words.get(name)
+        if words is None:
+            if name not in self.categories:
+                raise KeyError(f"Kategori kamus tidak dikenal: {name}")
+            self._stats[name] = self._file_stat(name)
+            words = tuple(load_words(f"{name}.txt", self.alphabet_dir))
+            self._words[name] = words
+        return words
+    
+    def _file_stat(self, name):
+        try:
+            stat = os.stat(os.path.join(self.alphabet_dir, f"{name}.txt"))
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def modified_categories(self):
+        """
+        Kategori yang sudah dimuat dan file-nya berubah (mtime/ukuran) sejak dibaca.
+        Hanya memanggil os.stat, tidak membaca isi file.
+        
+        Returns:
+            list: Nama kategori
+        """
+        if self.alphabet_dir is None:
+            return []
+        return [
+            name for name, stat in list(self._stats.items())
+            if self._file_stat(name) != stat
+        ]
+    
+    def reload_changed(self):
+        """
+        Membaca ulang kategori yang file-nya berubah dan mengembalikan Lexicon
+        BARU; objek lama tidak diubah sehingga pembaca yang masih memegangnya
+        tetap konsisten. Kategori yang tidak berubah dipakai bersama, dan index
+        kata -> kategori hanya diperbarui untuk kata di kategori yang berubah.
+        File yang hanya di-touch (isi sama) tidak menaikkan version.
+        
+        Returns:
+            tuple: (lexicon, changed) - Lexicon baru (atau self jika tidak ada
+                file yang berubah) dan list kategori yang isinya berubah
+        """
+        modified = self.modified_categories()
+        if not modified:
+            return self, []
+        
+        lexicon = Lexicon(self.alphabet_dir, self.categories)
+        lexicon._words = {name: words for name, words in self._words.items() if name not in modified}
+        lexicon._stats = {name: stat for name, stat in self._stats.items() if name not in modified}
+        changed = [name for name in modified if lexicon.words(name) != self._words[name]]
+        
+        lexicon._sets = {name: members for name, members in self._sets.items() if name not in changed}
+        lexicon.version = self.version + 1 if changed else self.version
+        if not changed:
+            lexicon._alphabet = self._alphabet
+            lexicon._index = self._index
+            return lexicon, changed
+        
+        if self._index is not None:
+            index = dict(self._index)
+            for word in self.affected_words(lexicon, changed):
+                names = frozenset(
+                    name for name in self.categories if word in lexicon.category(name)
+                )
+                if names:
+                    index[word] = names
+                else:
+                    index.pop(word, None)
+            lexicon._index = index
+        return lexicon, changed
+    
+    def affected_words(self, other, changed):
+        """
+        Kata yang keanggotaannya mungkin berbeda antara kamus ini dan `other`
+        (semua kata lama dan baru dari kategori yang berubah).
+        
+        Args:
+            other (Lexicon): Kamus versi lain
+            changed (list): Kategori yang berubah
+        
+        Returns:
+            set: Kata yang terdampak
+        """
+        affected = set()
+        for name in changed:
+            affected.update(self.words(name))
+            affected.update(other.words(name))
+        return affected
+    
+    def category(self, name):
+        """
+        Himpunan kata satu kategori.
+        
+        Args:
+            name (str): Nama kategori
+        
+        Returns:
+            frozenset: Kata-kata kategori tersebut
+        """
+        members = self._sets.get(name)
+        if members is None:
+            members = frozenset(self.words(name))
+            self._sets[name] = members
+        return members
+    
+    @property
+    def alphabet(self):
+        """frozenset semua kata dari semua kategori."""
+        if self._alphabet is None:
+            self._alphabet = frozenset().union(*(self.category(name) for name in self.categories))
+        return self._alphabet
+    
+    def word_categories(self, word):
+        """
+        Kategori kamus yang memuat sebuah kata.
+        
+        Args:
+            word (str): Kata
+        
+        Returns:
+            frozenset: Nama kategori (kosong jika kata tidak dikenal)
+        """
+        if self._index is None:
+            index = {}
+            for name in self.categories:
+                for item in self.words(name):
+                    index.setdefault(item, set()).add(name)
+            self._index = {item: frozenset(names) for item, names in index.items()}
+        return self._index.get(word, frozenset())
+    
+    def __contains__(self, word):
+        return word in self.alphabet
+    
+    def __len__(self):
+        return sum(len(self.words(name)) for name in self.categories)
+    
+    def unknown_words(self, input_array):
+        """
+        Kata dalam input_array yang tidak ada di kamus (dibandingkan lowercase).
+        
+        Args:
+            input_array (list): Array kata
+        
+        Returns:
+            list: Kata yang tidak dikenali, sesuai urutan input
+        """
+        alphabet = self.alphabet
+        return [kata for kata in input_array if kata.lower() not in alphabet]
+
+class Snapshot:
+    """
+    Kamus default beserta grammar yang dikompilasi dari kamus tersebut.
+    
+    general.default_lexicon dan grammar.compiled (serta atribut grammar
+    lainnya) sama-sama dibaca dari `general.snapshot`. Hot reload menyusun
+    pasangan baru lebih dulu lalu memasangnya dengan satu assignment
+    (publish), sehingga pembaca tidak pernah melihat grammar baru dengan
+    kamus lama atau sebaliknya.
+    
+    Attributes:
+        lexicon (Lexicon): Kamus
+        grammar (dict): Atribut grammar untuk kamus ini (lihat
+            grammar.grammar_attributes); None jika belum dimuat
+    """
+    __slots__ = ('lexicon', 'grammar')
+    
+    def __init__(self, lexicon, grammar=None):
+        self.lexicon = lexicon
+        self.grammar = grammar
+
+snapshot = Snapshot(Lexicon())
 
-alphabet = (
-    kata_benda + 
-    proper_noun + 
-    kata_ganti + 
-    kata_preposisi + 
-    kata_sifat + 
-    determinan + 
-    numeralia + 
-    adverbia + 
-    verb +
-    kata_benda_waktu
-)
+# Hanya penulis snapshot yang memakai lock; pembaca cukup membaca general.snapshot
+_publish_lock = threading.Lock()
 
-print(f"Berhasil memuat {len(alphabet)} kata ke dalam alphabet.")
+def publish(new_snapshot, expected=None):
+    """
+    Memasang snapshot kamus + grammar baru.
+    
+    Args:
+        new_snapshot (Snapshot): Snapshot baru
+        expected (Snapshot): Jika diberikan, snapshot hanya dipasang bila
+            snapshot aktif masih objek ini (compare-and-set)
+    
+    Returns:
+        bool: True jika snapshot dipasang
+    """
+    global snapshot
+    with _publish_lock:
+        if expected is not None and snapshot is not expected:
+            return False
+        snapshot = new_snapshot
+        return True
+
+def __getattr__(name):
+    if name == "default_lexicon":
+        return snapshot.lexicon
+    # Variabel modul lama (kata_benda, alphabet, ...) tetap tersedia,
+    # tetapi baru dibaca dari file saat diakses
+    lexicon = snapshot.lexicon
+    if name in LEGACY_NAMES:
+        return list(lexicon.words(LEGACY_NAMES[name]))
+    if name == "alphabet":
+        return [word for category in CATEGORIES for word in lexicon.words(category)]
+    if name == "alphabet_set":
+        return lexicon.alphabet
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-def check_alphabet(input_array):
+def check_alphabet(input_array, lexicon=None):
     """
     Mengecek apakah setiap kata dalam input_array ada di dalam alphabet.
     Mengembalikan tuple: (is_known: bool, unknown_words: list)
     
     Args:
         input_array (list): Array kata yang akan dicek
+        lexicon (Lexicon): Kamus yang dipakai (default: default_lexicon)
     
     Returns:
         tuple: (bool, list) - (True jika semua kata dikenali, list kata yang tidak dikenali)
     """
-    unknown_words = []
-    
-    for kata in input_array:
-        # Cek
-        if kata.lower() not in alphabet:
-            unknown_words.append(kata)
+    if lexicon is None:
+        lexicon = snapshot.lexicon
+    unknown_words = lexicon.unknown_words(input_array)
     
     if unknown_words:
         print(f"Error: Kata tidak ditemukan dalam kamus: {', '.join(unknown_words)}")
         return False, unknown_words
     
-    return True, []
\ No newline at end of file
+    return True, []
@@ -0,0 +1,464 @@
+"""
+Generator kalimat dari grammar untuk load test dan fuzz test.
+
+Kalimat VALID di-sample seragam atas derivasi dengan panjang tertentu:
+counts[A][L] = jumlah derivasi non-terminal A yang menghasilkan tepat L
+token (dihitung sekali dengan DP atas grammar CNF), lalu setiap aturan dan
+split point dipilih dengan bobot jumlah derivasinya. Kalimat INVALID dibuat
+dengan perturbasi terkontrol (tukar, hapus, atau ganti kata dengan kategori
+lain) atas kalimat VALID.
+
+Kalimat VALID valid karena konstruksinya, dan polanya diambil dari aturan
+start symbol yang di-sample, tanpa parsing. Parser hanya dipakai jika
+tokenizer menggabung token hasil generator (mis. "i" + "wayan" -> "i wayan"),
+untuk label kalimat INVALID hasil perturbasi, dan jika parser_patterns=True.
+Grammar ini ambigu: untuk sebagian kalimat parser memilih derivasi lain
+(dengan pola berbeda) dari derivasi yang di-sample, sehingga dataset untuk
+evaluation.py sebaiknya dibuat dengan parser_patterns=True. Validitas dan
+pola menurut parser hanya bergantung pada signature kelas kata (lihat
+parse_cache.word_classes), sehingga hasilnya di-cache per signature;
+signature baru cukup direkognisi (engine bitset + SpanMemo) dan pola diambil
+dari backpointer sel akar saja.
+
+Cara menjalankan: lihat `python seken.py generate` (seken.USAGE).
+"""
+import os
+import random
+import sys
+import time
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import backtrace
+import cyk_process
+import general
+import grammar
+import parse_cache
+import span_memo
+import tokenizer
+
+DEFAULT_LENGTHS = (3, 8)
+DEFAULT_CHUNK_SIZE = 10000
+PERTURBATIONS = ("swap", "drop", "substitute")
+
+# Batas entri cache hasil parsing per signature (dikosongkan saat penuh)
+SIGNATURE_CACHE_LIMIT = 250000
+
+# Percobaan maksimum sebelum kalimat dasar diganti
+MAX_ATTEMPTS = 10
+
+class SentenceGenerator:
+    """
+    Generator kalimat VALID/INVALID berlabel dari grammar terkompilasi.
+    
+    Contoh:
+        generator = SentenceGenerator(seed=0)
+        generator.count(4)              # jumlah derivasi K dengan 4 token
+        generator.valid(4)              # ("ring pura i nyoman ...", "P S")
+        SentenceGenerator(parser_patterns=True).valid(4)  # pola dipilih parser
+        generator.invalid(4)            # ("pura ring ...", "swap")
+        for line in generator.stream(1000):
+            print(line)                 # "VALID|...|P S" / "INVALID|..."
+    """
+    def __init__(self, lexicon=None, compiled=None, max_length=32, seed=None, parser_patterns=False):
+        self.lexicon = lexicon if lexicon is not None else general.default_lexicon
+        if compiled is None:
+            compiled = grammar.compile_lexicon(lexicon) if lexicon is not None else grammar.compiled
+        self.compiled = compiled
+        self.tokenizer = tokenizer.get_tokenizer(self.lexicon)
+        self.rng = random.Random(seed)
+        self.max_length = max_length
+        # True: pola VALID selalu pola yang dipilih parser (lihat docstring modul)
+        self.parser_patterns = parser_patterns
+        self._signatures = {}
+        self.memo = span_memo.SpanMemo()
+        starts = self.tokenizer.trie
+        self._joinable = {word for word in compiled.lexical if any(part in starts for part in word.split())}
+        
+        size = len(compiled.symbols)
+        self.words = [[] for _ in range(size)]
+        self.classes = {}
+        for word, nts in compiled.lexical.items():
+            for nt in nts:
+                self.words[nt].append(word)
+            self.classes.setdefault(compiled.lexical_masks[word], []).append(word)
+        for words in self.words:
+            words.sort()
+        for words in self.classes.values():
+            words.sort()
+        self.class_list = sorted(self.classes)
+        
+        self.rules = [[] for _ in range(size)]
+        for (left, right), parents in sorted(compiled.binary_rules.items()):
+            for parent in parents:
+                self.rules[parent].append((left, right))
+        
+        # counts[A][L]: jumlah derivasi A -> L token (kata berbeda = derivasi berbeda)
+        self.counts = [[0] * (max_length + 1) for _ in range(size)]
+        for nt in range(size):
+            self.counts[nt][1] = len(self.words[nt])
+        for length in range(2, max_length + 1):
+            for nt in range(size):
+                self.counts[nt][length] = sum(
+                    self.counts[left][k] * self.counts[right][length - k]
+                    for left, right in self.rules[nt] for k in range(1, length)
+                )
+        self._options = {}
+    
+    def count(self, length):
+        """
+        Jumlah derivasi start symbol dengan tepat `length` token.
+        
+        Args:
+            length (int): Panjang kalimat (token)
+        
+        Returns:
+            int: Jumlah derivasi (0 jika grammar tidak bisa menghasilkan panjang ini)
+        """
+        if length > self.max_length:
+            raise ValueError(f"Panjang {length} melebihi max_length={self.max_length}")
+        return self.counts[self.compiled.start_id][length]
+    
+    def _choices(self, nt, length):
+        # (peluang kumulatif, pilihan (left, right, k)) untuk A -> L token, dihitung sekali
+        key = (nt, length)
+        options = self._options.get(key)
+        if options is None:
+            cumulative = []
+            choices = []
+            total = 0
+            for left, right in self.rules[nt]:
+                for k in range(1, length):
+                    weight = self.counts[left][k] * self.counts[right][length - k]
+                    if weight:
+                        total += weight
+                        cumulative.append(total)
+                        choices.append((left, right, k))
+            options = ([weight / total for weight in cumulative], choices)
+            self._options[key] = options
+        return options
+    
+    def sample(self, length):
+        """
+        Satu derivasi acak (seragam atas semua derivasi dengan panjang ini).
+        
+        Args:
+            length (int): Panjang kalimat (token)
+        
+        Returns:
+            list: Token kalimat
+        """
+        return self._derive(length)[0]
+    
+    def _derive(self, length):
+        # (token, (left_id, right_id) aturan start symbol yang dipilih; None untuk 1 token)
+        if not self.count(length):
+            raise ValueError(f"Grammar tidak bisa menghasilkan kalimat {length} token")
+        random = self.rng.random
+        words = self.words
+        options = self._options
+        tokens = []
+        top = None
+        stack = [(self.compiled.start_id, length)]
+        while stack:
+            nt, size = stack.pop()
+            if size == 1:
+                # Derivasi satu token: leksikal (A -> kata) saja
+                candidates = words[nt]
+                tokens.append(candidates[int(random() * len(candidates))])
+                continue
+            cumulative, choices = options.get((nt, size)) or self._choices(nt, size)
+            left, right, k = choices[bisect_right(cumulative, random())]
+            if top is None:
+                top = (left, right)
+            stack.append((right, size - k))
+            stack.append((left, k))
+        return tokens, top
+    
+    def analyze(self, sentence):
+        """
+        Validitas dan pola kalimat menurut parser.
+        
+        Args:
+            sentence (str): Kalimat
+        
+        Returns:
+            tuple: (is_valid, pattern) - pattern dalam format dataset (mis. "P S")
+        """
+        return self._label(self.tokenizer.tokenize(sentence))
+    
+    def _retokenize(self, tokens):
+        # Tokenizer bisa menggabung token hasil generator (mis. "i" + "wayan" -> "i wayan");
+        # tokenisasi ulang hanya jika ada token yang bisa mengawali entri multi-kata
+        joinable = self._joinable
+        for token in tokens[:-1]:
+            if token in joinable:
+                merged = self.tokenizer.tokenize(" ".join(tokens))
+                return tokens if merged == tokens else merged
+        return tokens
+    
+    def _label(self, tokens):
+        tokens = self._retokenize(tokens)
+        signature = parse_cache.word_classes(tokens, self.compiled)
+        result = self._signatures.get(signature)
+        if result is None:
+            pattern = None
+            if tokens and all(signature):
+                # Pola hanya butuh backpointer sel akar (lihat cyk_process.get_sentence_pattern)
+                table = cyk_process.recognize(tokens, self.compiled, engine="bitset", prune=True, memo=self.memo)
+                if cyk_process.is_valid_sentence(table, len(tokens), "K"):
+                    root = backtrace.cell_backpointer(table.chart, len(tokens) - 1, 0, tokens, self.compiled)
+                    pattern = " ".join(root["K"][1])
+            result = (pattern is not None, pattern)
+            if len(self._signatures) >= SIGNATURE_CACHE_LIMIT:
+                self._signatures.clear()
+            self._signatures[signature] = result
+        return result
+    
+    def stats(self):
+        """
+        Statistik cache label dan span memo.
+        
+        Returns:
+            dict: labels (jumlah signature di cache), span_memo (SpanMemo.stats)
+        """
+        return {'labels': len(self._signatures), 'span_memo': self.memo.stats()}
+    
+    def valid(self, length):
+        """
+        Kalimat VALID dengan pola dari aturan start symbol yang di-sample
+        (atau pola menurut parser jika parser_patterns=True). Kalimat hanya
+        di-parse jika tokenizer menggabung tokennya.
+        
+        Args:
+            length (int): Panjang derivasi (token grammar)
+        
+        Returns:
+            tuple: (kalimat, pola)
+        """
+        while True:
+            tokens, top = self._derive(length)
+            if top is not None and not self.parser_patterns and self._retokenize(tokens) is tokens:
+                return " ".join(tokens), " ".join(self.compiled.pair_names[top])
+            is_valid, pattern = self._label(tokens)
+            if is_valid:
+                return " ".join(tokens), pattern
+    
+    def perturb(self, tokens, kind):
+        """
+        Perturbasi satu kalimat.
+        
+        Args:
+            tokens (list): Token kalimat VALID
+            kind (str): "swap" (tukar dua token), "drop" (hapus satu token),
+                atau "substitute" (ganti satu token dengan kata dari kelas lain)
+        
+        Returns:
+            list: Token hasil perturbasi
+        """
+        random = self.rng.random
+        tokens = list(tokens)
+        n = len(tokens)
+        if kind == "swap" and n > 1:
+            i = int(random() * n)
+            j = (i + 1 + int(random() * (n - 1))) % n
+            tokens[i], tokens[j] = tokens[j], tokens[i]
+        elif kind == "drop" and n > 1:
+            del tokens[int(random() * n)]
+        elif kind == "substitute" and len(self.class_list) > 1:
+            i = int(random() * n)
+            current = self.compiled.lexical_masks.get(tokens[i], 0)
+            word_class = current
+            while word_class == current:
+                word_class = self.class_list[int(random() * len(self.class_list))]
+            members = self.classes[word_class]
+            tokens[i] = members[int(random() * len(members))]
+        else:
+            raise ValueError(f"Perturbasi tidak dikenal atau tidak bisa diterapkan: {kind}")
+        return tokens
+    
+    def invalid(self, length, perturbations=PERTURBATIONS):
+        """
+        Kalimat INVALID hasil perturbasi kalimat VALID; hasil yang ternyata
+        masih valid dibuang.
+        
+        Args:
+            length (int): Panjang kalimat dasar (token grammar)
+            perturbations (tuple): Jenis perturbasi yang boleh dipakai
+        
+        Returns:
+            tuple: (kalimat, jenis perturbasi)
+        """
+        if length < 2:
+            perturbations = tuple(kind for kind in perturbations if kind == "substitute") or perturbations
+        while True:
+            tokens = self.sample(length)
+            for _ in range(MAX_ATTEMPTS):
+                kind = perturbations[int(self.rng.random() * len(perturbations))]
+                perturbed = self.perturb(tokens, kind)
+                if not self._label(perturbed)[0]:
+                    return " ".join(perturbed), kind
+    
+    def stream(self, count=None, lengths=DEFAULT_LENGTHS, invalid_ratio=0.5, perturbations=PERTURBATIONS):
+        """
+        Baris dataset berlabel secara streaming.
+        
+        Args:
+            count (int): Jumlah kalimat (None = tanpa batas)
+            lengths (tuple): (min, max) panjang derivasi, dipilih seragam
+            invalid_ratio (float): Proporsi kalimat INVALID
+            perturbations (tuple): Jenis perturbasi untuk kalimat INVALID
+        
+        Yields:
+            str: "VALID|kalimat|pola" atau "INVALID|kalimat"
+        """
+        rng = self.rng
+        choices = [length for length in range(lengths[0], lengths[1] + 1) if self.count(length)]
+        if not choices:
+            raise ValueError(f"Grammar tidak bisa menghasilkan kalimat dengan panjang {lengths[0]}-{lengths[1]}")
+        produced = 0
+        while count is None or produced < count:
+            length = choices[int(rng.random() * len(choices))]
+            if rng.random() < invalid_ratio:
+                sentence, _ = self.invalid(length, perturbations)
+                yield f"INVALID|{sentence}"
+            else:
+                sentence, pattern = self.valid(length)
+                yield f"VALID|{sentence}|{pattern}"
+            produced += 1
+
+# State per proses worker (diisi _init_worker, sekali per proses)
+_worker = {}
+
+def _init_worker(lengths, invalid_ratio, perturbations, parser_patterns=False):
+    """Membuat generator (tabel counts + cache label) sekali per worker."""
+    _worker['generator'] = SentenceGenerator(max_length=lengths[1], parser_patterns=parser_patterns)
+    _worker['options'] = (lengths, invalid_ratio, perturbations)
+
+def _generate_chunk(seed, index, size):
+    # Seed per chunk: hasil sama berapapun jumlah worker-nya
+    generator = _worker['generator']
+    generator.rng.seed(f"{seed}:{index}")
+    return list(generator.stream(size, *_worker['options']))
+
+def generate_lines(count=None, workers=1, seed=None, lengths=DEFAULT_LENGTHS, invalid_ratio=0.5,
+                   perturbations=PERTURBATIONS, chunk_size=DEFAULT_CHUNK_SIZE, parser_patterns=False):
+    """
+    Baris dataset berlabel dalam chunk berseed, dengan process pool jika
+    workers > 1. Paling banyak workers x 4 chunk yang sedang diproses, dan
+    urutan output selalu urutan chunk, sehingga seed yang sama menghasilkan
+    output yang sama untuk jumlah worker berapapun.
+    
+    Args:
+        count (int): Jumlah kalimat (None = tanpa batas)
+        workers (int): Jumlah proses (1 = tanpa pool)
+        seed (int): Seed (None = acak)
+        lengths (tuple): (min, max) panjang derivasi
+        invalid_ratio (float): Proporsi kalimat INVALID
+        perturbations (tuple): Jenis perturbasi untuk kalimat INVALID
+        chunk_size (int): Jumlah kalimat per tugas worker
+        parser_patterns (bool): Pola VALID menurut parser (lihat SentenceGenerator)
+    
+    Yields:
+        str: "VALID|kalimat|pola" atau "INVALID|kalimat"
+    """
+    unknown = [kind for kind in perturbations if kind not in PERTURBATIONS]
+    if unknown:
+        raise ValueError(f"Perturbasi tidak dikenal: {', '.join(unknown)}. Pilihan: {', '.join(PERTURBATIONS)}")
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    
+    def chunks():
+        index = 0
+        while count is None or index * chunk_size < count:
+            size = chunk_size if count is None else min(chunk_size, count - index * chunk_size)
+            yield index, size
+            index += 1
+    
+    options = (lengths, invalid_ratio, perturbations, parser_patterns)
+    if workers <= 1:
+        _init_worker(*options)
+        for index, size in chunks():
+            yield from _generate_chunk(seed, index, size)
+        return
+    
+    max_pending = workers * 4
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=options) as executor:
+        pending = deque()
+        for index, size in chunks():
+            pending.append(executor.submit(_generate_chunk, seed, index, size))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        
+        while pending:
+            yield from pending.popleft().result()
+
+def run_generate(args):
+    """
+    Subcommand `generate`: menulis kalimat berlabel (format dataset) atau
+    kalimat saja (format plain, input `seken.py batch`/load test).
+    
+    Args:
+        args (list): Argumen setelah kata `generate`
+    
+    Returns:
+        int: Exit code
+    """
+    import seken
+    
+    output = None
+    plain = False
+    options = {'count': 1000}
+    for arg in args:
+        if arg.startswith("--count="):
+            value = arg.split("=", 1)[1]
+            options['count'] = None if value == "inf" else int(value)
+        elif arg.startswith("--lengths="):
+            low, _, high = arg.split("=", 1)[1].partition("-")
+            options['lengths'] = (int(low), int(high or low))
+        elif arg.startswith("--invalid-ratio="):
+            options['invalid_ratio'] = float(arg.split("=", 1)[1])
+        elif arg.startswith("--perturbations="):
+            options['perturbations'] = tuple(arg.split("=", 1)[1].split(","))
+        elif arg.startswith("--seed="):
+            options['seed'] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--workers="):
+            options['workers'] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--chunk-size="):
+            options['chunk_size'] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--output="):
+            output = arg.split("=", 1)[1]
+        elif arg == "--plain":
+            plain = True
+        elif arg == "--parser-patterns":
+            options['parser_patterns'] = True
+        else:
+            print(f"Opsi tidak dikenal: {arg}\n\n{seken.USAGE}", file=sys.stderr)
+            return 2
+    
+    outfile = sys.stdout if output is None else open(output, "w", encoding="utf-8")
+    total = 0
+    start = time.perf_counter()
+    try:
+        for line in generate_lines(**options):
+            if not total and not plain:
+                outfile.write("# Generated\n")
+            outfile.write((line.split("|", 2)[1] if plain else line) + "\n")
+            total += 1
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # Output dipotong (mis. `| head`): sisa buffer stdout dibuang
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        if outfile is not sys.stdout:
+            outfile.close()
+    
+    elapsed = time.perf_counter() - start
+    print(f"{total} kalimat dalam {elapsed:.2f}s ({total / elapsed if elapsed else 0:.0f} kalimat/s)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(run_generate(sys.argv[1:]))
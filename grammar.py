@@ -1,137 +1,315 @@
+import copy
+
 import general
+import grammar_compiler
+
+# Grammar dibaca dari grammar.cfg + kamus (general.Lexicon) lewat grammar_compiler:
+# konversi CNF dan index kata hanya dijalankan jika source berubah, selebihnya
+# dimuat dari artifact di .grammar_cache/ (dikunci dengan hash konten input).
+# Atribut grammar default di bawah baru dimuat saat pertama kali diakses
+# (grammar.compiled, grammar.production, ...), sehingga import modul ini
+# tidak membaca file apa pun. Atribut tersebut disimpan di general.snapshot
+# bersama kamusnya (lihat general.Snapshot), bukan sebagai variabel modul.
+DEFAULT_ATTRIBUTES = (
+    "artifact", "variable", "production", "start_symbol",
+    "preterminals", "natural_production", "lexical_index", "compiled"
+)
+
+def grammar_attributes(artifact):
+    """
+    Menyusun atribut grammar dari data artifact grammar_compiler.
+    
+    Args:
+        artifact (dict): Hasil grammar_compiler.load_grammar
+    
+    Returns:
+        dict: Atribut grammar:
+            - variable: non-terminal (urutan = ID simbol pada grammar terkompilasi)
+            - production: CNF, nt -> list kata terminal + string gabungan aturan
+              biner (mis. "NP_SDet")
+            - start_symbol: list berisi start symbol
+            - preterminals, natural_production: CFG alami (sebelum CNF), persis
+              seperti di grammar.cfg; dipakai oleh earley.py
+            - lexical_index: kata -> frozenset non-terminal yang memproduksinya;
+              kata kamus yang tidak dipakai grammar (mis. verb) bernilai kosong
+            - compiled: CompiledGrammar
+    """
+    start_symbol = artifact['start_symbol']
+    return {
+        'artifact': artifact,
+        'variable': artifact['symbols'],
+        'production': artifact['production'],
+        'start_symbol': [start_symbol],
+        'preterminals': artifact['preterminals'],
+        'natural_production': artifact['natural_production'],
+        'lexical_index': artifact['lexical_index'],
+        'compiled': CompiledGrammar(
+            artifact['symbols'], artifact['binary_rules'], artifact['lexical'], start_symbol,
+            version=artifact['hash']
+        )
+    }
+
+def load_default():
+    """
+    Atribut grammar untuk kamus di general.snapshot; dimuat sekali per
+    snapshot lalu disimpan di snapshot tersebut.
+    
+    Returns:
+        dict: Atribut grammar (lihat grammar_attributes)
+    """
+    snapshot = general.snapshot
+    while snapshot.grammar is None:
+        attributes = grammar_attributes(grammar_compiler.load_grammar(lexicon=snapshot.lexicon))
+        # Gagal jika hot reload memasang kamus lain selama grammar dimuat:
+        # ulangi untuk snapshot terbaru
+        general.publish(general.Snapshot(snapshot.lexicon, attributes), expected=snapshot)
+        snapshot = general.snapshot
+    return snapshot.grammar
 
-# NON-TERMINALS
-variable = [
-    "K", "P", "S", "Pel", "Ket", "PP", 
-    "NP_S", "NP_Pel", "NP_Loc", "NP_Time", "NumP",
-    "Prep", "Noun", "PropNoun", "Pronoun", "Adj", "Det", "Num", "Adv", "NounTime",
-    "X1", "X2", "X3", "X4"
-]
+def current():
+    """
+    Kamus default dan grammar terkompilasinya dari satu snapshot, untuk
+    pemanggil yang memakai keduanya (tokenisasi + cek kamus + parsing).
+    
+    Returns:
+        tuple: (Lexicon, CompiledGrammar)
+    """
+    while True:
+        attributes = load_default()
+        snapshot = general.snapshot
+        if snapshot.grammar is attributes:
+            return snapshot.lexicon, attributes['compiled']
+
+def reload_attributes(snapshot, lexicon, changed):
+    """
+    Hot reload: menyusun atribut grammar untuk kamus baru dari snapshot lama
+    tanpa restart. Hanya aturan terminal kata yang terdampak yang dihitung
+    ulang (lihat grammar_compiler.update_lexicon dan
+    CompiledGrammar.with_lexical). Tidak memasang apa pun: pemanggil
+    mempublikasikan hasilnya bersama kamus baru dengan general.publish.
+    
+    Args:
+        snapshot (general.Snapshot): Snapshot kamus + grammar saat ini
+        lexicon (Lexicon): Kamus baru
+        changed (list): Kategori yang isinya berubah
+    
+    Returns:
+        dict: Atribut grammar untuk kamus baru, None jika grammar snapshot
+            lama belum pernah dimuat (nanti dimuat langsung untuk kamus baru)
+    """
+    current = snapshot.grammar
+    if current is None:
+        return None
+    
+    data, affected = grammar_compiler.update_lexicon(current['artifact'], snapshot.lexicon, lexicon, changed)
+    return dict(
+        current,
+        artifact=data,
+        production=data['production'],
+        lexical_index=data['lexical_index'],
+        compiled=current['compiled'].with_lexical(data['lexical'], affected, data['hash'])
+    )
+
+def __getattr__(name):
+    if name in DEFAULT_ATTRIBUTES:
+        return load_default()[name]
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+def compile_lexicon(lexicon, grammar_file=grammar_compiler.GRAMMAR_FILE):
+    """
+    Mengompilasi grammar untuk kamus lain (Lexicon yang di-inject), tanpa
+    mengubah grammar default. Hasilnya dipakai lewat argumen `compiled`
+    pada cyk_parse/recognize atau CYKEvaluator(lexicon=...).
+    
+    Args:
+        lexicon (Lexicon): Kamus kata
+        grammar_file (str): Path source grammar
+    
+    Returns:
+        CompiledGrammar: Grammar terkompilasi untuk kamus tersebut
+    """
+    return grammar_attributes(grammar_compiler.load_grammar(grammar_file, lexicon))['compiled']
 
-# CNF
-production = {
-    "K": [
-        "PS",           # K -> P S
-        "X1Pel",        # K -> X1 Pel
-        "X2S",          # K -> X2 S
-        "X1X3",         # K -> X1 X3
-        "X2X4"          # K -> X2 X4
-    ],
-    
-    "X1": [
-        "PS"            # X1 -> P S
-    ],
-    
-    "X2": [
-        "PPel"          # X2 -> P Pel
-    ],
-    
-    "X3": [
-        "PelKet"        # X3 -> Pel Ket
-    ],
-    
-    "X4": [
-        "SKet"          # X4 -> S Ket
-    ],
-    
-    "P": [
-        "PrepNP_Loc"    # P -> Prep NP_Loc
-    ],
-    
-    "PP": [
-        "PrepNP_Loc"    # PP -> Prep NP_Loc
-    ],
-    
-    "S": (
-        general.kata_benda +      # S -> 'kata_benda'
-        general.proper_noun +     # S -> 'proper_noun'
-        general.kata_ganti +      # S -> 'kata_ganti'
-        [
-            "DetNP_S",            # S -> Det NP_S
-            "NP_SDet",            # S -> NP_S Det
-            "NP_SAdj",            # S -> NP_S Adj
-            "NP_SNoun",           # S -> NP_S Noun
-            "NP_SPropNoun",       # S -> NP_S PropNoun
-            "NP_SPronoun"         # S -> NP_S Pronoun
-        ]
-    ),
-    
-    "NP_S": (
-        general.kata_benda +      # NP_S -> 'kata_benda'
-        general.proper_noun +     # NP_S -> 'proper_noun'
-        general.kata_ganti +      # NP_S -> 'kata_ganti'
-        [
-            "DetNP_S",            # NP_S -> Det NP_S
-            "NP_SDet",            # NP_S -> NP_S Det
-            "NP_SAdj",            # NP_S -> NP_S Adj
-            "NP_SNoun",           # NP_S -> NP_S Noun
-            "NP_SPropNoun",       # NP_S -> NP_S PropNoun
-            "NP_SPronoun"         # NP_S -> NP_S Pronoun
-        ]
-    ),
-    
-    "Pel": (
-        general.kata_benda +      # Pel -> 'kata_benda'
-        general.numeralia +       # Pel -> 'numeralia'
-        [
-            "NP_PelAdj",          # Pel -> NP_Pel Adj
-            "NP_PelNoun",         # Pel -> NP_Pel Noun
-            "NumPNum",            # Pel -> NumP Num
-            "NumPNoun"            # Pel -> NumP Noun
-        ]
-    ),
-    
-    "NP_Pel": (
-        general.kata_benda +      # NP_Pel -> 'kata_benda'
-        [
-            "NP_PelAdj",          # NP_Pel -> NP_Pel Adj
-            "NP_PelNoun"          # NP_Pel -> NP_Pel Noun
-        ]
-    ),
-    
-    "NumP": (
-        general.numeralia +       # NumP -> 'numeralia'
-        [
-            "NumPNum",            # NumP -> NumP Num
-            "NumPNoun"            # NumP -> NumP Noun
-        ]
-    ),
-    
-    "NP_Time": (
-        general.kata_benda_waktu +    # NP_Time -> 'kata_benda_waktu'
-        [
-            "NP_TimeNounTime"         # NP_Time -> NP_Time NounTime
-        ]
-    ),
-    
-    "Ket": (
-        general.kata_benda_waktu +    # Ket -> 'kata_benda_waktu'
-        [
-            "NP_TimeNounTime"         # Ket -> NP_Time NounTime
-        ]
-    ),
-    
-    "NP_Loc": (
-        general.kata_benda +      # NP_Loc -> 'kata_benda'
-        general.proper_noun +     # NP_Loc -> 'proper_noun'
-        [
-            "NP_LocAdj",          # NP_Loc -> NP_Loc Adj
-            "NP_LocDet"           # NP_Loc -> NP_Loc Det
-        ]
-    ),
-    
-    "Noun": general.kata_benda,              # Noun -> 'kata_benda'
-    "PropNoun": general.proper_noun,         # PropNoun -> 'proper_noun'
-    "Pronoun": general.kata_ganti,           # Pronoun -> 'kata_ganti'
-    "Adj": general.kata_sifat,               # Adj -> 'kata_sifat'
-    "Num": general.numeralia,                # Num -> 'numeralia'
-    "Prep": general.kata_preposisi,          # Prep -> 'kata_preposisi'
-    "Adv": general.adverbia,                 # Adv -> 'adverbia'
-    "Det": general.determinan,               # Det -> 'determiner'
-    "NounTime": general.kata_benda_waktu     # NounTime -> 'kata_benda_waktu'
-}
+def get_lexical_producers(word):
+    """
+    Mendapatkan non-terminal yang memproduksi sebuah kata (aturan A -> 'kata').
+    
+    Args:
+        word (str): Kata terminal
+    
+    Returns:
+        frozenset: Non-terminal yang memproduksi kata, kosong jika tidak ada
+    """
+    return load_default()['lexical_index'].get(word, frozenset())
 
-start_symbol = ["K"]
+class CompiledGrammar:
+    """
+    Grammar CNF yang sudah dikompilasi ke simbol integer (interned ID).
+    
+    Attributes:
+        symbols (list): ID -> nama non-terminal (urutan sesuai `variable`)
+        symbol_id (dict): Nama non-terminal -> ID
+        binary_rules (dict): (left_id, right_id) -> tuple parent_id (terurut)
+        lexical (dict): Kata -> tuple ID non-terminal (terurut)
+        start_id (int): ID start symbol
+        version (str): Hash konten grammar + kamus (kunci invalidasi cache),
+            None jika dibuat langsung tanpa grammar_compiler
+    """
+    def __init__(self, symbols, binary_rules, lexical, start_symbol, version=None):
+        self.symbols = list(symbols)
+        self.symbol_id = {name: i for i, name in enumerate(self.symbols)}
+        self.binary_rules = binary_rules
+        self.lexical = lexical
+        self.start_id = self.symbol_id[start_symbol]
+        self.version = version
+        
+        # Mask per left symbol untuk engine bitset:
+        # partner_masks[a] = mask semua right b dengan aturan X -> a b
+        # pair_masks[a][b] = mask semua parent X dengan aturan X -> a b
+        self.partner_masks = [0] * len(self.symbols)
+        self.pair_masks = [{} for _ in self.symbols]
+        for (left, right), parents in binary_rules.items():
+            self.partner_masks[left] |= 1 << right
+            self.pair_masks[left][right] = sum(1 << p for p in parents)
+        self.lexical_masks = {
+            word: sum(1 << nt for nt in nts) for word, nts in lexical.items()
+        }
+        self.start_mask = 1 << self.start_id
+        self.pair_names = {
+            (left, right): (self.symbols[left], self.symbols[right])
+            for left, right in binary_rules
+        }
+        self.prefix_mask, self.suffix_mask, self.interior_mask = self._context_masks()
+        # Anak kiri/kanan langsung dari start symbol (lihat cyk_process.full_span_possible)
+        self.top_left_mask = self.top_right_mask = 0
+        for (left, right), parents in binary_rules.items():
+            if self.start_id in parents:
+                self.top_left_mask |= 1 << left
+                self.top_right_mask |= 1 << right
+        self._mask_names = {}
+        self._mask_ids = {}
+        self.combine_cache = {}
+    
+    def with_lexical(self, lexical, affected_words, version):
+        """
+        Membuat grammar baru dengan aturan terminal yang diperbarui (hot reload
+        kamus). Tabel aturan biner, mask, dan cache yang tidak bergantung pada
+        kamus (combine_cache, mask_names) dipakai bersama sehingga tetap hangat;
+        lexical_masks hanya dihitung ulang untuk kata yang terdampak.
+        
+        Args:
+            lexical (dict): Kata -> tuple ID non-terminal (versi baru, lengkap)
+            affected_words (set): Kata yang aturan terminalnya mungkin berubah
+            version (str): Versi grammar baru
+        
+        Returns:
+            CompiledGrammar: Grammar baru (objek ini tidak diubah)
+        """
+        clone = copy.copy(self)
+        clone.lexical = lexical
+        clone.lexical_masks = dict(self.lexical_masks)
+        for word in affected_words:
+            nts = lexical.get(word)
+            if nts is None:
+                clone.lexical_masks.pop(word, None)
+            else:
+                clone.lexical_masks[word] = sum(1 << nt for nt in nts)
+        clone.version = version
+        return clone
+    
+    def _context_masks(self):
+        """
+        Menghitung non-terminal yang berguna per posisi span (reachability
+        top-down dari start symbol lewat left/right corner):
+        - prefix: span mulai di kata pertama tetapi bukan seluruh kalimat,
+          harus anak kiri dari parent top/prefix
+        - suffix: span berakhir di kata terakhir tetapi tidak mulai di awal,
+          harus anak kanan dari parent top/suffix
+        - interior: span di tengah, anak kiri dari parent suffix/interior
+          atau anak kanan dari parent prefix/interior
+        Simbol yang tidak bisa dicapai dari start symbol (mis. PP) tidak masuk
+        mask mana pun.
+        
+        Returns:
+            tuple: (prefix_mask, suffix_mask, interior_mask)
+        """
+        top = self.start_mask
+        prefix = suffix = interior = 0
+        changed = True
+        while changed:
+            changed = False
+            for (left, right), parents in self.binary_rules.items():
+                parent_mask = sum(1 << p for p in parents)
+                new_prefix = prefix
+                new_suffix = suffix
+                new_interior = interior
+                if parent_mask & (top | prefix):
+                    new_prefix |= 1 << left
+                if parent_mask & (top | suffix):
+                    new_suffix |= 1 << right
+                if parent_mask & (suffix | interior):
+                    new_interior |= 1 << left
+                if parent_mask & (prefix | interior):
+                    new_interior |= 1 << right
+                if (new_prefix, new_suffix, new_interior) != (prefix, suffix, interior):
+                    prefix, suffix, interior = new_prefix, new_suffix, new_interior
+                    changed = True
+        return prefix, suffix, interior
+    
+    def span_mask(self, col, length, n):
+        """
+        Mask non-terminal yang masih bisa menjadi bagian derivasi lengkap
+        untuk span [col, col + length) pada kalimat n kata.
+        
+        Args:
+            col (int): Posisi awal span
+            length (int): Panjang span
+            n (int): Panjang kalimat
+        
+        Returns:
+            int: Bitmask non-terminal yang diizinkan
+        """
+        if length == n:
+            return self.start_mask
+        if col == 0:
+            return self.prefix_mask
+        if col + length == n:
+            return self.suffix_mask
+        return self.interior_mask
+    
+    def mask_ids(self, mask):
+        """
+        Mengubah bitmask menjadi tuple ID non-terminal terurut (hasil di-cache).
+        
+        Args:
+            mask (int): Bitmask non-terminal
+        
+        Returns:
+            tuple: ID non-terminal yang bit-nya aktif
+        """
+        ids = self._mask_ids.get(mask)
+        if ids is None:
+            ids = tuple(i for i in range(len(self.symbols)) if mask >> i & 1)
+            self._mask_ids[mask] = ids
+        return ids
+    
+    def mask_names(self, mask):
+        """
+        Mengubah bitmask menjadi frozenset nama non-terminal (hasil di-cache).
+        
+        Args:
+            mask (int): Bitmask non-terminal
+        
+        Returns:
+            frozenset: Nama non-terminal yang bit-nya aktif
+        """
+        names = self._mask_names.get(mask)
+        if names is None:
+            names = frozenset(
+                name for i, name in enumerate(self.symbols) if mask >> i & 1
+            )
+            self._mask_names[mask] = names
+        return names
 
 def check_production(array):
     """
@@ -140,13 +318,15 @@ def check_production(array):
     
     Args:
         array (list): List string yang akan dicek dalam produksi
-        
+    
     Returns:
         list: List non-terminal yang bisa memproduksi string dalam array
     """
+    defaults = load_default()
+    production = defaults['production']
     sum_result = set()
     for i in array:
-        for j in variable:
+        for j in defaults['variable']:
             prod_list = production.get(j)
             if prod_list and i in prod_list:
                 sum_result.add(j)
@@ -158,10 +338,11 @@ def check_symbol(array):
     
     Args:
         array (list): List simbol hasil parsing
-        
+    
     Returns:
         bool: True jika mengandung start symbol, False jika tidak
     """
+    start_symbol = load_default()['start_symbol']
     for i in array:
         if i in start_symbol:
             return True
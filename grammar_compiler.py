@@ -0,0 +1,398 @@
+import marshal
+import os
+import sys
+import zlib
+
+import general
+
+# Naikkan jika format artifact atau algoritma konversi CNF berubah,
+# sehingga artifact lama otomatis diabaikan.
+ARTIFACT_VERSION = 3
+
+GRAMMAR_FILE = "grammar.cfg"
+ARTIFACT_DIR = ".grammar_cache"
+
+def parse_cfg(text):
+    """
+    Membaca source grammar (format grammar.cfg).
+    
+    Args:
+        text (str): Isi file grammar
+    
+    Returns:
+        tuple: (start_symbol, alphabet_names, rules) dengan rules berupa list
+            (lhs, rhs_tuple) sesuai urutan di file; terminal ditulis '@nama'
+    
+    Raises:
+        ValueError: Jika ada baris yang tidak sesuai format
+    """
+    start_symbol = None
+    alphabet_names = []
+    rules = []
+    lhs = None
+    
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        
+        if line.startswith("%"):
+            directive, *args = line.split()
+            if directive == "%start" and len(args) == 1:
+                start_symbol = args[0]
+            elif directive == "%alphabet" and args:
+                alphabet_names.extend(args)
+            else:
+                raise ValueError(f"Baris {number}: direktif tidak dikenal '{line}'")
+            continue
+        
+        if "->" in line:
+            lhs, body = (part.strip() for part in line.split("->", 1))
+            if not lhs or " " in lhs:
+                raise ValueError(f"Baris {number}: sisi kiri aturan tidak valid '{line}'")
+        elif line.startswith("|") and lhs is not None:
+            body = line[1:]
+        else:
+            raise ValueError(f"Baris {number}: aturan tidak valid '{line}'")
+        
+        for alternative in body.split("|"):
+            rhs = tuple(alternative.split())
+            if not rhs:
+                raise ValueError(f"Baris {number}: alternatif kosong pada '{lhs}'")
+            if any(sym.startswith("@") for sym in rhs) and len(rhs) > 1:
+                raise ValueError(f"Baris {number}: terminal '@' harus berdiri sendiri")
+            rules.append((lhs, rhs))
+    
+    if start_symbol is None:
+        raise ValueError("Grammar tidak punya direktif %start")
+    return start_symbol, alphabet_names, rules
+
+def convert_to_cnf(rules):
+    """
+    Konversi CFG ke CNF: eliminasi aturan unit (A -> B) dengan menyalin aturan
+    non-unit dari semua simbol yang dapat dicapai lewat rantai unit, lalu
+    binarisasi seimbang aturan panjang. Helper X1, X2, ... diberi nama sesuai
+    urutan kemunculan pertama dan dipakai ulang untuk urutan simbol yang sama.
+    
+    Args:
+        rules (list): List (lhs, rhs_tuple) hasil parse_cfg
+    
+    Returns:
+        tuple: (symbols, binary, lexical_classes)
+            - symbols: list non-terminal (urutan lhs pertama, lalu helper)
+            - binary: dict nt -> list pasangan (left, right) terurut
+            - lexical_classes: dict nt -> list nama alphabet yang diproduksi
+    """
+    symbols = []
+    for lhs, _ in rules:
+        if lhs not in symbols:
+            symbols.append(lhs)
+    
+    units = {nt: [] for nt in symbols}
+    direct = {nt: [] for nt in symbols}
+    for lhs, rhs in rules:
+        for sym in rhs:
+            if not sym.startswith("@") and sym not in units:
+                raise ValueError(f"Simbol '{sym}' pada aturan {lhs} tidak punya aturan")
+        if len(rhs) == 1 and not rhs[0].startswith("@"):
+            units[lhs].append(rhs[0])
+        else:
+            direct[lhs].append(rhs)
+    
+    helpers = {}
+    binary = {nt: [] for nt in symbols}
+    lexical_classes = {nt: [] for nt in symbols}
+    
+    def helper_for(sequence):
+        if len(sequence) == 1:
+            return sequence[0]
+        if sequence not in helpers:
+            middle = (len(sequence) + 1) // 2
+            left = helper_for(sequence[:middle])
+            right = helper_for(sequence[middle:])
+            name = f"X{len(helpers) + 1}"
+            if name in units:
+                raise ValueError(f"Nama helper '{name}' bentrok dengan non-terminal grammar")
+            helpers[sequence] = name
+            symbols.append(name)
+            binary[name] = [(left, right)]
+            lexical_classes[name] = []
+        return helpers[sequence]
+    
+    for nt in list(symbols):
+        closure = [nt]
+        for sym in closure:
+            for target in units[sym]:
+                if target not in closure:
+                    closure.append(target)
+        
+        for sym in closure:
+            for rhs in direct[sym]:
+                if rhs[0].startswith("@"):
+                    if rhs[0][1:] not in lexical_classes[nt]:
+                        lexical_classes[nt].append(rhs[0][1:])
+                    continue
+                middle = (len(rhs) + 1) // 2
+                pair = (helper_for(rhs[:middle]), helper_for(rhs[middle:]))
+                if pair not in binary[nt]:
+                    binary[nt].append(pair)
+    
+    return symbols, binary, lexical_classes
+
+def source_hash(text, lexicon):
+    """
+    Hash konten semua input grammar (versi artifact, versi Python, grammar.cfg,
+    dan isi kategori kamus yang disebut di %alphabet). Memakai CRC32 + Adler-32
+    dari zlib (64 bit) karena hanya dipakai sebagai kunci cache dan jauh lebih
+    murah di-import daripada hashlib saat startup.
+    
+    Args:
+        text (str): Isi grammar.cfg
+        lexicon (Lexicon): Kamus kata
+    
+    Returns:
+        str: Hex digest
+    """
+    chunks = [
+        f"seken-grammar-v{ARTIFACT_VERSION}-py{sys.version_info[0]}.{sys.version_info[1]}".encode(),
+        text.encode("utf-8")
+    ]
+    _, alphabet_names, _ = parse_cfg(text)
+    for name in alphabet_names:
+        chunks.append(b"\0" + name.encode() + b"\0")
+        chunks.append("\n".join(lexicon.words(name)).encode("utf-8"))
+    
+    crc, adler = 0, 1
+    for chunk in chunks:
+        crc = zlib.crc32(chunk, crc)
+        adler = zlib.adler32(chunk, adler)
+    return f"{crc:08x}{adler:08x}"
+
+def compile_source(text, lexicon):
+    """
+    Mengompilasi source grammar + kamus menjadi data grammar siap pakai.
+    Semua nama simbol dan kata di-intern (sys.intern) agar lookup dictionary
+    dan perbandingan string antar modul memakai objek yang sama.
+    
+    Args:
+        text (str): Isi grammar.cfg
+        lexicon (Lexicon): Kamus kata
+    
+    Returns:
+        dict: Data artifact (symbols, production, natural_production,
+            preterminals, lexical_classes, lexical_index, binary_rules, lexical, ...)
+    """
+    start_symbol, alphabet_names, rules = parse_cfg(text)
+    symbols, binary, lexical_classes = convert_to_cnf(rules)
+    symbols = [sys.intern(name) for name in symbols]
+    symbol_id = {name: i for i, name in enumerate(symbols)}
+    
+    alphabets = {
+        name: [sys.intern(word) for word in lexicon.words(name)]
+        for name in alphabet_names
+    }
+    
+    for nt, classes in lexical_classes.items():
+        for name in classes:
+            if name not in alphabets:
+                raise ValueError(f"Kamus '@{name}' pada {nt} tidak ada di %alphabet")
+    
+    production = {}
+    index = {word: set() for words in alphabets.values() for word in words}
+    for nt in symbols:
+        words = [word for name in lexical_classes[nt] for word in alphabets[name]]
+        for word in words:
+            index[word].add(nt)
+        production[nt] = words + [left + right for left, right in binary[nt]]
+    
+    binary_rules = {}
+    for nt in symbols:
+        for left, right in binary[nt]:
+            binary_rules.setdefault((symbol_id[left], symbol_id[right]), set()).add(symbol_id[nt])
+    
+    preterminals = [
+        nt for nt in symbols
+        if lexical_classes[nt] and all(rhs[0].startswith("@") for lhs, rhs in rules if lhs == nt)
+    ]
+    natural_production = {}
+    for lhs, rhs in rules:
+        if lhs not in preterminals:
+            natural_production.setdefault(lhs, []).append(rhs)
+    
+    return {
+        'version': ARTIFACT_VERSION,
+        'start_symbol': start_symbol,
+        'symbols': symbols,
+        'production': production,
+        'natural_production': natural_production,
+        'preterminals': preterminals,
+        'lexical_classes': lexical_classes,
+        'lexical_index': {word: frozenset(nts) for word, nts in index.items()},
+        'binary_rules': {key: tuple(sorted(parents)) for key, parents in binary_rules.items()},
+        'lexical': {
+            word: tuple(sorted(symbol_id[nt] for nt in nts)) for word, nts in index.items()
+        }
+    }
+
+def update_lexicon(data, old_lexicon, lexicon, changed, grammar_file=GRAMMAR_FILE):
+    """
+    Memperbarui data artifact setelah beberapa kategori kamus berubah, tanpa
+    konversi CNF ulang: hanya entri index untuk kata di kategori yang berubah
+    dan daftar kata pada production non-terminal yang memakai kategori
+    tersebut yang dihitung ulang. `data` tidak diubah (copy-on-write), lalu
+    artifact baru ditulis ke disk agar start berikutnya tetap cepat.
+    
+    Args:
+        data (dict): Data artifact untuk old_lexicon
+        old_lexicon (Lexicon): Kamus lama
+        lexicon (Lexicon): Kamus baru
+        changed (list): Kategori yang isinya berubah
+        grammar_file (str): Path source grammar (untuk hash dan path artifact)
+    
+    Returns:
+        tuple: (data_baru, affected_words)
+    """
+    symbol_id = {name: i for i, name in enumerate(data['symbols'])}
+    lexical_classes = data['lexical_classes']
+    category_symbols = {}
+    for nt, classes in lexical_classes.items():
+        for name in classes:
+            category_symbols.setdefault(name, []).append(nt)
+    
+    lexical_index = dict(data['lexical_index'])
+    lexical = dict(data['lexical'])
+    affected = old_lexicon.affected_words(lexicon, changed)
+    for word in affected:
+        categories = [name for name in lexicon.categories if word in lexicon.category(name)]
+        if not categories:
+            lexical_index.pop(word, None)
+            lexical.pop(word, None)
+            continue
+        word = sys.intern(word)
+        nts = {nt for name in categories for nt in category_symbols.get(name, ())}
+        lexical_index[word] = frozenset(nts)
+        lexical[word] = tuple(sorted(symbol_id[nt] for nt in nts))
+    
+    production = dict(data['production'])
+    for nt, classes in lexical_classes.items():
+        if not set(classes) & set(changed):
+            continue
+        old_count = sum(len(old_lexicon.words(name)) for name in classes)
+        words = [sys.intern(word) for name in classes for word in lexicon.words(name)]
+        production[nt] = words + production[nt][old_count:]
+    
+    with open(grammar_file, "r", encoding="utf-8") as file:
+        text = file.read()
+    
+    updated = dict(data)
+    updated.update({
+        'production': production,
+        'lexical_index': lexical_index,
+        'lexical': lexical,
+        'hash': source_hash(text, lexicon)
+    })
+    
+    if lexicon.source is not None:
+        try:
+            write_artifact(updated, artifact_path(grammar_file, lexicon))
+        except OSError as error:
+            print(f"Warning: Artifact grammar tidak dapat disimpan: {error}")
+    return updated, affected
+
+def artifact_path(grammar_file, lexicon, artifact_dir=ARTIFACT_DIR):
+    """
+    Path artifact untuk satu kombinasi source grammar + folder kamus.
+    Isi yang berubah menimpa artifact yang sama (hash konten dicek saat load).
+    
+    Args:
+        grammar_file (str): Path source grammar
+        lexicon (Lexicon): Kamus kata (harus punya source/folder)
+        artifact_dir (str): Folder artifact
+    
+    Returns:
+        str: Path file artifact
+    """
+    identity = f"{os.path.abspath(grammar_file)}|{lexicon.source}".encode("utf-8")
+    return os.path.join(artifact_dir, f"grammar-v{ARTIFACT_VERSION}-{zlib.crc32(identity):08x}.marshal")
+
+def write_artifact(data, path):
+    """
+    Menulis artifact (format marshal: hanya dict/list/tuple/frozenset/str/int)
+    secara atomik (file sementara lalu os.replace), sehingga proses lain tidak
+    pernah membaca artifact setengah jadi. Artifact dari ARTIFACT_VERSION lain
+    di folder yang sama dihapus.
+    
+    Args:
+        data (dict): Data artifact
+        path (str): Path tujuan
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(marshal.dumps(data))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    
+    current = f"grammar-v{ARTIFACT_VERSION}-"
+    for name in os.listdir(directory):
+        if name.startswith("grammar-v") and name.endswith(".marshal") and not name.startswith(current):
+            try:
+                os.unlink(os.path.join(directory, name))
+            except OSError:
+                pass
+
+def load_grammar(grammar_file=GRAMMAR_FILE, lexicon=None, artifact_dir=ARTIFACT_DIR, use_cache=True):
+    """
+    Memuat grammar terkompilasi: pakai artifact jika hash input cocok,
+    jika tidak kompilasi ulang dari source lalu simpan artifact baru.
+    Kamus in-memory (tanpa folder) selalu dikompilasi tanpa artifact.
+    
+    Args:
+        grammar_file (str): Path source grammar
+        lexicon (Lexicon): Kamus kata (default: general.default_lexicon)
+        artifact_dir (str): Folder artifact
+        use_cache (bool): False untuk selalu kompilasi ulang (tanpa membaca/menulis artifact)
+    
+    Returns:
+        dict: Data artifact (lihat compile_source), ditambah 'hash'
+    """
+    if lexicon is None:
+        lexicon = general.default_lexicon
+    with open(grammar_file, "r", encoding="utf-8") as file:
+        text = file.read()
+    digest = source_hash(text, lexicon)
+    
+    use_cache = use_cache and lexicon.source is not None
+    path = artifact_path(grammar_file, lexicon, artifact_dir) if use_cache else None
+    
+    if use_cache:
+        try:
+            with open(path, "rb") as file:
+                data = marshal.loads(file.read())
+            if data.get('version') == ARTIFACT_VERSION and data.get('hash') == digest:
+                return data
+        except (OSError, EOFError, ValueError, TypeError, AttributeError):
+            pass
+    
+    data = compile_source(text, lexicon)
+    data['hash'] = digest
+    
+    if use_cache:
+        try:
+            write_artifact(data, path)
+        except OSError as error:
+            print(f"Warning: Artifact grammar tidak dapat disimpan: {error}")
+    return data
+
+if __name__ == "__main__":
+    data = load_grammar(use_cache=False)
+    path = artifact_path(GRAMMAR_FILE, general.default_lexicon)
+    write_artifact(data, path)
+    print(f"Grammar dikompilasi: {len(data['symbols'])} non-terminal, "
+          f"{len(data['binary_rules'])} aturan biner, {len(data['lexical'])} kata")
+    print(f"Artifact: {path}")
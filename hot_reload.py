@@ -0,0 +1,93 @@
+import threading
+import time
+
+import general
+import grammar
+
+# Hanya proses reload yang saling menunggu; jalur parsing tidak pernah memakai lock
+_reload_lock = threading.Lock()
+
+def reload_alphabets():
+    """
+    Mengecek file alphabets/*.txt dan memasang kamus + grammar baru jika ada
+    kategori yang isinya berubah. Pasangan kamus + grammar baru disusun
+    lebih dulu lalu dipasang dengan satu assignment (general.publish), jadi
+    general.default_lexicon dan grammar.compiled selalu berasal dari kamus
+    yang sama. Request yang sedang berjalan tetap memakai objek lama yang
+    sudah dipegangnya.
+    
+    Returns:
+        list: Kategori yang berubah (kosong jika tidak ada perubahan)
+    """
+    with _reload_lock:
+        while True:
+            snapshot = general.snapshot
+            lexicon, changed = snapshot.lexicon.reload_changed()
+            if lexicon is snapshot.lexicon:
+                return []
+            
+            attributes = grammar.reload_attributes(snapshot, lexicon, changed) if changed else snapshot.grammar
+            # Gagal hanya jika grammar baru saja dimuat untuk snapshot lama: ulangi
+            if general.publish(general.Snapshot(lexicon, attributes), expected=snapshot):
+                return changed
+
+class AlphabetWatcher:
+    """
+    Watcher file kamus berbasis polling (os.stat per kategori yang sudah dimuat).
+    
+    - check(): dipanggil dari kode aplikasi (mis. setiap rerun Streamlit);
+      paling sering sekali per `interval` detik
+    - start(): thread daemon yang memanggil reload setiap `interval` detik,
+      untuk proses berumur panjang tanpa rerun
+    
+    Contoh:
+        watcher = AlphabetWatcher(interval=1.0)
+        watcher.check()
+    """
+    def __init__(self, interval=1.0, on_reload=None):
+        self.interval = interval
+        self.on_reload = on_reload
+        self._last_check = 0.0
+        self._thread = None
+        self._stop = threading.Event()
+    
+    def check(self, force=False):
+        """
+        Menjalankan reload_alphabets jika interval sudah lewat.
+        
+        Args:
+            force (bool): Abaikan interval
+        
+        Returns:
+            list: Kategori yang berubah
+        """
+        now = time.monotonic()
+        if not force and now - self._last_check < self.interval:
+            return []
+        self._last_check = now
+        
+        changed = reload_alphabets()
+        if changed and self.on_reload is not None:
+            self.on_reload(changed)
+        return changed
+    
+    def start(self):
+        """Menjalankan polling di thread daemon (tidak melakukan apa pun jika sudah jalan)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="alphabet-watcher", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Menghentikan thread polling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check(force=True)
+
+watcher = AlphabetWatcher()
@@ -0,0 +1,117 @@
+import grammar
+from chart import BitsetChart, ChartView
+from cyk_bitset import combine_cells
+
+class IncrementalParser:
+    """
+    Parser CYK inkremental kiri-ke-kanan untuk validasi sambil mengetik.
+    Tabel disimpan per kolom akhir: spans[end][start] adalah bitmask untuk
+    kata words[start..end]. Menambah kata hanya mengisi kolom baru (semua span
+    yang berakhir di kata tersebut), sedangkan menghapus kata terakhir cukup
+    membuang kolom terakhir.
+    
+    Contoh:
+        parser = IncrementalParser()
+        parser.push("ring")
+        parser.push("pura")
+        parser.sync(["ring", "pura", "i", "nyoman"])
+        parser.is_valid()
+    """
+    def __init__(self, compiled=None):
+        self.compiled = compiled if compiled is not None else grammar.compiled
+        self.words = []
+        self.spans = []
+    
+    def __len__(self):
+        return len(self.words)
+    
+    def push(self, word):
+        """
+        Menambahkan satu kata di akhir kalimat dan mengisi kolom barunya.
+        Span [start, end] diisi dari yang terpendek (start = end) ke yang
+        terpanjang (start = 0), sehingga span kanan setiap split sudah tersedia.
+        
+        Args:
+            word (str): Kata baru
+        """
+        compiled = self.compiled
+        end = len(self.words)
+        spans = self.spans
+        column = [0] * (end + 1)
+        column[end] = compiled.lexical_masks.get(word, 0)
+        
+        for start in range(end - 1, -1, -1):
+            cell = 0
+            for split in range(start, end):
+                left_mask = spans[split][start]
+                if not left_mask:
+                    continue
+                right_mask = column[split + 1]
+                if right_mask:
+                    cell |= combine_cells(left_mask, right_mask, compiled)
+            column[start] = cell
+        
+        self.words.append(word)
+        spans.append(column)
+    
+    def pop(self):
+        """
+        Menghapus kata terakhir (rollback kolom terakhir).
+        
+        Returns:
+            str: Kata yang dihapus
+        """
+        self.spans.pop()
+        return self.words.pop()
+    
+    def sync(self, words):
+        """
+        Menyamakan isi parser dengan list kata baru: rollback sampai prefix
+        yang sama, lalu menambahkan sisa kata. Biaya sebanding dengan jumlah
+        kata yang berubah di akhir kalimat.
+        
+        Args:
+            words (list): List kata terbaru
+        """
+        common = 0
+        limit = min(len(words), len(self.words))
+        while common < limit and self.words[common] == words[common]:
+            common += 1
+        
+        while len(self.words) > common:
+            self.pop()
+        for word in words[common:]:
+            self.push(word)
+    
+    def top_mask(self):
+        """Bitmask sel paling atas (seluruh kalimat), 0 jika kosong."""
+        if not self.words:
+            return 0
+        return self.spans[-1][0]
+    
+    def is_valid(self, start_symbol="K"):
+        """
+        Mengecek apakah kalimat saat ini valid.
+        
+        Args:
+            start_symbol (str): Start symbol grammar
+        
+        Returns:
+            bool: True jika seluruh kalimat diturunkan dari start symbol
+        """
+        return bool(self.top_mask() >> self.compiled.symbol_id[start_symbol] & 1)
+    
+    def table(self):
+        """
+        Menyalin isi parser menjadi tabel CYK read-only (sama seperti recognize),
+        untuk rendering tabel segitiga atau lazy_backpointer.
+        
+        Returns:
+            ChartView: Tabel CYK
+        """
+        n = len(self.words)
+        chart = BitsetChart(n, len(self.compiled.symbols))
+        for end, column in enumerate(self.spans):
+            for start, mask in enumerate(column):
+                chart.set(end - start, start, mask)
+        return ChartView(chart, self.compiled)
@@ -1,52 +1,15 @@
 import streamlit as st
 import pandas as pd
 import general
+import grammar
+import tokenizer
 import cyk_process
-
-def analyze_sentence_components(node, words):
-    """
-    Menganalisis komponen kalimat dari parse tree.
-    
-    Args:
-        node (dict): Parse tree node
-        words (list): List kata
-        
-    Returns:
-        dict: Dictionary komponen kalimat
-    """
-    components = {
-        "Frasa Preposisional (P/PP)": [],
-        "Subjek (S)": [],
-        "Pelengkap (Pel)": [],
-        "Keterangan (Ket)": []
-    }
-    
-    def traverse(n, current_label=None):
-        if n is None:
-            return
-        
-        label = n['label']
-        
-        if label in ['P', 'PP']:
-            current_label = "Frasa Preposisional (P/PP)"
-        elif label == 'S' and current_label != "Frasa Preposisional (P/PP)":
-            current_label = "Subjek (S)"
-        elif label == 'Pel':
-            current_label = "Pelengkap (Pel)"
-        elif label == 'Ket':
-            current_label = "Keterangan (Ket)"
-        
-        if n['type'] == 'terminal' and current_label:
-            if n['word'] not in components[current_label]:
-                components[current_label].append(n['word'])
-        
-        if 'left' in n:
-            traverse(n['left'], current_label)
-        if 'right' in n:
-            traverse(n['right'], current_label)
-    
-    traverse(node)
-    return components
+import parse_forest
+import incremental
+import hot_reload
+import spelling
+import parse_cache
+import parse_stats
 
 st.set_page_config(
     page_title="SEKEN App - CYK Prepositional Phrase", 
@@ -74,142 +37,394 @@ with col2:
     st.write("")
     check_button = st.button("Analisis Kalimat", type="primary", use_container_width=True)
 
+# Hot reload kamus: perubahan alphabets/*.txt langsung dipakai tanpa restart server
+reloaded_categories = hot_reload.watcher.check()
+if reloaded_categories:
+    st.toast(f"Kamus diperbarui: {', '.join(reloaded_categories)}")
+
+# Parser inkremental dibuat ulang jika grammar sudah diganti (versi kamus lama)
+if ("incremental_parser" not in st.session_state
+        or st.session_state.incremental_parser.compiled is not grammar.compiled):
+    st.session_state.incremental_parser = incremental.IncrementalParser()
+
+# Validasi langsung: parser inkremental hanya menghitung ulang kolom kata yang berubah
+live_words = tokenizer.tokenize(input_sentence)
+live_parser = st.session_state.incremental_parser
+live_parser.sync(live_words)
+
+if live_words and not check_button and (st.session_state.get("active_analysis") or (None,))[0] != input_sentence.strip():
+    live_unknown = [w for w in live_words if w not in general.alphabet_set]
+    if live_unknown:
+        hints = []
+        for word in live_unknown:
+            suggestions = spelling.suggest(word, limit=3)
+            if suggestions:
+                hints.append(f"{word} (mungkin: {', '.join(s['word'] for s in suggestions)})")
+            else:
+                hints.append(word)
+        st.caption(f"Validasi langsung: kata belum dikenali → {'; '.join(hints)}")
+    elif live_parser.is_valid():
+        st.caption("Validasi langsung: ✅ kalimat **VALID** — klik *Analisis Kalimat* untuk detail")
+    else:
+        st.caption("Validasi langsung: kalimat belum valid")
+
+@st.cache_resource
+def get_parse_cache():
+    """Cache hasil parsing dipakai bersama antar sesi dan bertahan setelah restart."""
+    return parse_cache.ParseCache(capacity=parse_cache.DEFAULT_CAPACITY, db_path=".parse_cache.sqlite3")
+
+engine = st.sidebar.selectbox(
+    "Engine CYK",
+    cyk_process.ENGINES,
+    help="set: sel berupa set non-terminal, bitset: sel berupa integer bitmask, "
+         "earley: parser Earley atas CFG alami (tanpa helper CNF)"
+)
+
+# Analisis yang disimpan per sesi (dikosongkan saat penuh)
+ANALYSIS_CACHE_LIMIT = 16
+
+# Jendela tabel CYK yang dirender: panjang span (baris) dan kolom per halaman,
+# sehingga biaya render tetap terbatas berapapun panjang kalimat
+CHART_PAGE_ROWS = 8
+CHART_PAGE_COLS = 10
+
+# Non-terminal yang ditampilkan per sel (selengkapnya lewat Detail Sel)
+CELL_PREVIEW = 4
+
+def analyze_sentence(sentence, engine):
+    """
+    Menjalankan pipeline analisis sekali; hasil yang mahal (tabel, pola,
+    parse tree, derivasi alternatif) disimpan untuk dirender ulang tanpa parsing.
+    
+    Args:
+        sentence (str): Kalimat input
+        engine (str): Engine CYK
+    
+    Returns:
+        dict: Hasil analisis
+    """
+    # Kamus dan grammar dari snapshot yang sama (hot reload bisa terjadi kapan saja)
+    lexicon, compiled = grammar.current()
+    stats = parse_stats.ParseStats()
+    with stats.phase("tokenize"):
+        words = tokenizer.tokenize(sentence, lexicon)
+    with stats.phase("lexicon_check"):
+        is_known, unknown_words = general.check_alphabet(words, lexicon)
+    
+    analysis = {
+        'compiled': compiled,
+        'words': words,
+        'unknown_words': unknown_words,
+        'stats': stats
+    }
+    if not is_known:
+        analysis['suggestions'] = [
+            {
+                "Kata Input": word,
+                "Saran": suggestion['word'],
+                "Jarak Edit": suggestion['distance'],
+                "Kategori": ", ".join(suggestion['categories'])
+            }
+            for word in unknown_words for suggestion in spelling.suggest(word, lexicon=lexicon)
+        ]
+        return analysis
+    
+    table, pattern_info = parse_cache.parse(words, compiled, engine=engine, cache=get_parse_cache(), stats=stats)
+    n = len(words)
+    analysis.update({
+        'table': table,
+        'pattern_info': pattern_info,
+        'is_valid': cyk_process.is_valid_sentence(table, n, start_symbol="K"),
+        'parse_result': cyk_process.get_parse_result(table, n),
+        # Backpointer lazy: hanya sel yang dibuka di Detail Sel yang dihitung
+        'backpointer': cyk_process.lazy_backpointer(table, words),
+        'derivation_count': 0,
+        'alternatives': []
+    })
+    
+    if analysis['is_valid'] and pattern_info:
+        with stats.phase("render"):
+            analysis['parse_tree_text'] = cyk_process.format_parse_tree(pattern_info['parse_tree'], words, prefix="")
+        forest = parse_forest.build_forest(table, words, start_symbol="K")
+        analysis['derivation_count'] = forest.count_derivations()
+        if analysis['derivation_count'] > 1:
+            analysis['alternatives'] = [
+                (cyk_process.extract_pattern(tree), cyk_process.format_parse_tree(tree, words))
+                for tree in forest.k_best(5)
+            ]
+    analysis['render_ns'] = stats.phase_ns['render']
+    return analysis
+
+def get_analysis(sentence, engine):
+    """
+    Hasil analisis dari st.session_state, atau dianalisis jika belum ada
+    (atau grammar sudah diganti oleh hot reload).
+    
+    Args:
+        sentence (str): Kalimat input
+        engine (str): Engine CYK
+    
+    Returns:
+        tuple: (analysis, fresh) - fresh=True jika baru saja diparse
+    """
+    analyses = st.session_state.setdefault("analyses", {})
+    key = (sentence, engine)
+    analysis = analyses.get(key)
+    if analysis is not None and analysis['compiled'] is grammar.compiled:
+        return analysis, False
+    
+    if len(analyses) >= ANALYSIS_CACHE_LIMIT:
+        analyses.clear()
+    analysis = analyze_sentence(sentence, engine)
+    # Key widget navigasi unik per analisis agar posisi halaman tidak terbawa
+    st.session_state.analysis_counter = st.session_state.get("analysis_counter", 0) + 1
+    analysis['widget_key'] = st.session_state.analysis_counter
+    analyses[key] = analysis
+    return analysis, True
+
+def cell_preview(names):
+    """Isi sel ringkas: paling banyak CELL_PREVIEW non-terminal."""
+    if not names:
+        return "-"
+    names = sorted(names)
+    if len(names) > CELL_PREVIEW:
+        return ", ".join(names[:CELL_PREVIEW]) + f" (+{len(names) - CELL_PREVIEW})"
+    return ", ".join(names)
+
+def chart_window(table, words, top_length, start_col, rows=CHART_PAGE_ROWS, cols=CHART_PAGE_COLS):
+    """
+    Potongan tabel CYK untuk dirender: span dengan panjang top_length turun
+    `rows` baris, kolom start_col sampai start_col + cols. Hanya sel di
+    jendela yang dibaca, sehingga biayanya O(rows x cols) berapapun n.
+    
+    Args:
+        table (ChartView): Tabel CYK
+        words (list): List kata
+        top_length (int): Panjang span baris teratas
+        start_col (int): Kolom pertama (0-based)
+        rows (int): Jumlah baris
+        cols (int): Jumlah kolom
+    
+    Returns:
+        pd.DataFrame: Jendela tabel (baris "Length L", kolom "posisi. kata")
+    """
+    n = len(words)
+    end_col = min(n, start_col + cols)
+    display_rows = []
+    row_labels = []
+    
+    for length in range(top_length, max(0, top_length - rows), -1):
+        row = length - 1
+        display_rows.append([
+            cell_preview(table[row][col]) if col <= n - length else ""
+            for col in range(start_col, end_col)
+        ])
+        row_labels.append(f"Length {length}")
+    
+    col_labels = [f"{col + 1}. {words[col]}" for col in range(start_col, end_col)]
+    return pd.DataFrame(display_rows, columns=col_labels, index=row_labels)
+
+def render_chart(analysis):
+    """Tabel CYK per halaman panjang span + jendela kolom, dan Detail Sel on demand."""
+    words = analysis['words']
+    table = analysis['table']
+    n = len(words)
+    widget_key = analysis['widget_key']
+    
+    top_length, start_col = n, 0
+    if n > CHART_PAGE_ROWS or n > CHART_PAGE_COLS:
+        nav_rows, nav_cols = st.columns(2)
+        with nav_rows:
+            top_length = st.selectbox(
+                "Halaman panjang span",
+                list(range(n, 0, -CHART_PAGE_ROWS)),
+                format_func=lambda top: f"Length {top} – {max(1, top - CHART_PAGE_ROWS + 1)}",
+                key=f"chart_rows_{widget_key}"
+            )
+        with nav_cols:
+            if n > CHART_PAGE_COLS:
+                start_col = st.slider(
+                    "Kolom awal", 1, n - CHART_PAGE_COLS + 1, 1, key=f"chart_cols_{widget_key}"
+                ) - 1
+    
+    df_table = chart_window(table, words, top_length, start_col)
+    st.dataframe(df_table, use_container_width=True, height=min(400, (len(df_table) + 1) * 45))
+    st.caption(
+        "**Keterangan:** Length 1 = kata tunggal, Length n = seluruh kalimat. "
+        f"Sel dengan lebih dari {CELL_PREVIEW} non-terminal diringkas; lihat Detail Sel."
+    )
+    
+    with st.expander("Detail Sel"):
+        col_d1, col_d2 = st.columns(2)
+        with col_d1:
+            length = st.selectbox("Panjang span", list(range(1, n + 1)), key=f"cell_length_{widget_key}")
+        with col_d2:
+            start = st.selectbox("Posisi awal", list(range(1, n - length + 2)), key=f"cell_start_{widget_key}")
+        row, col = length - 1, start - 1
+        
+        st.code(" ".join(words[col:col + length]), language="text")
+        pointers = analysis['backpointer'][row][col]
+        if pointers:
+            detail_rows = []
+            for nt, pointer in sorted(pointers.items()):
+                if pointer[0] == 'terminal':
+                    derivation = f"{nt} → '{pointer[1]}'"
+                else:
+                    k, (left, right) = pointer[0], pointer[1]
+                    derivation = f"{nt} → {left} {right} (split setelah kata ke-{col + k})"
+                detail_rows.append({"Non-Terminal": nt, "Derivasi": derivation})
+            st.dataframe(pd.DataFrame(detail_rows), use_container_width=True, hide_index=True)
+        else:
+            st.write("Sel kosong: tidak ada non-terminal yang menurunkan span ini.")
+
+active = st.session_state.get("active_analysis")
 if check_button:
     if not input_sentence.strip():
         st.warning("Mohon masukkan kalimat terlebih dahulu.")
+        active = None
     else:
-        words = input_sentence.lower().split()
+        active = (input_sentence.strip(), engine)
+    st.session_state.active_analysis = active
+
+# Hasil analisis tetap tampil saat rerun (navigasi tabel, Detail Sel) tanpa parsing ulang
+if active is not None and active == (input_sentence.strip(), engine):
+    with st.spinner("Memproses algoritma CYK..."):
+        analysis, fresh = get_analysis(*active)
+    words = analysis['words']
+    stats = analysis['stats']
+    
+    if analysis['unknown_words']:
+        st.error(f"**Kata tidak dikenali dalam kamus:** {', '.join(analysis['unknown_words'])}")
         
-        is_known, unknown_words = general.check_alphabet(words)
+        if analysis['suggestions']:
+            st.write("**Saran kata terdekat:**")
+            st.dataframe(pd.DataFrame(analysis['suggestions']), use_container_width=True, hide_index=True)
+        st.info("Silakan tambahkan kata tersebut ke folder `file_kata` jika diperlukan.")
+    else:
+        st.success("Semua kata dikenali dalam kamus!")
+        st.write("---")
         
-        if not is_known:
-            st.error(f"**Kata tidak dikenali dalam kamus:** {', '.join(unknown_words)}")
-            st.info("Silakan tambahkan kata tersebut ke folder `file_kata` jika diperlukan.")
-        else:
-            st.success("Semua kata dikenali dalam kamus!")
+        st.subheader("Tokenisasi")
+        st.code(" → ".join(words), language="text")
+        
+        n = len(words)
+        pattern_info = analysis['pattern_info']
+        is_valid = analysis['is_valid']
+        parse_result = analysis['parse_result']
+        
+        st.subheader("Triangular Table (CYK Chart)")
+        st.caption("Tabel bottom-up: Baris bawah untuk kata tunggal, naik ke atas untuk substring yang lebih panjang.")
+        
+        # Waktu render = format parse tree + render tabel terakhir (bukan akumulasi rerun)
+        stats.phase_ns['render'] = analysis['render_ns']
+        with stats.phase("render"):
+            render_chart(analysis)
+        
+        st.subheader("Hasil Analisis")
+        
+        col_res1, col_res2 = st.columns([1, 2])
+        
+        with col_res1:
+            if is_valid:
+                st.success("**VALID**")
+                if fresh:
+                    st.balloons()
+            else:
+                st.error("**TIDAK VALID**")
+        
+        with col_res2:
+            if is_valid:
+                st.write("Kalimat **diterima** oleh grammar. Struktur kalimat sesuai dengan pola yang ditentukan.")
+            else:
+                st.write("Kalimat **ditolak** oleh grammar. Struktur tidak sesuai pola yang ditentukan.")
+                final_cell = ", ".join(sorted(parse_result)) or "kosong"
+                st.caption(f"Isi sel terakhir (row {n-1}, col 0): `{final_cell}` → Tidak mengandung start symbol 'K'")
+        
+        if is_valid:
             st.write("---")
+            st.subheader("Pola Kalimat")
             
-            st.subheader("Tokenisasi")
-            st.code(" → ".join(words), language="text")
-            
-            with st.spinner("Memproses algoritma CYK..."):
-                final_table, backpointer = cyk_process.cyk_parse(words)
-                n = len(words)
-
-            st.subheader("Triangular Table (CYK Chart)")
-            st.caption("Tabel bottom-up: Baris bawah untuk kata tunggal, naik ke atas untuk substring yang lebih panjang.")
-            
-            display_rows = []
-            row_labels = []
-            
-            for row in range(n-1, -1, -1):
-                display_row = []
-                length = row + 1
-                num_cells = n - row
+            if pattern_info:
+                with st.expander("Parse Tree (Pohon Penurunan)", expanded=True):
+                    st.code(analysis['parse_tree_text'], language="text")
                 
-                for col in range(num_cells):
-                    cell_content = final_table[row][col]
-                    if cell_content:
-                        display_row.append(", ".join(sorted(list(cell_content))))
-                    else:
-                        display_row.append("-")
+                col_p1, col_p2 = st.columns(2)
                 
-                while len(display_row) < n:
-                    display_row.append("")
+                with col_p1:
+                    st.metric(
+                        label="Pola Kalimat",
+                        value=pattern_info['pattern']
+                    )
                 
-                display_rows.append(display_row)
-                row_labels.append(f"Length {length}")
-            
-            col_labels = [words[i] for i in range(n)]
-            
-            df_table = pd.DataFrame(display_rows, columns=col_labels, index=row_labels)
-            st.dataframe(df_table, use_container_width=True, height=min(400, (n + 1) * 45))
-            
-            st.caption("**Keterangan:** Length 1 = kata tunggal, Length n = seluruh kalimat")
-
-            st.subheader("Hasil Analisis")
-            
-            parse_result = cyk_process.get_parse_result(final_table, n)
-            is_valid = cyk_process.is_valid_sentence((final_table, backpointer), n, start_symbol="K")
-            
-            col_res1, col_res2 = st.columns([1, 2])
-            
-            with col_res1:
-                if is_valid:
-                    st.success("**VALID**")
-                    st.balloons()
-                else:
-                    st.error("**TIDAK VALID**")
-            
-            with col_res2:
-                if is_valid:
-                    st.write("Kalimat **diterima** oleh grammar. Struktur kalimat sesuai dengan pola yang ditentukan.")
-                else:
-                    st.write("Kalimat **ditolak** oleh grammar. Struktur tidak sesuai pola yang ditentukan.")
-                    st.caption(f"Isi sel terakhir (row {n-1}, col 0): `{parse_result}` → Tidak mengandung start symbol 'K'")
-
-            if is_valid:
-                st.write("---")
-                st.subheader("Pola Kalimat")
+                with col_p2:
+                    pattern = pattern_info['pattern']
+                    if 'P' in pattern and 'S' in pattern:
+                        interpretation = "Kalimat Preposisional + Subjek"
+                    elif 'S' in pattern and 'Pel' in pattern:
+                        interpretation = "Kalimat Subjek + Pelengkap"
+                    else:
+                        interpretation = "Pola Kompleks"
+                    
+                    st.metric(
+                        label="Interpretasi",
+                        value=interpretation
+                    )
                 
-                pattern_info = cyk_process.get_sentence_pattern(backpointer, words, start_symbol="K")
+                derivation_count = analysis['derivation_count']
+                if derivation_count > 1:
+                    with st.expander(f"Kalimat Ambigu: {derivation_count} Derivasi"):
+                        st.caption("Parse tree alternatif (maksimal 5 pertama):")
+                        for idx, (tree_pattern, tree_text) in enumerate(analysis['alternatives'], 1):
+                            st.markdown(f"**Derivasi {idx}:** `{tree_pattern}`")
+                            st.code(tree_text, language="text")
                 
-                if pattern_info:
-                    with st.expander("Parse Tree (Pohon Penurunan)", expanded=True):
-                        parse_tree_str = cyk_process.format_parse_tree(
-                            pattern_info['parse_tree'], 
-                            words, 
-                            prefix=""
-                        )
-                        st.code(parse_tree_str, language="text")
-                    
-                    col_p1, col_p2 = st.columns(2)
-                    
-                    with col_p1:
-                        st.metric(
-                            label="Pola Kalimat",
-                            value=pattern_info['pattern']
-                        )
-                    
-                    with col_p2:
-                        pattern = pattern_info['pattern']
-                        if 'P' in pattern and 'S' in pattern:
-                            interpretation = "Kalimat Preposisional + Subjek"
-                        elif 'S' in pattern and 'Pel' in pattern:
-                            interpretation = "Kalimat Subjek + Pelengkap"
-                        else:
-                            interpretation = "Pola Kompleks"
-                        
-                        st.metric(
-                            label="Interpretasi",
-                            value=interpretation
-                        )
+                with st.expander("Langkah-Langkah Derivasi"):
+                    derivation_steps = pattern_info['derivation']
+                    if derivation_steps:
+                        for idx, step in enumerate(derivation_steps, 1):
+                            indent = "  " * step['depth']
+                            st.text(f"{idx}. {indent}{step['rule']}")
+                    else:
+                        st.info("Tidak ada langkah derivasi (kalimat sangat sederhana)")
+                
+                with st.expander("Analisis Komponen Kalimat"):
+                    st.markdown("### Komponen yang Teridentifikasi:")
                     
-                    with st.expander("Langkah-Langkah Derivasi"):
-                        derivation_steps = pattern_info['derivation']
-                        if derivation_steps:
-                            for idx, step in enumerate(derivation_steps, 1):
-                                indent = "  " * step['depth']
-                                st.text(f"{idx}. {indent}{step['rule']}")
-                        else:
-                            st.info("Tidak ada langkah derivasi (kalimat sangat sederhana)")
+                    components = cyk_process.analyze_sentence_components(pattern_info['parse_tree'], words)
                     
-                    with st.expander("Analisis Komponen Kalimat"):
-                        st.markdown("### Komponen yang Teridentifikasi:")
-                        
-                        components = analyze_sentence_components(pattern_info['parse_tree'], words)
-                        
-                        for comp_type, comp_words in components.items():
-                            if comp_words:
-                                st.markdown(f"**{comp_type}:** {' '.join(comp_words)}")
-
-            with st.expander("Detail Non-Terminal di Sel Akhir"):
-                if parse_result:
-                    st.write("Non-terminal yang ditemukan:")
-                    for nt in sorted(list(parse_result)):
-                        st.code(nt, language="text")
-                else:
-                    st.write("Tidak ada non-terminal yang dapat menurunkan kalimat lengkap.")
+                    for comp_type, comp_words in components.items():
+                        if comp_words:
+                            st.markdown(f"**{comp_type}:** {' '.join(comp_words)}")
+        
+        with st.expander("Detail Non-Terminal di Sel Akhir"):
+            if parse_result:
+                st.write("Non-terminal yang ditemukan:")
+                for nt in sorted(list(parse_result)):
+                    st.code(nt, language="text")
+            else:
+                st.write("Tidak ada non-terminal yang dapat menurunkan kalimat lengkap.")
+        
+        with st.expander("Instrumentasi Parsing"):
+            mean_cell, max_cell = stats.nonterminals_per_cell()
+            col_i1, col_i2 = st.columns(2)
+            with col_i1:
+                st.write("**Counter CYK**")
+                st.dataframe(
+                    pd.DataFrame(stats.as_dict()['counters'].items(), columns=["Counter", "Nilai"]),
+                    use_container_width=True, hide_index=True
+                )
+                st.caption(f"Non-terminal per sel: rata-rata {mean_cell:.2f}, maksimum {max_cell}")
+            with col_i2:
+                st.write("**Waktu per Fase**")
+                st.dataframe(
+                    pd.DataFrame(
+                        [(name, elapsed / 1e6) for name, elapsed in stats.phase_ns.items()],
+                        columns=["Fase", "Waktu (ms)"]
+                    ),
+                    use_container_width=True, hide_index=True
+                )
+                if not fresh:
+                    st.caption("Hasil parsing diambil dari sesi (tanpa parsing ulang); render = render terakhir.")
 
 with st.sidebar:
     st.header("Tentang Aplikasi")
@@ -233,6 +448,13 @@ with st.sidebar:
     4. Analisis struktur gramatikal
     """)
     
+    st.markdown("---")
+    cache_stats = get_parse_cache().stats()
+    st.caption(
+        f"Parse cache: {cache_stats['hits']} hit / {cache_stats['misses']} miss "
+        f"({cache_stats['hit_rate']*100:.0f}%), {cache_stats['memory_entries']} entri di memori"
+    )
+    
     st.markdown("---")
     st.caption("Teori Bahasa dan Otomata")
 
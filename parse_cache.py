@@ -0,0 +1,292 @@
+import marshal
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import cyk_process
+import grammar
+from chart import BitsetChart, ChartView
+
+# Naikkan jika format nilai cache berubah (entri lama otomatis tidak terpakai)
+CACHE_FORMAT = 2
+
+DEFAULT_CAPACITY = 1024
+
+class ParseCache:
+    """
+    Cache hasil parsing dua tingkat:
+    - memori: LRU (OrderedDict) dengan kapasitas terbatas
+    - disk (opsional): SQLite di file lokal, bertahan setelah restart
+    
+    Nilai yang disimpan: (n, masks, pattern_info), yaitu isi tabel CYK
+    sebagai bitmask per sel (urutan flat segitiga) dan hasil
+    get_sentence_pattern tanpa kata di daun (lihat parse). Hit di disk
+    dinaikkan ke memori.
+    
+    Contoh:
+        cache = ParseCache(capacity=512, db_path=".parse_cache.sqlite3")
+        table, pattern_info = parse(words, cache=cache)
+        cache.stats()
+    """
+    def __init__(self, capacity=DEFAULT_CAPACITY, db_path=None):
+        self.capacity = capacity
+        self.db_path = db_path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path is not None:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            self._db.commit()
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self._memory)
+    
+    def get(self, key):
+        """
+        Mengambil nilai dari memori, lalu dari disk.
+        
+        Args:
+            key (str): Kunci cache (lihat cache_key)
+        
+        Returns:
+            tuple: Nilai cache, atau None jika miss
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits_memory += 1
+                return value
+            
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM parse_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    try:
+                        value = marshal.loads(row[0])
+                    except (EOFError, ValueError, TypeError):
+                        value = None
+                    if value is not None:
+                        self.hits_disk += 1
+                        self._store_memory(key, value)
+                        return value
+            
+            self.misses += 1
+            return None
+    
+    def put(self, key, value):
+        """
+        Menyimpan nilai ke memori (dan disk jika aktif).
+        
+        Args:
+            key (str): Kunci cache
+            value (tuple): Nilai cache
+        """
+        with self._lock:
+            self._store_memory(key, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO parse_cache (key, value) VALUES (?, ?)",
+                    (key, marshal.dumps(value))
+                )
+                self._db.commit()
+    
+    def _store_memory(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+    
+    def stats(self):
+        """
+        Counter cache.
+        
+        Returns:
+            dict: hits (memori/disk), misses, evictions, hit_rate, ukuran
+        """
+        with self._lock:
+            hits = self.hits_memory + self.hits_disk
+            lookups = hits + self.misses
+            stats = {
+                'hits': hits,
+                'hits_memory': self.hits_memory,
+                'hits_disk': self.hits_disk,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'capacity': self.capacity
+            }
+            if self._db is not None:
+                stats['disk_entries'] = self._db.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+            return stats
+    
+    def clear(self):
+        """Mengosongkan kedua tingkat cache (counter tidak di-reset)."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM parse_cache")
+                self._db.commit()
+    
+    def close(self):
+        """Menutup koneksi SQLite."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+def word_classes(words, compiled):
+    """
+    ID kelas ekuivalen setiap kata: lexical mask-nya (kata dengan himpunan
+    non-terminal yang sama berbagi kelas, mis. "carik" dan "pura").
+    
+    Args:
+        words (list): List token
+        compiled (CompiledGrammar): Grammar terkompilasi
+    
+    Returns:
+        tuple: Kelas per kata (0 untuk kata yang tidak dikenal)
+    """
+    lexical_masks = compiled.lexical_masks
+    return tuple(lexical_masks.get(word, 0) for word in words)
+
+def cache_key(words, compiled, engine="set", prune=False, start_symbol="K"):
+    """
+    Kunci cache: signature kelas kata + versi grammar/kamus (hash konten),
+    engine, dan prune (isi tabel bisa berbeda antar engine/prune).
+    
+    Tabel CYK dan pola kalimat hanya bergantung pada urutan kelas kata, sehingga
+    "Di carik I Wayan" dan "Ring pura I Nyoman" memakai entri yang sama.
+    
+    Args:
+        words (list): List token
+        compiled (CompiledGrammar): Grammar terkompilasi
+        engine (str): Engine CYK
+        prune (bool): Mode pruning
+        start_symbol (str): Start symbol grammar
+    
+    Returns:
+        str: Kunci cache, atau None jika grammar tidak punya versi
+            (mis. CompiledGrammar yang dibuat langsung) sehingga tidak di-cache
+    """
+    if compiled.version is None:
+        return None
+    signature = ",".join(format(word_class, "x") for word_class in word_classes(words, compiled))
+    return f"{CACHE_FORMAT}|{compiled.version}|{engine}|{int(bool(prune))}|{start_symbol}|{signature}"
+
+def strip_leaves(node):
+    """Salinan parse tree dengan kata di daun dikosongkan (template per signature)."""
+    if node is None:
+        return None
+    if node['type'] == 'terminal':
+        return dict(node, word=None)
+    return dict(node, left=strip_leaves(node.get('left')), right=strip_leaves(node.get('right')))
+
+def attach_leaves(node, words):
+    """Salinan parse tree template dengan kata di daun diisi dari words[position]."""
+    if node is None:
+        return None
+    if node['type'] == 'terminal':
+        return dict(node, word=words[node['position']])
+    return dict(node, left=attach_leaves(node.get('left'), words), right=attach_leaves(node.get('right'), words))
+
+def parse(words, compiled=None, engine="set", prune=False, cache=None, start_symbol="K", memo=None, stats=None):
+    """
+    recognize + get_sentence_pattern dengan cache di depannya. Entri cache
+    dipakai bersama oleh semua kalimat dengan signature kelas kata yang sama;
+    hanya kata di daun parse tree yang dipasang ulang per permintaan.
+    
+    Args:
+        words (list): List kata yang sudah divalidasi
+        compiled (CompiledGrammar): Grammar terkompilasi (default: grammar.compiled)
+        engine (str): Engine CYK
+        prune (bool): Pruning (lihat cyk_process.recognize)
+        cache (ParseCache): Cache yang dipakai; None = tanpa cache
+        start_symbol (str): Start symbol grammar
+        memo (SpanMemo): Memo sub-span untuk kalimat yang tidak ada di cache
+        stats (ParseStats): Instrumentasi (opsional): counter CYK (jika
+            stats.count_work) serta waktu fase chart_fill (termasuk lookup
+            cache) dan tree_build
+    
+    Returns:
+        tuple: (table, pattern_info) - ChartView read-only dan hasil
+            get_sentence_pattern (None jika kalimat tidak valid)
+    """
+    if compiled is None:
+        compiled = grammar.compiled
+    
+    if stats is not None:
+        return _parse_instrumented(words, compiled, engine, prune, cache, start_symbol, memo, stats)
+    
+    key = cache_key(words, compiled, engine, prune, start_symbol) if cache is not None else None
+    if key is not None:
+        value = cache.get(key)
+        if value is not None:
+            return _restore(value, words, compiled)
+    
+    table = cyk_process.recognize(words, compiled, engine=engine, prune=prune, memo=memo)
+    pattern_info = _pattern(table, words, start_symbol)
+    if key is not None:
+        _store(cache, key, table, pattern_info)
+    return table, pattern_info
+
+def _parse_instrumented(words, compiled, engine, prune, cache, start_symbol, memo, stats):
+    # Sama dengan parse, dengan fase chart_fill/tree_build diukur terpisah
+    work = stats if stats.count_work else None
+    with stats.phase("chart_fill"):
+        key = cache_key(words, compiled, engine, prune, start_symbol) if cache is not None else None
+        value = cache.get(key) if key is not None else None
+        if value is None:
+            table = cyk_process.recognize(words, compiled, engine=engine, prune=prune, memo=memo, stats=work)
+    
+    if value is not None:
+        stats.cache_hits += 1
+        with stats.phase("tree_build"):
+            return _restore(value, words, compiled)
+    
+    with stats.phase("tree_build"):
+        pattern_info = _pattern(table, words, start_symbol, work)
+    if key is not None:
+        _store(cache, key, table, pattern_info)
+    return table, pattern_info
+
+def _pattern(table, words, start_symbol, stats=None):
+    if not cyk_process.is_valid_sentence(table, len(words), start_symbol):
+        return None
+    backpointer = cyk_process.lazy_backpointer(table, words, stats)
+    return cyk_process.get_sentence_pattern(backpointer, words, start_symbol)
+
+def _restore(value, words, compiled):
+    n, masks, template = value
+    chart = BitsetChart(n, len(compiled.symbols), masks)
+    return ChartView(chart, compiled), _attach_pattern(template, words)
+
+def _store(cache, key, table, pattern_info):
+    chart = table.chart
+    n = chart.n
+    masks = tuple(chart.get(row, col) for row in range(n) for col in range(n - row))
+    template = None
+    if pattern_info is not None:
+        template = dict(pattern_info, parse_tree=strip_leaves(pattern_info['parse_tree']))
+    cache.put(key, (n, masks, template))
+
+def _attach_pattern(template, words):
+    if template is None:
+        return None
+    return dict(
+        template,
+        parse_tree=attach_leaves(template['parse_tree'], words),
+        derivation=[dict(step) for step in template['derivation']]
+    )
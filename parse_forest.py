@@ -0,0 +1,190 @@
+from backtrace import iter_bits
+
+class ParseForest:
+    """
+    Packed shared parse forest hasil CYK.
+    Setiap node (row, col, nt) disimpan sekali dan berisi semua alternatif
+    derivasinya: tuple (k, left_id, right_id) untuk aturan A -> B C, atau
+    kosong untuk node terminal. Subtree yang sama dipakai bersama oleh semua
+    derivasi sehingga ukuran forest polinomial walaupun jumlah pohon eksponensial.
+    
+    Urutan alternatif mengikuti preferensi backpointer cyk_parse (split point
+    terbesar dulu, lalu pasangan ID terkecil), sehingga pohon pertama dari
+    iter_trees sama dengan hasil build_parse_tree.
+    """
+    def __init__(self, words, compiled, nodes, root):
+        self.words = words
+        self.compiled = compiled
+        self.nodes = nodes
+        self.root = root
+        self._counts = {}
+    
+    def __len__(self):
+        return len(self.nodes)
+    
+    def count_derivations(self, node=None):
+        """
+        Menghitung jumlah derivasi (parse tree) berbeda tanpa mengenumerasinya.
+        DP bottom-up: count(terminal) = 1, count(A) = sum count(B) * count(C).
+        
+        Args:
+            node (tuple): Node (row, col, nt); default root
+        
+        Returns:
+            int: Jumlah derivasi
+        """
+        if node is None:
+            node = self.root
+        
+        counts = self._counts
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            if current in counts:
+                stack.pop()
+                continue
+            
+            pending = [
+                child
+                for child_pair in self._children(current)
+                for child in child_pair
+                if child not in counts
+            ]
+            if pending:
+                stack.extend(pending)
+                continue
+            
+            stack.pop()
+            alternatives = self.nodes[current]
+            if not alternatives:
+                counts[current] = 1
+            else:
+                counts[current] = sum(
+                    counts[left] * counts[right]
+                    for left, right in self._children(current)
+                )
+        
+        return counts[node]
+    
+    def iter_trees(self, node=None):
+        """
+        Mengiterasi semua parse tree secara lazy (format sama dengan build_parse_tree).
+        
+        Args:
+            node (tuple): Node (row, col, nt); default root
+        
+        Yields:
+            dict: Parse tree dalam bentuk nested dictionary
+        """
+        if node is None:
+            node = self.root
+        
+        row, col, nt = node
+        label = self.compiled.symbols[nt]
+        span = (col, col + row)
+        
+        if not self.nodes[node]:
+            yield {
+                'label': label,
+                'type': 'terminal',
+                'word': self.words[col],
+                'position': col,
+                'span': span
+            }
+            return
+        
+        for left, right in self._children(node):
+            production = f"{label} → {self.compiled.symbols[left[2]]} {self.compiled.symbols[right[2]]}"
+            for left_tree in self.iter_trees(left):
+                for right_tree in self.iter_trees(right):
+                    yield {
+                        'label': label,
+                        'type': 'non-terminal',
+                        'production': production,
+                        'span': span,
+                        'left': left_tree,
+                        'right': right_tree
+                    }
+    
+    def k_best(self, k):
+        """
+        Mengambil k parse tree pertama menurut urutan preferensi backpointer.
+        Grammar tidak berbobot, sehingga "terbaik" = urutan derivasi yang
+        dipilih cyk_parse; pohon pertama identik dengan get_sentence_pattern.
+        
+        Args:
+            k (int): Jumlah pohon maksimum
+        
+        Returns:
+            list: List parse tree (maksimal k)
+        """
+        trees = []
+        for tree in self.iter_trees():
+            if len(trees) >= k:
+                break
+            trees.append(tree)
+        return trees
+    
+    def _children(self, node):
+        row, col, _ = node
+        for k, left, right in self.nodes[node]:
+            yield (k - 1, col, left), (row - k, col + k, right)
+
+def build_forest(table, words, start_symbol="K"):
+    """
+    Membangun packed parse forest dari tabel CYK (hasil recognize/cyk_parse).
+    Hanya node yang dapat dicapai dari start symbol di sel teratas yang
+    dimasukkan, dengan SEMUA split point dan pasangan anak yang valid.
+    
+    Args:
+        table (ChartView): Tabel CYK
+        words (list): List kata
+        start_symbol (str): Start symbol grammar
+    
+    Returns:
+        ParseForest: Forest, atau None jika kalimat tidak valid
+    """
+    chart = table.chart
+    compiled = table.compiled
+    n = len(words)
+    if n == 0:
+        return None
+    
+    start_id = compiled.symbol_id[start_symbol]
+    if not chart.get(n - 1, 0) >> start_id & 1:
+        return None
+    
+    partner_masks = compiled.partner_masks
+    pair_masks = compiled.pair_masks
+    root = (n - 1, 0, start_id)
+    nodes = {}
+    stack = [root]
+    
+    while stack:
+        node = stack.pop()
+        if node in nodes:
+            continue
+        row, col, nt = node
+        
+        if row == 0:
+            nodes[node] = ()
+            continue
+        
+        length = row + 1
+        alternatives = []
+        for k in range(length - 1, 0, -1):
+            left_mask = chart.get(k - 1, col)
+            right_mask = chart.get(length - k - 1, col + k)
+            if not left_mask or not right_mask:
+                continue
+            for left in iter_bits(left_mask):
+                pairs = pair_masks[left]
+                for right in iter_bits(right_mask & partner_masks[left]):
+                    if pairs[right] >> nt & 1:
+                        alternatives.append((k, left, right))
+                        stack.append((k - 1, col, left))
+                        stack.append((length - k - 1, col + k, right))
+        
+        nodes[node] = tuple(alternatives)
+    
+    return ParseForest(words, compiled, nodes, root)
@@ -0,0 +1,168 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+# Fase pipeline yang diukur (tokenize dan lexicon_check diukur oleh pemanggil)
+PHASES = ("tokenize", "lexicon_check", "chart_fill", "tree_build", "render")
+
+COUNTERS = (
+    "cells_filled",
+    "cells_from_memo",
+    "split_points",
+    "combinations",
+    "rule_lookups",
+    "backpointer_writes",
+    "cache_hits"
+)
+
+class ParseStats:
+    """
+    Counter kerja CYK dan waktu per fase untuk satu atau beberapa parse.
+    
+    Instrumentasi bersifat opsional: fungsi parsing menerima `stats=None`
+    dan loop utama tidak berubah saat dinonaktifkan. Saat aktif, kerja per
+    sel dihitung dari isi chart setelah sel selesai diisi (sama seperti
+    benchmarks/pruning.py), sehingga hanya ada satu pengecekan per sel.
+    
+    split_points, combinations, dan rule_lookups adalah estimasi dari chart,
+    bukan hitungan di dalam loop. Estimasi ini sama dengan kerja loop karena
+    loop membaca sel anak yang sama (sudah dipotong pruning); sel dari memo
+    dan span setelah early abort tidak dihitung. Pengecualian: rule_lookups
+    engine bitset menghitung setiap pasangan sel yang digabung, termasuk yang
+    dilayani combine_cache tanpa lookup aturan (batas atas).
+    
+    Counter:
+        cells_filled: Sel yang dihitung (termasuk baris leksikal dan sel kosong)
+        cells_from_memo: Sel yang diambil dari SpanMemo tanpa dihitung
+        split_points: Split point yang dikunjungi
+        combinations: Pasangan (B, C) dari sel kiri x sel kanan yang tidak kosong
+        rule_lookups: Lookup tabel aturan biner (engine set: satu per pasangan,
+            engine bitset: satu per pasangan sel di combine_cells)
+        backpointer_writes: Entri backpointer yang ditulis (eager atau lazy)
+        cache_hits: Parse yang dilayani ParseCache tanpa mengisi chart
+    
+    Dengan count_work=False hanya waktu per fase yang dicatat: parse_cache.parse
+    tidak meneruskan stats ke loop CYK, sehingga tidak ada overhead counting
+    (dipakai evaluation.py untuk memisahkan waktu chart_fill dan tree_build).
+    
+    Contoh:
+        stats = ParseStats()
+        with stats.phase("chart_fill"):
+            table = cyk_process.recognize(words, stats=stats)
+        stats.as_dict()
+    """
+    def __init__(self, count_work=True):
+        self.count_work = count_work
+        for name in COUNTERS:
+            setattr(self, name, 0)
+        # Jumlah non-terminal per sel -> jumlah sel
+        self.cell_sizes = {}
+        self.phase_ns = dict.fromkeys(PHASES, 0)
+    
+    @contextmanager
+    def phase(self, name):
+        """
+        Mengukur waktu satu fase (perf_counter_ns, dijumlahkan jika berulang).
+        
+        Args:
+            name (str): Nama fase (lihat PHASES)
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield self
+        finally:
+            self.phase_ns[name] = self.phase_ns.get(name, 0) + time.perf_counter_ns() - start
+    
+    def add_cell(self, cell):
+        """
+        Mencatat satu sel yang sudah dihitung.
+        
+        Args:
+            cell (int): Bitmask isi sel
+        """
+        size = bin(cell).count("1")
+        self.cells_filled += 1
+        self.cell_sizes[size] = self.cell_sizes.get(size, 0) + 1
+    
+    def add_span(self, chart, length, col, cell, pairwise=True):
+        """
+        Mencatat kerja satu sel dengan panjang >= 2: split point, pasangan
+        (B, C), dan lookup aturan diestimasi dari sel anak di chart (lihat
+        docstring kelas). Dipanggil hanya untuk sel yang benar-benar dihitung.
+        
+        Args:
+            chart (BitsetChart): Chart yang sedang diisi
+            length (int): Panjang span
+            col (int): Posisi awal span
+            cell (int): Bitmask hasil sel
+            pairwise (bool): True = satu lookup per pasangan (engine set),
+                False = satu lookup per pasangan sel (engine bitset)
+        """
+        self.split_points += length - 1
+        for k in range(1, length):
+            left = chart.get(k - 1, col)
+            right = chart.get(length - k - 1, col + k)
+            if left and right:
+                pairs = bin(left).count("1") * bin(right).count("1")
+                self.combinations += pairs
+                self.rule_lookups += pairs if pairwise else 1
+        self.add_cell(cell)
+    
+    def merge(self, other):
+        """
+        Menjumlahkan stats lain (ParseStats atau hasil as_dict) ke stats ini.
+        
+        Args:
+            other (ParseStats | dict): Stats yang digabung
+        
+        Returns:
+            ParseStats: self
+        """
+        if isinstance(other, ParseStats):
+            other = other.as_dict()
+        for name, value in other['counters'].items():
+            setattr(self, name, getattr(self, name, 0) + value)
+        for size, count in other['cell_sizes'].items():
+            size = int(size)
+            self.cell_sizes[size] = self.cell_sizes.get(size, 0) + count
+        for name, elapsed in other['phase_ns'].items():
+            self.phase_ns[name] = self.phase_ns.get(name, 0) + elapsed
+        return self
+    
+    def nonterminals_per_cell(self):
+        """
+        Rata-rata dan maksimum jumlah non-terminal per sel.
+        
+        Returns:
+            tuple: (mean, max)
+        """
+        total = sum(self.cell_sizes.values())
+        if not total:
+            return 0.0, 0
+        mean = sum(size * count for size, count in self.cell_sizes.items()) / total
+        return mean, max(self.cell_sizes)
+    
+    def as_dict(self):
+        """
+        Stats dalam bentuk dict (siap JSON, bisa digabung dengan merge).
+        
+        Returns:
+            dict: counters, cell_sizes, phase_ns
+        """
+        return {
+            'counters': {name: getattr(self, name) for name in COUNTERS},
+            'cell_sizes': dict(sorted(self.cell_sizes.items())),
+            'phase_ns': dict(self.phase_ns)
+        }
+
+def phase(stats, name):
+    """
+    stats.phase(name), atau context kosong jika instrumentasi nonaktif.
+    
+    Args:
+        stats (ParseStats): Stats (boleh None)
+        name (str): Nama fase
+    
+    Returns:
+        context manager
+    """
+    return stats.phase(name) if stats is not None else nullcontext()
@@ -0,0 +1,252 @@
+"""
+Command line SEKEN.
+
+`batch` memvalidasi korpus kalimat (satu kalimat per baris, dari file atau
+stdin) tanpa label, dengan process pool, dan menulis hasil JSONL per kalimat.
+`serve` menjalankan layanan HTTP lokal (lihat server.py).
+`generate` membuat kalimat berlabel dari grammar (lihat generator.py).
+"""
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+
+import cyk_process
+import general
+import grammar
+import parse_cache
+import span_memo
+import tokenizer
+
+DEFAULT_CHUNK_SIZE = 256
+
+USAGE = """Penggunaan:
+    python seken.py batch [FILE|-] [--workers=N] [--engine=set] [--output=FILE]
+                          [--chunk-size=256] [--unordered] [--no-prune]
+    python seken.py serve [--host=127.0.0.1] [--port=8765] [--workers=N] [--engine=set]
+                          [--max-pending=N] [--queue-timeout=1] [--timeout=10]
+    python seken.py generate [--count=1000|inf] [--lengths=3-8] [--invalid-ratio=0.5]
+                             [--perturbations=swap,drop,substitute] [--seed=N]
+                             [--workers=1] [--chunk-size=10000] [--output=FILE] [--plain]
+                             [--parser-patterns]"""
+
+# State per proses worker (diisi _init_worker, sekali per proses)
+_worker = {}
+
+def _init_worker(engine, prune):
+    """Memuat grammar sekali per worker dan menyiapkan cache + memo lokal."""
+    _worker['engine'] = engine
+    _worker['prune'] = prune
+    _worker['compiled'] = grammar.compiled
+    _worker['cache'] = parse_cache.ParseCache()
+    _worker['memo'] = span_memo.SpanMemo()
+
+def parse_sentence(line_number, sentence):
+    """
+    Memvalidasi satu kalimat dengan grammar worker.
+    
+    Args:
+        line_number (int): Nomor baris di input
+        sentence (str): Kalimat
+    
+    Returns:
+        dict: line, sentence, tokens, valid, pattern, components, unknown, time_ms
+    """
+    start = time.perf_counter()
+    words = tokenizer.tokenize(sentence)
+    unknown = general.default_lexicon.unknown_words(words)
+    pattern_info = None
+    if words and not unknown:
+        _, pattern_info = parse_cache.parse(
+            words, _worker['compiled'], engine=_worker['engine'], prune=_worker['prune'],
+            cache=_worker['cache'], memo=_worker['memo']
+        )
+    
+    return {
+        'line': line_number,
+        'sentence': sentence,
+        'tokens': words,
+        'valid': pattern_info is not None,
+        'pattern': pattern_info['pattern'] if pattern_info else None,
+        'components': cyk_process.analyze_sentence_components(pattern_info['parse_tree'], words) if pattern_info else None,
+        'unknown': unknown,
+        'time_ms': (time.perf_counter() - start) * 1000
+    }
+
+def _parse_chunk(chunk):
+    return [parse_sentence(line_number, sentence) for line_number, sentence in chunk]
+
+def read_chunks(lines, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Membaca input secara streaming dan mengelompokkan baris tidak kosong.
+    
+    Args:
+        lines (iterable): Baris input (file atau stdin)
+        chunk_size (int): Jumlah kalimat per chunk
+    
+    Yields:
+        list: List (nomor baris, kalimat)
+    """
+    chunk = []
+    for line_number, line in enumerate(lines, 1):
+        sentence = line.strip()
+        if not sentence:
+            continue
+        chunk.append((line_number, sentence))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def batch_parse(lines, workers=None, engine="set", prune=True, chunk_size=DEFAULT_CHUNK_SIZE, ordered=True):
+    """
+    Memvalidasi kalimat dari iterable baris dengan process pool. Input dibaca
+    bertahap dan paling banyak workers x 4 chunk yang sedang diproses, sehingga
+    memori tetap terbatas untuk korpus berapapun besarnya.
+    
+    Opsi divalidasi saat dipanggil (bukan saat hasil pertama diminta), sebelum
+    pool dibuat, sehingga engine atau jumlah worker yang salah langsung
+    memberi ValueError.
+    
+    Args:
+        lines (iterable): Baris input
+        workers (int): Jumlah proses (default: jumlah CPU; 1 = tanpa pool)
+        engine (str): Engine CYK
+        prune (bool): Pruning (hasil sama, lebih cepat)
+        chunk_size (int): Jumlah kalimat per tugas worker
+        ordered (bool): True = hasil sesuai urutan input, False = sesuai
+            urutan selesai
+    
+    Returns:
+        iterator: Hasil parse_sentence per kalimat
+    
+    Raises:
+        ValueError: Engine tidak dikenal, atau workers/chunk_size < 1
+    """
+    if engine not in cyk_process.ENGINES:
+        raise ValueError(f"Engine tidak dikenal: {engine}. Pilihan: {', '.join(cyk_process.ENGINES)}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Jumlah worker harus >= 1: {workers}")
+    if chunk_size < 1:
+        raise ValueError(f"Ukuran chunk harus >= 1: {chunk_size}")
+    return _batch_results(lines, workers, engine, prune, chunk_size, ordered)
+
+def _batch_results(lines, workers, engine, prune, chunk_size, ordered):
+    chunks = read_chunks(lines, chunk_size)
+    if workers == 1:
+        _init_worker(engine, prune)
+        for chunk in chunks:
+            yield from _parse_chunk(chunk)
+        return
+    
+    max_pending = workers * 4
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(engine, prune)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_parse_chunk, chunk))
+            if len(pending) >= max_pending:
+                if ordered:
+                    yield from pending.popleft().result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield from future.result()
+        
+        if ordered:
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            for future in as_completed(pending):
+                yield from future.result()
+
+def run_batch(args):
+    """
+    Subcommand `batch`: membaca argumen, menjalankan batch_parse, dan menulis JSONL.
+    
+    Args:
+        args (list): Argumen setelah kata `batch`
+    
+    Returns:
+        int: Exit code
+    """
+    source = "-"
+    output = None
+    options = {}
+    for arg in args:
+        if arg.startswith(("--workers=", "--chunk-size=")):
+            name, _, value = arg[2:].partition("=")
+            try:
+                options[name.replace("-", "_")] = int(value)
+            except ValueError:
+                print(f"Nilai --{name} harus bilangan bulat: {value}", file=sys.stderr)
+                return 2
+        elif arg.startswith("--engine="):
+            options['engine'] = arg.split("=", 1)[1]
+        elif arg.startswith("--output="):
+            output = arg.split("=", 1)[1]
+        elif arg == "--unordered":
+            options['ordered'] = False
+        elif arg == "--no-prune":
+            options['prune'] = False
+        elif arg.startswith("--"):
+            print(f"Opsi tidak dikenal: {arg}\n\n{USAGE}", file=sys.stderr)
+            return 2
+        else:
+            source = arg
+    
+    infile = sys.stdin if source == "-" else open(source, "r", encoding="utf-8")
+    try:
+        results = batch_parse(infile, **options)
+    except ValueError as error:
+        if infile is not sys.stdin:
+            infile.close()
+        print(error, file=sys.stderr)
+        return 2
+    outfile = sys.stdout if output is None else open(output, "w", encoding="utf-8")
+    total = 0
+    valid = 0
+    start = time.perf_counter()
+    try:
+        for result in results:
+            outfile.write(json.dumps(result, ensure_ascii=False) + "\n")
+            total += 1
+            valid += result['valid']
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+    
+    elapsed = time.perf_counter() - start
+    print(f"{total} kalimat ({valid} valid) dalam {elapsed:.2f}s "
+          f"({total / elapsed if elapsed else 0:.0f} kalimat/s)", file=sys.stderr)
+    return 0
+
+def run_serve(args):
+    import server
+    return server.run_serve(args)
+
+def run_generate(args):
+    import generator
+    return generator.run_generate(args)
+
+COMMANDS = {
+    "batch": run_batch,
+    "serve": run_serve,
+    "generate": run_generate
+}
+
+def main(argv):
+    if not argv or argv[0] not in COMMANDS:
+        print(USAGE, file=sys.stderr)
+        return 2
+    return COMMANDS[argv[0]](argv[1:])
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,361 @@
+"""
+Layanan HTTP lokal untuk parser (tanpa Streamlit), hanya memakai library standar.
+
+Endpoint:
+    GET  /health      -> status, jumlah worker, request yang sedang diproses
+    POST /parse       -> {"sentence": "..."}           => hasil satu kalimat
+    POST /parse_many  -> {"sentences": ["...", ...]}   => {"results": [...]}
+
+Front end asyncio menerima koneksi dan mengirim pekerjaan CYK (CPU-bound) ke
+process pool yang sudah dipanaskan (grammar dimuat sekali per worker). Hasil
+per kalimat sama dengan `seken.py batch` (seken.parse_sentence).
+
+Cara menjalankan:
+    python seken.py serve [--host=127.0.0.1] [--port=8765] [--workers=N]
+"""
+import asyncio
+import json
+import os
+import signal
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import cyk_process
+import seken
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Batas ukuran request
+MAX_BODY_BYTES = 1024 * 1024
+MAX_HEADER_BYTES = 8192
+MAX_BATCH_SENTENCES = 1000
+MAX_SENTENCE_CHARS = 1000
+
+# Batas waktu (detik)
+REQUEST_TIMEOUT = 10.0
+READ_TIMEOUT = 5.0
+KEEP_ALIVE_TIMEOUT = 30.0
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+    504: "Gateway Timeout"
+}
+
+class HTTPError(Exception):
+    """Error yang dikirim ke client sebagai response JSON {"error": ...}."""
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+def _warmup(_):
+    # Dipanggil sekali per worker saat start agar grammar sudah dimuat
+    return os.getpid()
+
+class ParserService:
+    """
+    Server HTTP asyncio dengan process pool.
+    
+    Backpressure: paling banyak `max_pending` pekerjaan (chunk kalimat) yang
+    boleh menunggu/berjalan di pool. Request yang tidak mendapat slot dalam
+    `queue_timeout` detik ditolak dengan 503 + Retry-After, sehingga antrian
+    tidak tumbuh tanpa batas saat beban melebihi kapasitas.
+    
+    Contoh:
+        service = ParserService(workers=4)
+        asyncio.run(service.serve_forever())
+    """
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, engine="set",
+                 prune=True, max_pending=None, queue_timeout=1.0, request_timeout=REQUEST_TIMEOUT):
+        if engine not in cyk_process.ENGINES:
+            raise ValueError(f"Engine tidak dikenal: {engine}. Pilihan: {', '.join(cyk_process.ENGINES)}")
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.engine = engine
+        self.prune = prune
+        self.max_pending = max_pending or self.workers * 8
+        self.queue_timeout = queue_timeout
+        self.request_timeout = request_timeout
+        self.executor = None
+        self.server = None
+        self._slots = None
+        self.in_flight = 0
+    
+    async def start(self):
+        """Membuat dan memanaskan process pool, lalu mulai menerima koneksi."""
+        loop = asyncio.get_running_loop()
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=seken._init_worker, initargs=(self.engine, self.prune)
+        )
+        await asyncio.gather(*(
+            loop.run_in_executor(self.executor, _warmup, i) for i in range(self.workers)
+        ))
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self.server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_HEADER_BYTES
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+    
+    async def close(self):
+        """Berhenti menerima koneksi dan mematikan pool."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+    
+    async def serve_forever(self):
+        await self.start()
+        print(f"SEKEN parser service: http://{self.host}:{self.port} ({self.workers} worker)", file=sys.stderr)
+        loop = asyncio.get_running_loop()
+        serving = asyncio.ensure_future(self.server.serve_forever())
+        terminated = False
+        
+        def terminate():
+            nonlocal terminated
+            terminated = True
+            serving.cancel()
+        
+        # SIGTERM (mis. process.terminate()) dihentikan seperti Ctrl+C agar
+        # close() tetap mematikan worker pool (tanpa ini worker menjadi yatim)
+        try:
+            loop.add_signal_handler(signal.SIGTERM, terminate)
+        except NotImplementedError:
+            # Windows: add_signal_handler tidak tersedia
+            pass
+        try:
+            await serving
+        except asyncio.CancelledError:
+            if not terminated:
+                raise
+        finally:
+            try:
+                loop.remove_signal_handler(signal.SIGTERM)
+            except NotImplementedError:
+                pass
+            await self.close()
+    
+    async def _run(self, chunk):
+        """Menjalankan satu chunk di pool dengan backpressure dan timeout."""
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPError(503, "Server sibuk, coba lagi", {"Retry-After": "1"})
+        
+        self.in_flight += 1
+        try:
+            job = self.executor.submit(seken._parse_chunk, chunk)
+        except BaseException:
+            self._release()
+            raise
+        # Slot dilepas saat job di pool benar-benar selesai (atau batal sebelum
+        # berjalan), bukan saat request timeout: proses worker tidak bisa
+        # dihentikan di tengah jalan, jadi job tersebut tetap dihitung max_pending
+        loop = asyncio.get_running_loop()
+        job.add_done_callback(lambda _: self._job_done(loop))
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(job)), self.request_timeout)
+        except asyncio.TimeoutError:
+            job.cancel()
+            raise HTTPError(504, f"Parsing melebihi {self.request_timeout:g} detik")
+    
+    def _job_done(self, loop):
+        # Dipanggil dari thread pool, slot dilepas di thread event loop
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            # Event loop sudah ditutup
+            pass
+    
+    def _release(self):
+        self.in_flight -= 1
+        self._slots.release()
+    
+    async def parse(self, payload):
+        sentence = payload.get("sentence") if isinstance(payload, dict) else None
+        if not isinstance(sentence, str) or not sentence.strip():
+            raise HTTPError(400, "Field 'sentence' (string tidak kosong) wajib diisi")
+        if len(sentence) > MAX_SENTENCE_CHARS:
+            raise HTTPError(413, f"Kalimat melebihi {MAX_SENTENCE_CHARS} karakter")
+        result = (await self._run([(1, sentence.strip())]))[0]
+        del result['line']
+        return result
+    
+    async def parse_many(self, payload):
+        sentences = payload.get("sentences") if isinstance(payload, dict) else None
+        if not isinstance(sentences, list) or not all(isinstance(item, str) for item in sentences):
+            raise HTTPError(400, "Field 'sentences' (list string) wajib diisi")
+        if len(sentences) > MAX_BATCH_SENTENCES:
+            raise HTTPError(413, f"Batch melebihi {MAX_BATCH_SENTENCES} kalimat")
+        if any(len(sentence) > MAX_SENTENCE_CHARS for sentence in sentences):
+            raise HTTPError(413, f"Kalimat melebihi {MAX_SENTENCE_CHARS} karakter")
+        
+        # Kalimat kosong tetap mendapat hasil agar indeks hasil = indeks input
+        items = [(index, sentence.strip()) for index, sentence in enumerate(sentences)]
+        chunk_size = max(1, -(-len(items) // self.workers))
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        parts = await asyncio.gather(*(self._run(chunk) for chunk in chunks))
+        results = [result for part in parts for result in part]
+        for result in results:
+            result['index'] = result.pop('line')
+        return {"results": results}
+    
+    def health(self):
+        return {"status": "ok", "workers": self.workers, "in_flight": self.in_flight, "max_pending": self.max_pending}
+    
+    async def _dispatch(self, method, path, body):
+        routes = {
+            "/parse": self.parse,
+            "/parse_many": self.parse_many
+        }
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise HTTPError(405, "Gunakan GET", {"Allow": "GET"})
+            return self.health()
+        if path not in routes:
+            raise HTTPError(404, f"Endpoint tidak dikenal: {path}")
+        if method != "POST":
+            raise HTTPError(405, "Gunakan POST dengan body JSON", {"Allow": "POST"})
+        try:
+            payload = json.loads(body or b"{}")
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise HTTPError(400, "Body bukan JSON yang valid")
+        return await routes[path](payload)
+    
+    async def _read_request(self, reader, timeout):
+        """
+        Membaca satu request HTTP/1.1 (request line, header, body Content-Length).
+        
+        Returns:
+            tuple: (method, path, headers, body), atau None jika koneksi ditutup
+        """
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout)
+        except ValueError:
+            raise HTTPError(431, "Request line terlalu panjang")
+        if not request_line:
+            return None
+        
+        parts = request_line.decode("latin-1").split()
+        if len(parts) != 3:
+            raise HTTPError(400, "Request line tidak valid")
+        method, path, _ = parts
+        
+        headers = {}
+        header_bytes = 0
+        while True:
+            try:
+                line = await asyncio.wait_for(reader.readline(), READ_TIMEOUT)
+            except ValueError:
+                raise HTTPError(431, "Header terlalu panjang")
+            header_bytes += len(line)
+            if header_bytes > MAX_HEADER_BYTES:
+                raise HTTPError(431, "Header terlalu panjang")
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(400, "Content-Length tidak valid")
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, f"Body melebihi {MAX_BODY_BYTES} byte")
+        body = await asyncio.wait_for(reader.readexactly(length), READ_TIMEOUT) if length else b""
+        return method, path, headers, body
+    
+    async def _handle_connection(self, reader, writer):
+        keep_alive = True
+        try:
+            while keep_alive:
+                status, headers = 200, {}
+                method, path = "-", "-"
+                try:
+                    request = await self._read_request(reader, KEEP_ALIVE_TIMEOUT)
+                    if request is None:
+                        break
+                    method, path, request_headers, body = request
+                    keep_alive = request_headers.get("connection", "").lower() != "close"
+                    response = await self._dispatch(method, path, body)
+                except HTTPError as error:
+                    status, headers, response = error.status, error.headers, {"error": error.message}
+                    # Request yang tidak terbaca utuh tidak bisa dilanjutkan di koneksi yang sama
+                    if status in (400, 413, 431):
+                        keep_alive = False
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception:
+                    # Error tak terduga (mis. BrokenProcessPool) tetap dijawab agar client tidak menggantung
+                    print(f"Error saat memproses {method} {path}:", file=sys.stderr)
+                    traceback.print_exc()
+                    status, headers, response = 500, {}, {"error": "Kesalahan internal server"}
+                
+                self._write_response(writer, status, response, headers, keep_alive)
+                await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+    
+    def _write_response(self, writer, status, payload, headers, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        lines = [
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"
+        ]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+
+def run_serve(args):
+    """
+    Subcommand `serve`: menjalankan ParserService sampai dihentikan (Ctrl+C atau SIGTERM).
+    
+    Args:
+        args (list): Argumen setelah kata `serve`
+    
+    Returns:
+        int: Exit code
+    """
+    options = {}
+    for arg in args:
+        if arg.startswith("--host="):
+            options['host'] = arg.split("=", 1)[1]
+        elif arg.startswith("--port="):
+            options['port'] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--workers="):
+            options['workers'] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--engine="):
+            options['engine'] = arg.split("=", 1)[1]
+        elif arg.startswith("--max-pending="):
+            options['max_pending'] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--queue-timeout="):
+            options['queue_timeout'] = float(arg.split("=", 1)[1])
+        elif arg.startswith("--timeout="):
+            options['request_timeout'] = float(arg.split("=", 1)[1])
+        else:
+            print(f"Opsi tidak dikenal: {arg}\n\n{seken.USAGE}", file=sys.stderr)
+            return 2
+    
+    try:
+        asyncio.run(ParserService(**options).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(run_serve(sys.argv[1:]))
@@ -0,0 +1,134 @@
+SPAN_MEMO_LIMIT = 100000
+
+class SpanMemo:
+    """
+    Memo isi sel CYK lintas kalimat. Sel sebuah span hanya bergantung pada
+    urutan kelas kata di span tersebut (lexical mask, lihat
+    parse_cache.word_classes), sehingga span yang sama pada kalimat lain
+    (mis. prefix "ring pura" atau suffix "i nyoman") cukup dihitung sekali.
+    Dengan pruning, isi sel juga bergantung pada apakah span menyentuh awal
+    dan/atau akhir kalimat, jadi kedua flag tersebut ikut menjadi kunci.
+    
+    Memo terikat pada satu CompiledGrammar (dikosongkan otomatis jika grammar
+    atau kamus berubah) dan dibatasi SPAN_MEMO_LIMIT entri (dikosongkan saat
+    penuh, sama seperti combine_cache).
+    
+    Contoh:
+        memo = SpanMemo()
+        for words in sentences:
+            cyk_process.recognize(words, memo=memo)
+        memo.stats()
+    """
+    def __init__(self, limit=SPAN_MEMO_LIMIT):
+        self.limit = limit
+        self.compiled = None
+        self.cells = {}
+        self.hits = {}
+        self.misses = {}
+        self.compute_ns = {}
+    
+    def bind(self, compiled):
+        """
+        Memastikan memo milik grammar `compiled`; isi lama dibuang jika berbeda.
+        
+        Args:
+            compiled (CompiledGrammar): Grammar terkompilasi yang sedang dipakai
+        """
+        if self.compiled is not compiled:
+            self.compiled = compiled
+            self.cells.clear()
+    
+    def classes(self, words):
+        """
+        Kelas kata setiap token (lexical mask pada grammar yang terikat).
+        
+        Args:
+            words (list): List kata
+        
+        Returns:
+            tuple: Kelas per kata
+        """
+        lexical_masks = self.compiled.lexical_masks
+        return tuple(lexical_masks.get(word, 0) for word in words)
+    
+    def key(self, classes, col, length, n, prune):
+        """
+        Kunci memo untuk span [col, col + length).
+        
+        Args:
+            classes (tuple): Kelas kata seluruh kalimat
+            col (int): Posisi awal span
+            length (int): Panjang span
+            n (int): Panjang kalimat
+            prune (bool): Mode pruning
+        
+        Returns:
+            tuple: (flag awal, flag akhir, kelas kata di span)
+        """
+        if prune:
+            return (col == 0, col + length == n, classes[col:col + length])
+        return (False, False, classes[col:col + length])
+    
+    def get(self, key):
+        """
+        Mengambil isi sel dari memo dan mencatat hit/miss per panjang span.
+        
+        Args:
+            key (tuple): Kunci dari key()
+        
+        Returns:
+            int: Bitmask sel, atau None jika belum ada
+        """
+        cell = self.cells.get(key)
+        length = len(key[2])
+        if cell is None:
+            self.misses[length] = self.misses.get(length, 0) + 1
+        else:
+            self.hits[length] = self.hits.get(length, 0) + 1
+        return cell
+    
+    def put(self, key, cell, elapsed_ns):
+        """
+        Menyimpan isi sel beserta waktu komputasinya.
+        
+        Args:
+            key (tuple): Kunci dari key()
+            cell (int): Bitmask sel
+            elapsed_ns (int): Waktu mengisi sel (nanodetik)
+        """
+        length = len(key[2])
+        self.compute_ns[length] = self.compute_ns.get(length, 0) + elapsed_ns
+        if len(self.cells) >= self.limit:
+            self.cells.clear()
+        self.cells[key] = cell
+    
+    def stats(self):
+        """
+        Hit ratio dan estimasi waktu yang dihemat per panjang span
+        (hit x rata-rata waktu komputasi sel dengan panjang yang sama).
+        
+        Returns:
+            dict: Total hits/misses/hit_rate/saved_ms, entri, dan by_length
+        """
+        by_length = {}
+        for length in sorted(set(self.hits) | set(self.misses)):
+            hits = self.hits.get(length, 0)
+            misses = self.misses.get(length, 0)
+            average_ns = self.compute_ns.get(length, 0) / misses if misses else 0
+            by_length[length] = {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / (hits + misses),
+                'saved_ms': hits * average_ns / 1e6
+            }
+        
+        hits = sum(entry['hits'] for entry in by_length.values())
+        misses = sum(entry['misses'] for entry in by_length.values())
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'saved_ms': sum(entry['saved_ms'] for entry in by_length.values()),
+            'entries': len(self.cells),
+            'by_length': by_length
+        }
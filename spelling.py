@@ -0,0 +1,158 @@
+import general
+
+DEFAULT_MAX_DISTANCE = 2
+
+def edit_distance(a, b, max_distance):
+    """
+    Jarak Damerau-Levenshtein (optimal string alignment) antara dua kata,
+    berhenti lebih awal jika pasti melebihi max_distance.
+    
+    Args:
+        a (str): Kata pertama
+        b (str): Kata kedua
+        max_distance (int): Batas jarak
+    
+    Returns:
+        int: Jarak edit, atau max_distance + 1 jika melebihi batas
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+def deletes(word, max_distance):
+    """
+    Semua varian kata dengan menghapus 1..max_distance karakter.
+    
+    Args:
+        word (str): Kata
+        max_distance (int): Jumlah hapus maksimum
+    
+    Returns:
+        set: Varian hasil penghapusan (tanpa kata asli)
+    """
+    result = set()
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for item in frontier:
+            for i in range(len(item)):
+                variant = item[:i] + item[i + 1:]
+                if variant not in result:
+                    result.add(variant)
+                    next_frontier.add(variant)
+        frontier = next_frontier
+    return result
+
+class SymSpellIndex:
+    """
+    Index saran ejaan dengan algoritma symmetric delete (SymSpell).
+    Saat index dibangun, setiap kata kamus dimasukkan bersama semua varian
+    hasil menghapus 1..max_distance karakter. Saat lookup, varian hapus dari
+    kata input dicocokkan ke index (lookup dictionary), lalu hanya kandidat
+    tersebut yang dihitung jarak edit-nya. Biaya lookup tidak bergantung pada
+    ukuran kamus, berbeda dengan scan edit distance ke semua kata.
+    
+    Contoh:
+        index = SymSpellIndex(["pura", "pasih"])
+        index.lookup("puar")  # [("pura", 1)]
+    """
+    def __init__(self, words, max_distance=DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.words = frozenset(words)
+        self.index = {}
+        for word in self.words:
+            self.index.setdefault(word, []).append(word)
+            for variant in deletes(word, max_distance):
+                self.index.setdefault(variant, []).append(word)
+    
+    def lookup(self, term, max_distance=None, limit=5):
+        """
+        Mencari kata kamus terdekat.
+        
+        Args:
+            term (str): Kata input
+            max_distance (int): Batas jarak (maksimal max_distance index)
+            limit (int): Jumlah saran maksimum
+        
+        Returns:
+            list: List (kata, jarak) terurut dari jarak terkecil lalu abjad
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        term = term.lower()
+        
+        candidates = set()
+        for variant in {term} | deletes(term, max_distance):
+            candidates.update(self.index.get(variant, ()))
+        
+        matches = []
+        for word in candidates:
+            distance = edit_distance(term, word, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, word))
+        matches.sort()
+        return [(word, distance) for distance, word in matches[:limit]]
+
+_indexes = {}
+
+def get_index(lexicon=None):
+    """
+    Index SymSpell untuk sebuah kamus, dibangun sekali per objek Lexicon
+    (hot reload kamus menghasilkan objek baru sehingga index ikut dibangun ulang).
+    
+    Args:
+        lexicon (Lexicon): Kamus (default: general.default_lexicon)
+    
+    Returns:
+        SymSpellIndex: Index kamus
+    """
+    if lexicon is None:
+        lexicon = general.default_lexicon
+    entry = _indexes.get(id(lexicon))
+    if entry is None or entry[0] is not lexicon:
+        entry = (lexicon, SymSpellIndex(lexicon.alphabet))
+        if len(_indexes) >= 8:
+            _indexes.clear()
+        _indexes[id(lexicon)] = entry
+    return entry[1]
+
+def suggest(word, lexicon=None, limit=5, max_distance=DEFAULT_MAX_DISTANCE):
+    """
+    Saran kata untuk kata yang tidak dikenali beserta kategorinya.
+    
+    Args:
+        word (str): Kata yang tidak ada di kamus
+        lexicon (Lexicon): Kamus (default: general.default_lexicon)
+        limit (int): Jumlah saran maksimum
+        max_distance (int): Batas jarak edit
+    
+    Returns:
+        list: List dict {'word', 'distance', 'categories'}
+    """
+    if lexicon is None:
+        lexicon = general.default_lexicon
+    return [
+        {
+            'word': candidate,
+            'distance': distance,
+            'categories': sorted(lexicon.word_categories(candidate))
+        }
+        for candidate, distance in get_index(lexicon).lookup(word, max_distance, limit)
+    ]
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+# Modul memakai path relatif (alphabets/, grammar.cfg, evaluation_dataset/),
+# jadi test selalu dijalankan dari root project
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import evaluation
+import general
+import tokenizer
+
+DATASET_FILE = os.path.join("evaluation_dataset", "evaluation_dataset.txt")
+
+@pytest.fixture(scope="session")
+def test_cases():
+    """Kasus uji dari dataset evaluasi (label, kalimat, pola)."""
+    return evaluation.CYKEvaluator().load_dataset(DATASET_FILE)
+
+@pytest.fixture(scope="session")
+def dataset_sentences(test_cases):
+    """Kalimat dataset (list token) yang semua katanya dikenali kamus."""
+    sentences = []
+    for case in test_cases:
+        words = tokenizer.tokenize(case['sentence'])
+        if words and general.check_alphabet(words)[0]:
+            sentences.append(words)
+    return sentences
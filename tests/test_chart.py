@@ -0,0 +1,62 @@
+from array import array
+
+import pytest
+
+import cyk_process
+import grammar
+import parse_cache
+from chart import BitsetChart, triangular_index, triangular_size
+
+def test_triangular_index_is_dense():
+    n = 7
+    indexes = [triangular_index(n, row, col) for row in range(n) for col in range(n - row)]
+    assert indexes == list(range(triangular_size(n)))
+
+def test_packed_backpointers_match_lazy_backtrace(dataset_sentences):
+    """Setiap sel backpointer eager (array) sama dengan backtrace lazy dari chart yang sama."""
+    for words in dataset_sentences:
+        n = len(words)
+        table, backpointer = cyk_process.cyk_parse(words)
+        lazy = cyk_process.lazy_backpointer(table, words)
+        for row in range(n):
+            for col in range(n - row):
+                assert backpointer[row][col] == lazy[row][col], (words, row, col)
+
+def wide_grammar(width):
+    """
+    Grammar rantai dengan `width` non-terminal: K -> A0 R, R -> A1 R | A1 Z,
+    ditambah simbol pengisi sehingga ID terbesar melewati 64.
+    """
+    symbols = ["K", "R", "Z"] + [f"F{i}" for i in range(width - 5)] + ["A0", "A1"]
+    ids = {name: i for i, name in enumerate(symbols)}
+    binary_rules = {
+        (ids["A0"], ids["R"]): (ids["K"],),
+        (ids["A1"], ids["R"]): (ids["R"],),
+        (ids["A1"], ids["Z"]): (ids["R"],),
+    }
+    lexical = {"a": (ids["A0"],), "b": (ids["A1"],), "z": (ids["Z"],)}
+    return grammar.CompiledGrammar(symbols, binary_rules, lexical, "K", version="wide")
+
+@pytest.mark.parametrize("engine", ["set", "bitset"])
+@pytest.mark.parametrize("prune", [False, True])
+def test_grammar_wider_than_64_symbols(engine, prune):
+    compiled = wide_grammar(70)
+    assert compiled.symbol_id["A1"] >= 64
+    words = ["a", "b", "b", "z"]
+    
+    table, backpointer = cyk_process.cyk_parse(words, compiled, engine=engine, prune=prune)
+    assert cyk_process.is_valid_sentence(table, len(words))
+    assert cyk_process.get_sentence_pattern(backpointer, words)['pattern'] == "K → A0 R"
+    assert not cyk_process.is_valid_sentence(cyk_process.recognize(["b", "a", "z"], compiled, engine=engine), 3)
+    
+    cache = parse_cache.ParseCache(capacity=4)
+    for _ in range(2):
+        table, pattern_info = parse_cache.parse(words, compiled, engine=engine, prune=prune, cache=cache)
+        assert pattern_info['pattern'] == "K → A0 R"
+    assert cache.stats()['hits'] == 1
+
+def test_bitset_chart_storage_follows_width():
+    assert isinstance(BitsetChart(3).masks, array)
+    wide = BitsetChart(3, width=65)
+    wide.set(2, 0, 1 << 64)
+    assert wide.get(2, 0) == 1 << 64
@@ -0,0 +1,40 @@
+import cyk_batch
+import cyk_process
+import grammar
+
+def top_cell(table, n):
+    return frozenset(table[n - 1][0])
+
+def test_numpy_batch_matches_set_engine(dataset_sentences):
+    """cyk_batch memberi validitas dan sel teratas yang sama dengan engine set."""
+    expected = []
+    for words in dataset_sentences:
+        table, _ = cyk_process.cyk_parse(words)
+        expected.append((cyk_process.is_valid_sentence(table, len(words)), top_cell(table, len(words))))
+    
+    assert cyk_batch.batch_parse(dataset_sentences) == expected
+
+def test_numpy_batch_split_into_single_sentences(dataset_sentences, monkeypatch):
+    monkeypatch.setattr(cyk_batch, "max_batch_size", lambda n, compiled, rule_arrays: 1)
+    expected = [
+        cyk_process.is_valid_sentence(cyk_process.recognize(words), len(words))
+        for words in dataset_sentences
+    ]
+    assert [valid for valid, _ in cyk_batch.batch_parse(dataset_sentences)] == expected
+
+def test_numpy_batch_many_rules_per_cell():
+    """Regresi: >255 aturan yang cocok dalam satu sel tidak boleh overflow (uint8)."""
+    left = [f"A{i}" for i in range(16)]
+    right = [f"B{i}" for i in range(16)]
+    symbols = ["K"] + left + right
+    ids = {name: i for i, name in enumerate(symbols)}
+    binary_rules = {(ids[a], ids[b]): (ids["K"],) for a in left for b in right}
+    lexical = {
+        "a": tuple(ids[name] for name in left),
+        "b": tuple(ids[name] for name in right)
+    }
+    compiled = grammar.CompiledGrammar(symbols, binary_rules, lexical, "K")
+    
+    assert cyk_batch.batch_parse([["a", "b"], ["b", "a"]], compiled) == [
+        (True, frozenset({"K"})), (False, frozenset())
+    ]
@@ -0,0 +1,14 @@
+import cyk_process
+
+def test_bitset_chart_matches_set_engine(dataset_sentences):
+    """Engine bitset mengisi setiap sel tabel persis sama dengan engine set."""
+    for words in dataset_sentences:
+        n = len(words)
+        table, backpointer = cyk_process.cyk_parse(words, engine="set")
+        other, other_backpointer = cyk_process.cyk_parse(words, engine="bitset")
+        for row in range(n):
+            for col in range(n - row):
+                assert table[row][col] == other[row][col], (words, row, col)
+        if cyk_process.is_valid_sentence(table, n):
+            assert (cyk_process.get_sentence_pattern(other_backpointer, words)['pattern']
+                    == cyk_process.get_sentence_pattern(backpointer, words)['pattern']), words
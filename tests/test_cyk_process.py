@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+import cyk_bitset
+import cyk_process
+import general
+import grammar
+
+def test_valid_sentence_pattern():
+    words = ["ring", "pura", "i nyoman"]
+    table, backpointer = cyk_process.cyk_parse(words)
+    assert cyk_process.is_valid_sentence(table, len(words))
+    assert cyk_process.get_sentence_pattern(backpointer, words)['pattern'] == "K → P S"
+
+def test_invalid_sentence_has_no_pattern():
+    words = ["i nyoman", "ring"]
+    table, backpointer = cyk_process.cyk_parse(words)
+    assert not cyk_process.is_valid_sentence(table, len(words))
+    assert cyk_process.get_sentence_pattern(backpointer, words) is None
+
+def test_check_alphabet_reports_unknown_words():
+    assert general.check_alphabet(["ring", "pura"]) == (True, [])
+    assert general.check_alphabet(["ring", "xyz", "pura", "abc"]) == (False, ["xyz", "abc"])
+
+def test_lexical_lookup():
+    assert "Prep" in grammar.get_lexical_producers("ring")
+    assert grammar.get_lexical_producers("xyz") == frozenset()
+    assert set(grammar.check_production(["ring"])) == set(grammar.get_lexical_producers("ring"))
+
+@pytest.mark.parametrize("engine", ["set", "bitset"])
+def test_recognize_matches_cyk_parse(dataset_sentences, engine):
+    """Mode rekognisi mengisi tabel yang sama; backpointer lazy memberi parse tree yang sama."""
+    for words in dataset_sentences:
+        n = len(words)
+        table, backpointer = cyk_process.cyk_parse(words, engine=engine)
+        recognized = cyk_process.recognize(words, engine=engine)
+        for row in range(n):
+            for col in range(n - row):
+                assert recognized[row][col] == table[row][col], (words, row, col)
+        
+        if cyk_process.is_valid_sentence(table, n):
+            lazy = cyk_process.lazy_backpointer(recognized, words)
+            assert (cyk_process.get_sentence_pattern(lazy, words)
+                    == cyk_process.get_sentence_pattern(backpointer, words)), words
+
+def test_recognize_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        cyk_process.recognize(["ring", "pura"], engine="lalr")
+
+@pytest.mark.parametrize("engine", ["set", "bitset"])
+def test_pruning_keeps_validity_and_pattern(dataset_sentences, engine):
+    for words in dataset_sentences:
+        n = len(words)
+        expected_table, expected_bp = cyk_process.cyk_parse(words)
+        table, backpointer = cyk_process.cyk_parse(words, engine=engine, prune=True)
+        valid = cyk_process.is_valid_sentence(expected_table, n)
+        assert cyk_process.is_valid_sentence(table, n) == valid, words
+        assert cyk_process.is_valid_sentence(cyk_process.recognize(words, engine=engine, prune=True), n) == valid, words
+        if valid:
+            assert (cyk_process.get_sentence_pattern(backpointer, words)['pattern']
+                    == cyk_process.get_sentence_pattern(expected_bp, words)['pattern']), words
+
+def random_sentences(compiled, count, seed=3):
+    """Kalimat acak yang lolos mask posisi, sehingga pruning tidak berhenti di baris pertama."""
+    words = sorted(compiled.lexical_masks)
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(2, 12)
+        yield [
+            rng.choice([word for word in words if compiled.lexical_masks[word] & compiled.span_mask(col, 1, n)])
+            for col in range(n)
+        ]
+
+def test_early_abort_keeps_validity_on_random_inputs():
+    compiled = grammar.compiled
+    for sentence in random_sentences(compiled, 300):
+        n = len(sentence)
+        expected = cyk_process.is_valid_sentence(cyk_process.recognize(sentence, compiled), n)
+        for fill_chart in (cyk_process.fill_chart, cyk_bitset.fill_chart):
+            chart = fill_chart(sentence, compiled, prune=True)
+            assert bool(chart.get(n - 1, 0) & compiled.start_mask) == expected, sentence
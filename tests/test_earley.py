@@ -0,0 +1,41 @@
+import cyk_process
+import earley
+import grammar
+
+def test_earley_matches_cyk(dataset_sentences):
+    """Earley (CFG alami) memberi validitas dan pola kalimat yang sama dengan CYK."""
+    for words in dataset_sentences:
+        n = len(words)
+        expected_table, expected_bp = cyk_process.cyk_parse(words)
+        valid = cyk_process.is_valid_sentence(expected_table, n)
+        
+        table = earley.recognize(words)
+        assert cyk_process.is_valid_sentence(table, n) == valid, words
+        assert cyk_process.is_valid_sentence(cyk_process.recognize(words, engine="earley"), n) == valid, words
+        
+        _, backpointer = cyk_process.cyk_parse(words, engine="earley")
+        if valid:
+            assert (cyk_process.get_sentence_pattern(backpointer, words)['pattern']
+                    == cyk_process.get_sentence_pattern(expected_bp, words)['pattern']), words
+
+def test_earley_grammar_has_no_cnf_helpers():
+    earley_grammar = earley.get_earley_grammar()
+    symbols = earley_grammar.compiled.symbols
+    lhs_names = {symbols[lhs] for lhs, _ in earley_grammar.rules}
+    assert "K" in lhs_names
+    assert not any(name.startswith("X") and name[1:].isdigit() for name in lhs_names)
+    assert any(len(rhs) > 2 for _, rhs in earley_grammar.rules)
+
+def test_earley_grammar_is_built_once_per_compiled_grammar(monkeypatch):
+    compiled = grammar.compiled
+    earley_grammar = earley.get_earley_grammar(compiled)
+    
+    def fail(compiled=None):
+        raise AssertionError("EarleyGrammar dibangun ulang untuk grammar yang sama")
+    monkeypatch.setattr(earley, "build_earley_grammar", fail)
+    assert earley.get_earley_grammar() is earley_grammar
+    assert cyk_process.is_valid_sentence(cyk_process.recognize(["ring", "pura", "i nyoman"], compiled, engine="earley"), 3)
+    
+    monkeypatch.undo()
+    reloaded = compiled.with_lexical(compiled.lexical, set(), "other-version")
+    assert earley.get_earley_grammar(reloaded).compiled is reloaded
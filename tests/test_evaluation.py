@@ -0,0 +1,45 @@
+import contextlib
+import io
+
+import evaluation
+
+TIMING_KEYS = {'parse_time', 'parse_time_ns', 'tree_build_time_ns', 'instrumentation'}
+
+def without_timing(results):
+    return [{key: value for key, value in result.items() if key not in TIMING_KEYS} for result in results]
+
+def test_parallel_run_matches_sequential(test_cases):
+    sequential = evaluation.CYKEvaluator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = [
+            sequential.test_sentence(tc['sentence'], tc['expected'], tc.get('expected_pattern'), tc['category'])
+            for tc in test_cases
+        ]
+    
+    parallel = evaluation.CYKEvaluator()
+    results = parallel.run_parallel(test_cases, workers=2)
+    assert without_timing(results) == without_timing(expected)
+    assert parallel.results['passed'] == sequential.results['passed']
+    assert parallel.category_stats == sequential.category_stats
+    assert parallel.pattern_stats == sequential.pattern_stats
+    for counter in ('true_positive', 'true_negative', 'false_positive', 'false_negative'):
+        assert getattr(parallel, counter) == getattr(sequential, counter), counter
+
+def test_parse_time_is_integer_nanoseconds(test_cases):
+    evaluator = evaluation.CYKEvaluator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = evaluator.evaluate_case(test_cases[0]['sentence'], test_cases[0]['expected'])
+    assert isinstance(result['parse_time_ns'], int) and result['parse_time_ns'] > 0
+    assert result['parse_time'] == result['parse_time_ns'] / 1e9
+
+def test_tree_build_time_is_reported_separately(test_cases):
+    evaluator = evaluation.CYKEvaluator()
+    valid = next(tc for tc in test_cases if tc['expected'])
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = evaluator.test_sentence(valid['sentence'], True)
+        evaluator.test_sentence("I Nyoman ring pasraman", False)
+        evaluator.calculate_final_metrics()
+    assert result['actual'] and result['tree_build_time_ns'] > 0
+    assert result['instrumentation'] is None
+    assert evaluator.results['test_cases'][1]['tree_build_time_ns'] == 0
+    assert evaluator.results['avg_tree_build_time'] == result['tree_build_time_ns'] / 2 / 1e9
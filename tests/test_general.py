@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import general
+
+def test_import_does_not_read_alphabets():
+    """Import general (dan grammar) tidak membaca kamus sampai kata pertama dipakai."""
+    code = (
+        "import general, grammar\n"
+        "assert not general.snapshot.lexicon._words, general.snapshot.lexicon._words\n"
+        "assert general.check_alphabet(['ring'])[0]\n"
+        "assert general.snapshot.lexicon._words\n"
+    )
+    process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert process.returncode == 0, process.stderr
+
+def test_categories_are_loaded_on_demand(tmp_path):
+    (tmp_path / "noun.txt").write_text("pura\nbale\n", encoding="utf-8")
+    (tmp_path / "prep.txt").write_text("ring\n", encoding="utf-8")
+    lexicon = general.Lexicon(str(tmp_path), categories=["noun", "prep"])
+    
+    assert lexicon.words("noun") == ("pura", "bale")
+    assert set(lexicon._words) == {"noun"}
+    assert lexicon.word_categories("ring") == frozenset({"prep"})
+    assert lexicon.unknown_words(["Ring", "pura", "xyz"]) == ["xyz"]
+
+def test_in_memory_lexicon_is_independent_of_default():
+    lexicon = general.Lexicon(words={"noun": ["pasraman"], "prep": ["ring"]})
+    assert "pasraman" in lexicon and len(lexicon) == 2
+    assert general.check_alphabet(["ring", "pasraman"], lexicon) == (True, [])
+    assert "pasraman" not in general.default_lexicon
+    assert lexicon.reload_changed() == (lexicon, [])
@@ -0,0 +1,60 @@
+import cyk_process
+import generator
+import tokenizer
+
+def parse(sentence):
+    words = tokenizer.tokenize(sentence)
+    table, backpointer = cyk_process.cyk_parse(words)
+    return words, table, backpointer
+
+def top_level_patterns(words, table):
+    """Pola "L R" dari semua aturan K -> L R yang menurunkan seluruh kalimat."""
+    n = len(words)
+    patterns = set()
+    for k in range(1, n):
+        for left in table[k - 1][0]:
+            for right in table[n - k - 1][k]:
+                patterns.add(f"{left} {right}")
+    return patterns
+
+def test_sampled_pattern_is_a_derivation_of_the_sentence():
+    sentence_generator = generator.SentenceGenerator(max_length=8, seed=0)
+    for length in range(3, 9):
+        for _ in range(50):
+            sentence, pattern = sentence_generator.valid(length)
+            words, table, _ = parse(sentence)
+            assert cyk_process.is_valid_sentence(table, len(words)), sentence
+            assert pattern in top_level_patterns(words, table), (sentence, pattern)
+
+def test_parser_patterns_match_parser():
+    sentence_generator = generator.SentenceGenerator(max_length=8, seed=0, parser_patterns=True)
+    for _ in range(300):
+        sentence, pattern = sentence_generator.valid(5)
+        words, _, backpointer = parse(sentence)
+        assert cyk_process.get_sentence_pattern(backpointer, words)['pattern'] == f"K → {pattern}"
+
+def test_merged_tokens_are_reparsed(monkeypatch):
+    """Derivasi yang token-nya digabung tokenizer ("jaba" + "tengah") diberi label menurut parser."""
+    sentence_generator = generator.SentenceGenerator(max_length=6, seed=0)
+    symbol_id = sentence_generator.compiled.symbol_id
+    tokens = ["ka", "anak", "jaba", "tengah", "taluh"]
+    monkeypatch.setattr(sentence_generator, "_derive", lambda length: (tokens, (symbol_id["X2"], symbol_id["S"])))
+    
+    sentence, pattern = sentence_generator.valid(5)
+    words, _, backpointer = parse(sentence)
+    assert words == ["ka", "anak", "jaba tengah", "taluh"]
+    assert cyk_process.get_sentence_pattern(backpointer, words)['pattern'] == f"K → {pattern}"
+
+def test_invalid_sentences_are_rejected():
+    sentence_generator = generator.SentenceGenerator(max_length=8, seed=0)
+    for _ in range(300):
+        sentence, kind = sentence_generator.invalid(5)
+        words, table, _ = parse(sentence)
+        assert kind in generator.PERTURBATIONS
+        assert not cyk_process.is_valid_sentence(table, len(words)), sentence
+
+def test_stream_is_reproducible_for_any_worker_count():
+    options = {'count': 40, 'seed': 7, 'chunk_size': 10}
+    lines = list(generator.generate_lines(workers=1, **options))
+    assert lines == list(generator.generate_lines(workers=2, **options))
+    assert len(lines) == 40
@@ -0,0 +1,18 @@
+import grammar
+
+def test_binary_rules_are_keyed_by_symbol_id_pairs():
+    compiled = grammar.compiled
+    symbol_id = compiled.symbol_id
+    assert compiled.start_id in compiled.binary_rules[(symbol_id["P"], symbol_id["S"])]
+    for (left, right), parents in compiled.binary_rules.items():
+        assert 0 <= left < len(compiled.symbols) and 0 <= right < len(compiled.symbols)
+        assert parents == tuple(sorted(set(parents)))
+        assert compiled.pair_names[(left, right)] == (compiled.symbols[left], compiled.symbols[right])
+
+def test_mask_conversions_round_trip():
+    compiled = grammar.compiled
+    ids = compiled.lexical["ring"]
+    mask = compiled.lexical_masks["ring"]
+    assert compiled.mask_ids(mask) == ids
+    assert compiled.mask_names(mask) == frozenset(compiled.symbols[i] for i in ids)
+    assert compiled.mask_names(0) == frozenset()
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+import general
+import grammar_compiler
+
+TOY_GRAMMAR = """
+%start K
+%alphabet noun prep
+
+K  -> P S | P S S
+P  -> Prep N
+S  -> N
+N  -> @noun
+Prep -> @prep
+"""
+
+def test_parse_cfg_reads_directives_and_alternatives():
+    start, alphabets, rules = grammar_compiler.parse_cfg(TOY_GRAMMAR)
+    assert start == "K"
+    assert alphabets == ["noun", "prep"]
+    assert rules[:2] == [("K", ("P", "S")), ("K", ("P", "S", "S"))]
+
+@pytest.mark.parametrize("text", [
+    "K -> A",                              # tanpa %start
+    "%start K\n%unknown x\nK -> @noun",    # direktif tidak dikenal
+    "%start K\nK -> @noun N",               # terminal tidak berdiri sendiri
+    "%start K\n| A B"                       # alternatif tanpa sisi kiri
+])
+def test_parse_cfg_rejects_malformed_source(text):
+    with pytest.raises(ValueError):
+        grammar_compiler.parse_cfg(text)
+
+def test_convert_to_cnf_removes_units_and_binarizes():
+    _, _, rules = grammar_compiler.parse_cfg(TOY_GRAMMAR)
+    symbols, binary, lexical_classes = grammar_compiler.convert_to_cnf(rules)
+    
+    assert symbols == ["K", "P", "S", "N", "Prep", "X1"]
+    assert binary["K"] == [("P", "S"), ("X1", "S")]
+    assert binary["X1"] == [("P", "S")]
+    # S -> N -> @noun menjadi aturan terminal langsung
+    assert lexical_classes["S"] == ["noun"]
+    assert binary["S"] == []
+    for pairs in binary.values():
+        assert all(left in symbols and right in symbols for left, right in pairs)
+
+def test_convert_to_cnf_rejects_undefined_symbol():
+    _, _, rules = grammar_compiler.parse_cfg("%start K\nK -> A B\nA -> @noun")
+    with pytest.raises(ValueError):
+        grammar_compiler.convert_to_cnf(rules)
+
+@pytest.fixture
+def project_copy(tmp_path):
+    """Salinan grammar.cfg + kamus di folder sementara (artifact juga ditulis di sana)."""
+    with open(grammar_compiler.GRAMMAR_FILE, encoding="utf-8") as file:
+        (tmp_path / "grammar.cfg").write_text(file.read(), encoding="utf-8")
+    alphabets = tmp_path / "alphabets"
+    alphabets.mkdir()
+    for name in general.CATEGORIES:
+        words = general.load_words(f"{name}.txt")
+        (alphabets / f"{name}.txt").write_text("\n".join(words), encoding="utf-8")
+    return tmp_path
+
+def load(root, **options):
+    return grammar_compiler.load_grammar(
+        str(root / "grammar.cfg"), general.Lexicon(str(root / "alphabets")),
+        artifact_dir=str(root / "cache"), **options
+    )
+
+def test_artifact_is_reused_while_sources_are_unchanged(project_copy, monkeypatch):
+    first = load(project_copy)
+    artifacts = os.listdir(project_copy / "cache")
+    assert len(artifacts) == 1
+    fresh = load(project_copy, use_cache=False)
+    
+    def fail(text, lexicon):
+        raise AssertionError("grammar dikompilasi ulang walaupun artifact masih valid")
+    monkeypatch.setattr(grammar_compiler, "compile_source", fail)
+    assert load(project_copy) == first == fresh
+    assert os.listdir(project_copy / "cache") == artifacts
+
+@pytest.mark.parametrize("change", ["grammar", "lexicon"])
+def test_artifact_is_invalidated_by_source_change(project_copy, change):
+    first = load(project_copy)
+    if change == "grammar":
+        path = project_copy / "grammar.cfg"
+        path.write_text(path.read_text(encoding="utf-8") + "\nPP -> Prep NP_S\n", encoding="utf-8")
+    else:
+        with open(project_copy / "alphabets" / "noun.txt", "a", encoding="utf-8") as file:
+            file.write("\npasraman")
+    
+    second = load(project_copy)
+    assert second['hash'] != first['hash']
+    assert second == load(project_copy, use_cache=False)
+    if change == "lexicon":
+        assert "pasraman" in second['lexical']
+        assert "pasraman" not in first['lexical']
+
+def test_corrupt_artifact_is_recompiled(project_copy):
+    first = load(project_copy)
+    (artifact,) = os.listdir(project_copy / "cache")
+    (project_copy / "cache" / artifact).write_bytes(b"bukan marshal")
+    assert load(project_copy) == first
@@ -0,0 +1,97 @@
+import os
+import shutil
+
+import pytest
+
+import general
+import grammar
+import grammar_compiler
+import hot_reload
+import parse_cache
+import tokenizer
+
+NEW_WORD = "pasraman"
+SENTENCE = "Ring pasraman I Nyoman"
+
+@pytest.fixture
+def alphabets(tmp_path, monkeypatch):
+    """
+    Salinan grammar.cfg dan alphabets/ di folder sementara yang dipasang sebagai
+    snapshot default, sehingga reload tidak menyentuh kamus dan artifact project.
+    
+    Returns:
+        str: Path folder alphabets sementara
+    """
+    root = os.getcwd()
+    shutil.copy(os.path.join(root, grammar_compiler.GRAMMAR_FILE), tmp_path)
+    shutil.copytree(os.path.join(root, general.ALPHABET_DIR), tmp_path / general.ALPHABET_DIR)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(general, "snapshot", general.Snapshot(general.Lexicon()))
+    grammar.load_default()
+    return tmp_path / general.ALPHABET_DIR
+
+def write_category(alphabets, name, words):
+    path = alphabets / f"{name}.txt"
+    path.write_text("\n".join(words) + "\n", encoding="utf-8")
+    # Pastikan mtime berubah walaupun ditulis dalam tick yang sama
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+def is_valid(sentence):
+    lexicon, compiled = grammar.current()
+    words = tokenizer.tokenize(sentence, lexicon)
+    if lexicon.unknown_words(words):
+        return False
+    _, pattern_info = parse_cache.parse(words, compiled)
+    return pattern_info is not None
+
+def test_add_and_remove_word(alphabets):
+    nouns = list(general.default_lexicon.words("noun"))
+    old_snapshot = general.snapshot
+    old_version = grammar.compiled.version
+    assert NEW_WORD not in general.default_lexicon
+    assert not is_valid(SENTENCE)
+    
+    write_category(alphabets, "noun", nouns + [NEW_WORD])
+    assert hot_reload.reload_alphabets() == ["noun"]
+    lexicon, compiled = grammar.current()
+    assert NEW_WORD in lexicon
+    assert NEW_WORD in compiled.lexical_masks
+    assert compiled.version != old_version
+    assert is_valid(SENTENCE)
+    # Pembaca yang masih memegang snapshot lama tetap melihat kamus lama
+    assert NEW_WORD not in old_snapshot.lexicon
+    assert NEW_WORD not in old_snapshot.grammar['compiled'].lexical_masks
+    
+    write_category(alphabets, "noun", nouns)
+    assert hot_reload.reload_alphabets() == ["noun"]
+    lexicon, compiled = grammar.current()
+    assert NEW_WORD not in lexicon
+    assert NEW_WORD not in compiled.lexical_masks
+    assert compiled.version == old_version
+    assert not is_valid(SENTENCE)
+
+def test_reload_matches_fresh_compile(alphabets):
+    nouns = list(general.default_lexicon.words("noun"))
+    write_category(alphabets, "noun", nouns[1:] + [NEW_WORD])
+    hot_reload.reload_alphabets()
+    
+    lexicon, compiled = grammar.current()
+    fresh = grammar_compiler.load_grammar(lexicon=general.Lexicon(), use_cache=False)
+    assert compiled.lexical == fresh['lexical']
+    assert compiled.version == fresh['hash']
+
+def test_touch_without_change_keeps_snapshot(alphabets):
+    snapshot = general.snapshot
+    write_category(alphabets, "noun", general.default_lexicon.words("noun"))
+    assert hot_reload.reload_alphabets() == []
+    assert general.snapshot.grammar is snapshot.grammar
+    assert hot_reload.reload_alphabets() == []
+
+def test_watcher_calls_on_reload(alphabets):
+    calls = []
+    watcher = hot_reload.AlphabetWatcher(interval=3600, on_reload=calls.append)
+    write_category(alphabets, "adj", list(general.default_lexicon.words("adj")) + ["anyar pisan"])
+    assert watcher.check(force=True) == ["adj"]
+    assert watcher.check() == []
+    assert calls == [["adj"]]
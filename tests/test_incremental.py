@@ -0,0 +1,37 @@
+import cyk_process
+from incremental import IncrementalParser
+
+def assert_matches_full_parse(parser, words):
+    n = len(words)
+    expected = cyk_process.recognize(words)
+    table = parser.table()
+    assert parser.is_valid() == cyk_process.is_valid_sentence(expected, n)
+    for row in range(n):
+        for col in range(n - row):
+            assert table[row][col] == expected[row][col], (words, row, col)
+
+def test_push_matches_full_parse_for_every_prefix(dataset_sentences):
+    for words in dataset_sentences:
+        parser = IncrementalParser()
+        for end, word in enumerate(words, 1):
+            parser.push(word)
+            assert_matches_full_parse(parser, words[:end])
+
+def test_pop_restores_previous_prefix(dataset_sentences):
+    for words in dataset_sentences[:20]:
+        parser = IncrementalParser()
+        parser.sync(words)
+        while len(parser) > 1:
+            assert parser.pop() == words[len(parser)]
+            assert_matches_full_parse(parser, words[:len(parser)])
+
+def test_sync_edits_end_of_sentence():
+    parser = IncrementalParser()
+    parser.sync(["ring", "pura", "i nyoman"])
+    assert parser.is_valid()
+    parser.sync(["ring", "pura", "ento", "i nyoman"])
+    assert_matches_full_parse(parser, ["ring", "pura", "ento", "i nyoman"])
+    parser.sync(["ring", "pura"])
+    assert not parser.is_valid()
+    parser.sync([])
+    assert len(parser) == 0 and not parser.is_valid()
@@ -0,0 +1,89 @@
+import cyk_process
+import grammar
+import parse_cache
+import tokenizer
+
+def words_of(sentence):
+    return tokenizer.tokenize(sentence)
+
+def test_lru_evicts_least_recently_used():
+    cache = parse_cache.ParseCache(capacity=2)
+    cache.put("a", (1,))
+    cache.put("b", (2,))
+    assert cache.get("a") == (1,)
+    cache.put("c", (3,))
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ((1,), (3,))
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions'], stats['memory_entries']) == (3, 1, 1, 2)
+
+def test_disk_tier_survives_restart(tmp_path):
+    db_path = str(tmp_path / "parse_cache.sqlite3")
+    compiled = grammar.compiled
+    words = words_of("Ring pura I Nyoman")
+    
+    cache = parse_cache.ParseCache(capacity=4, db_path=db_path)
+    _, expected = parse_cache.parse(words, compiled, cache=cache)
+    cache.close()
+    
+    cache = parse_cache.ParseCache(capacity=4, db_path=db_path)
+    _, pattern_info = parse_cache.parse(words, compiled, cache=cache)
+    stats = cache.stats()
+    assert pattern_info == expected
+    assert (stats['hits_disk'], stats['misses'], stats['disk_entries']) == (1, 0, 1)
+    parse_cache.parse(words, compiled, cache=cache)
+    assert cache.stats()['hits_memory'] == 1
+    cache.close()
+
+def test_cache_key_follows_grammar_version():
+    compiled = grammar.compiled
+    words = words_of("Ring pura I Nyoman")
+    reloaded = compiled.with_lexical(compiled.lexical, set(), "other-version")
+    assert parse_cache.cache_key(words, reloaded) != parse_cache.cache_key(words, compiled)
+    
+    unversioned = compiled.with_lexical(compiled.lexical, set(), None)
+    assert parse_cache.cache_key(words, unversioned) is None
+
+def test_invalid_sentence_is_cached_as_invalid():
+    compiled = grammar.compiled
+    cache = parse_cache.ParseCache(capacity=8)
+    words = words_of("I Nyoman ring")
+    for _ in range(2):
+        table, pattern_info = parse_cache.parse(words, compiled, cache=cache)
+        assert pattern_info is None
+        assert not cyk_process.is_valid_sentence(table, len(words))
+    assert cache.stats()['hits'] == 1
+
+def test_same_word_classes_share_cache_key():
+    """Kalimat dengan urutan kelas kata yang sama berbagi satu entri cache."""
+    compiled = grammar.compiled
+    first = words_of("Di carik I Wayan")
+    second = words_of("Ring pura I Nyoman")
+    assert parse_cache.word_classes(first, compiled) == parse_cache.word_classes(second, compiled)
+    assert parse_cache.cache_key(first, compiled) == parse_cache.cache_key(second, compiled)
+
+def test_cache_key_separates_signature_engine_and_prune():
+    compiled = grammar.compiled
+    words = words_of("Ring pura I Nyoman")
+    key = parse_cache.cache_key(words, compiled)
+    assert parse_cache.cache_key(words_of("I Nyoman ring pura"), compiled) != key
+    assert parse_cache.cache_key(words, compiled, engine="bitset") != key
+    assert parse_cache.cache_key(words, compiled, prune=True) != key
+    assert parse_cache.cache_key(words, compiled, start_symbol="S") != key
+
+def test_shared_entry_reattaches_leaves():
+    """Hit cache dari kalimat lain tetap memberi parse tree dengan kata kalimat ini."""
+    compiled = grammar.compiled
+    cache = parse_cache.ParseCache(capacity=8)
+    first = words_of("Di carik I Wayan")
+    second = words_of("Ring pura I Nyoman")
+    
+    _, first_info = parse_cache.parse(first, compiled, cache=cache)
+    _, second_info = parse_cache.parse(second, compiled, cache=cache)
+    
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+    assert second_info['pattern'] == first_info['pattern']
+    
+    _, backpointer = cyk_process.cyk_parse(second, compiled)
+    assert second_info == cyk_process.get_sentence_pattern(backpointer, second)
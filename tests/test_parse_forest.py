@@ -0,0 +1,42 @@
+import itertools
+
+import cyk_process
+import parse_forest
+
+AMBIGUOUS = ["ring", "pura", "ento", "gusti ngurah", "pamangku"]
+
+def forest_for(words):
+    table, backpointer = cyk_process.cyk_parse(words)
+    return parse_forest.build_forest(table, words), backpointer
+
+def leaves(tree):
+    if tree['type'] == 'terminal':
+        return [tree['word']]
+    return leaves(tree['left']) + leaves(tree['right'])
+
+def test_first_tree_is_sentence_pattern(dataset_sentences):
+    for words in dataset_sentences:
+        forest, backpointer = forest_for(words)
+        if forest is None:
+            assert not cyk_process.is_valid_sentence(cyk_process.recognize(words), len(words))
+            continue
+        assert forest.count_derivations() >= 1
+        assert forest.k_best(1) == [cyk_process.get_sentence_pattern(backpointer, words)['parse_tree']]
+
+def test_count_matches_enumeration():
+    forest, _ = forest_for(AMBIGUOUS)
+    trees = list(forest.iter_trees())
+    assert forest.count_derivations() == len(trees) == 5
+    assert len({repr(tree) for tree in trees}) == len(trees)
+    for tree in trees:
+        assert tree['label'] == "K"
+        assert leaves(tree) == AMBIGUOUS
+
+def test_k_best_is_prefix_of_iteration():
+    forest, _ = forest_for(AMBIGUOUS)
+    trees = list(forest.iter_trees())
+    for k in (0, 1, 3, 5, 10):
+        assert forest.k_best(k) == list(itertools.islice(trees, k))
+
+def test_invalid_sentence_has_no_forest():
+    assert forest_for(["i nyoman", "ring"])[0] is None
@@ -0,0 +1,51 @@
+import cyk_process
+import grammar
+import parse_stats
+import span_memo
+import tokenizer
+
+SENTENCE = "Ring pura I Nyoman"
+
+def count_lookups(words, compiled, prune):
+    """Lookup aturan engine set yang benar-benar dilakukan loop fill_chart."""
+    chart = cyk_process.fill_chart(words, compiled, prune=prune)
+    n = len(words)
+    lookups = 0
+    for length in range(2, n + 1):
+        for col in range(n - length + 1):
+            for k in range(1, length):
+                left = compiled.mask_ids(chart.get(k - 1, col))
+                right = compiled.mask_ids(chart.get(length - k - 1, col + k))
+                lookups += len(left) * len(right)
+    return lookups
+
+def test_chart_estimate_matches_loop_work_with_pruning():
+    compiled = grammar.compiled
+    words = tokenizer.tokenize(SENTENCE)
+    for prune in (False, True):
+        stats = parse_stats.ParseStats()
+        cyk_process.recognize(words, compiled, prune=prune, stats=stats)
+        assert stats.rule_lookups == stats.combinations == count_lookups(words, compiled, prune)
+        assert stats.cells_filled == len(words) * (len(words) + 1) // 2
+
+def test_memo_hits_are_not_counted_as_work():
+    compiled = grammar.compiled
+    words = tokenizer.tokenize(SENTENCE)
+    memo = span_memo.SpanMemo()
+    cyk_process.recognize(words, compiled, memo=memo)
+    
+    stats = parse_stats.ParseStats()
+    cyk_process.recognize(words, compiled, memo=memo, stats=stats)
+    assert stats.cells_from_memo == len(words) * (len(words) - 1) // 2
+    assert (stats.split_points, stats.rule_lookups) == (0, 0)
+    assert stats.cells_filled == len(words)
+
+def test_merge_adds_counters_and_phases():
+    first = parse_stats.ParseStats()
+    first.add_cell(0b101)
+    with first.phase("chart_fill"):
+        pass
+    total = parse_stats.ParseStats().merge(first).merge(first.as_dict())
+    assert total.cells_filled == 2
+    assert total.cell_sizes == {2: 2}
+    assert total.phase_ns['chart_fill'] == 2 * first.phase_ns['chart_fill']
@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import seken
+
+def without_timing(results):
+    return [{key: value for key, value in result.items() if key != 'time_ms'} for result in results]
+
+@pytest.fixture(scope="module")
+def lines(test_cases):
+    # Baris kosong dilewati tetapi tetap dihitung untuk nomor baris
+    sentences = [case['sentence'] for case in test_cases]
+    return sentences[:40] + [""] + sentences[40:]
+
+@pytest.fixture(scope="module")
+def expected(lines):
+    return without_timing(seken.batch_parse(lines, workers=1))
+
+def test_single_worker_results(lines, expected, test_cases):
+    assert [result['line'] for result in expected] == [
+        number for number, line in enumerate(lines, 1) if line.strip()
+    ]
+    valid = {case['sentence']: case['expected'] for case in test_cases}
+    agreement = sum(result['valid'] == valid[result['sentence']] for result in expected)
+    assert agreement / len(expected) > 0.9
+    for result in expected:
+        if result['valid']:
+            assert result['pattern'].startswith("K →")
+            assert not result['unknown']
+
+def test_ordered_pool_matches_single_worker(lines, expected):
+    results = without_timing(seken.batch_parse(lines, workers=2, chunk_size=3, ordered=True))
+    assert results == expected
+
+def test_unordered_pool_returns_every_line_once(lines, expected):
+    results = without_timing(seken.batch_parse(lines, workers=2, chunk_size=3, ordered=False))
+    assert sorted(results, key=lambda result: result['line']) == expected
+
+@pytest.mark.parametrize("options", [{'engine': "lalr"}, {'workers': 0}, {'chunk_size': 0}])
+def test_invalid_options_are_rejected_before_parsing(options):
+    # ValueError saat dipanggil, tanpa perlu mengambil hasil pertama
+    with pytest.raises(ValueError):
+        seken.batch_parse(["ring pura i nyoman"], **options)
+
+@pytest.mark.parametrize("option", ["--engine=lalr", "--workers=0", "--workers=dua"])
+def test_batch_cli_reports_invalid_options(option, tmp_path):
+    output = tmp_path / "out.jsonl"
+    process = subprocess.run(
+        [sys.executable, "seken.py", "batch", "-", option, f"--output={output}"],
+        input="Ring pura I Nyoman\n", capture_output=True, text=True, encoding="utf-8", timeout=60
+    )
+    assert process.returncode == 2
+    assert "Traceback" not in process.stderr
+    assert not output.exists()
+
+def test_batch_cli_writes_jsonl():
+    process = subprocess.run(
+        [sys.executable, "seken.py", "batch", "-", "--workers=1"],
+        input="Ring pura I Nyoman\nI Nyoman ring\nRing pasraman I Nyoman\n",
+        capture_output=True, text=True, encoding="utf-8", timeout=60
+    )
+    assert process.returncode == 0, process.stderr
+    results = [json.loads(line) for line in process.stdout.splitlines()]
+    assert [(result['line'], result['valid']) for result in results] == [(1, True), (2, False), (3, False)]
+    assert results[2]['unknown'] == ["pasraman"]
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import time
+
+import generator
+import server
+
+async def request(port, method, path, payload=None, headers=None):
+    """
+    Mengirim satu request HTTP/1.1 (Connection: close) ke service.
+    
+    Returns:
+        tuple: (status, headers, body JSON)
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    lines = [f"{method} {path} HTTP/1.1", "Host: localhost", "Connection: close"]
+    request_headers = {"Content-Length": str(len(body))}
+    request_headers.update(headers or {})
+    lines.extend(f"{name}: {value}" for name, value in request_headers.items())
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+    
+    response = await asyncio.wait_for(reader.read(), 60)
+    writer.close()
+    await writer.wait_closed()
+    
+    head, _, data = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    response_headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        response_headers[name.strip().lower()] = value.strip()
+    return int(status_line.split()[1]), response_headers, json.loads(data)
+
+def run(scenario, **options):
+    """Menjalankan scenario(service) dengan ParserService 1 worker di port acak."""
+    async def main():
+        service = server.ParserService(port=0, workers=1, **options)
+        await service.start()
+        try:
+            return await scenario(service)
+        finally:
+            await service.close()
+    return asyncio.run(main())
+
+def slow_batch():
+    # Kalimat valid yang panjang: satu chunk butuh jauh lebih lama dari timeout test
+    sentence_generator = generator.SentenceGenerator(max_length=40, seed=1)
+    return [" ".join(sentence_generator.sample(40)) for _ in range(200)]
+
+def test_parse_and_parse_many():
+    async def scenario(service):
+        status, _, body = await request(service.port, "POST", "/parse", {"sentence": "Ring pura I Nyoman"})
+        assert status == 200
+        assert body['valid'] and body['pattern'] == "K → P S"
+        
+        status, _, body = await request(service.port, "POST", "/parse_many",
+                                        {"sentences": ["I Nyoman ring", "Ring pura I Nyoman", ""]})
+        assert status == 200
+        assert [(item['index'], item['valid']) for item in body['results']] == [(0, False), (1, True), (2, False)]
+        
+        status, _, body = await request(service.port, "GET", "/health")
+        assert (status, body['status'], body['in_flight']) == (200, "ok", 0)
+    run(scenario)
+
+def test_client_errors():
+    async def scenario(service):
+        assert (await request(service.port, "GET", "/nope"))[0] == 404
+        status, headers, _ = await request(service.port, "GET", "/parse")
+        assert (status, headers['allow']) == (405, "POST")
+        assert (await request(service.port, "POST", "/parse", {"sentence": "  "}))[0] == 400
+        assert (await request(service.port, "POST", "/parse_many", {"sentences": "ring pura"}))[0] == 400
+    run(scenario)
+
+def test_payload_too_large():
+    async def scenario(service):
+        too_many = {"sentences": ["ring pura i nyoman"] * (server.MAX_BATCH_SENTENCES + 1)}
+        assert (await request(service.port, "POST", "/parse_many", too_many))[0] == 413
+        
+        too_long = {"sentence": "pura " * (server.MAX_SENTENCE_CHARS // 5 + 1)}
+        assert (await request(service.port, "POST", "/parse", too_long))[0] == 413
+        
+        # Body tidak pernah dikirim: ditolak dari header Content-Length saja
+        status, headers, _ = await request(service.port, "POST", "/parse",
+                                           headers={"Content-Length": str(server.MAX_BODY_BYTES + 1)})
+        assert (status, headers['connection']) == (413, "close")
+    run(scenario)
+
+def test_timeout_then_busy_until_worker_finishes():
+    """
+    Job yang melewati request_timeout dijawab 504, tetapi slotnya tetap terpakai
+    sampai worker selesai: request berikutnya ditolak 503 (bukan antri tanpa batas),
+    lalu diterima lagi setelah slot dilepas.
+    """
+    batch = slow_batch()
+    
+    async def scenario(service):
+        status, _, body = await request(service.port, "POST", "/parse_many", {"sentences": batch})
+        assert status == 504, body
+        assert service.in_flight == 1
+        
+        status, headers, _ = await request(service.port, "POST", "/parse", {"sentence": "Ring pura I Nyoman"})
+        assert (status, headers['retry-after']) == (503, "1")
+        
+        deadline = time.monotonic() + 120
+        while service.in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        assert service.in_flight == 0
+        
+        status, _, body = await request(service.port, "POST", "/parse", {"sentence": "Ring pura I Nyoman"})
+        assert (status, body['valid']) == (200, True)
+    run(scenario, max_pending=1, queue_timeout=0.05, request_timeout=0.05)
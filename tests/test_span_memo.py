@@ -0,0 +1,47 @@
+import pytest
+
+import cyk_bitset
+import cyk_process
+import grammar
+from span_memo import SpanMemo
+from tests.test_cyk_process import random_sentences
+
+@pytest.mark.parametrize("engine", ["set", "bitset"])
+@pytest.mark.parametrize("prune", [False, True])
+def test_memo_keeps_every_cell(dataset_sentences, engine, prune):
+    memo = SpanMemo()
+    for words in dataset_sentences:
+        n = len(words)
+        expected = cyk_process.recognize(words, engine=engine, prune=prune)
+        table = cyk_process.recognize(words, engine=engine, prune=prune, memo=memo)
+        for row in range(n):
+            for col in range(n - row):
+                assert table[row][col] == expected[row][col], (words, row, col)
+    assert memo.stats()['hits'] > 0
+
+def test_shared_span_is_reused_across_sentences():
+    memo = SpanMemo()
+    cyk_process.recognize(["ring", "pura", "i nyoman"], memo=memo)
+    before = memo.stats()['hits']
+    # Kelas kata sama: span panjang 2 dan 3 diambil dari memo
+    cyk_process.recognize(["di", "carik", "i wayan"], memo=memo)
+    assert memo.stats()['hits'] - before == 3
+
+def test_memo_is_cleared_for_other_grammar():
+    compiled = grammar.compiled
+    memo = SpanMemo()
+    cyk_bitset.fill_chart(["ring", "pura", "i nyoman"], compiled, memo=memo)
+    assert memo.cells
+    memo.bind(compiled.with_lexical(compiled.lexical, set(), "other-version"))
+    assert not memo.cells
+
+def test_memo_with_pruning_on_random_inputs():
+    """Memo dengan flag awal/akhir span tetap benar saat pruning dan early abort aktif."""
+    compiled = grammar.compiled
+    memos = {cyk_process.fill_chart: SpanMemo(), cyk_bitset.fill_chart: SpanMemo()}
+    for sentence in random_sentences(compiled, 300):
+        n = len(sentence)
+        expected = cyk_process.is_valid_sentence(cyk_process.recognize(sentence, compiled), n)
+        for fill_chart, memo in memos.items():
+            chart = fill_chart(sentence, compiled, prune=True, memo=memo)
+            assert bool(chart.get(n - 1, 0) & compiled.start_mask) == expected, sentence
@@ -0,0 +1,25 @@
+import random
+
+import general
+import spelling
+
+def brute_force(term, words, max_distance, limit):
+    matches = sorted(
+        (spelling.edit_distance(term, word, max_distance), word) for word in words
+    )
+    return [(word, distance) for distance, word in matches if distance <= max_distance][:limit]
+
+def test_index_matches_brute_force_scan():
+    words = sorted(general.default_lexicon.alphabet)
+    index = spelling.SymSpellIndex(words)
+    rng = random.Random(5)
+    for word in rng.sample(words, 40):
+        chars = list(word)
+        chars[rng.randrange(len(chars))] = rng.choice("aiueo")
+        typo = "".join(chars)
+        assert index.lookup(typo, limit=5) == brute_force(typo, words, spelling.DEFAULT_MAX_DISTANCE, 5), typo
+
+def test_suggest_returns_categories():
+    lexicon = general.Lexicon(words={"noun": ["pura", "bale"], "prep": ["ring"]})
+    assert spelling.suggest("puar", lexicon) == [{'word': "pura", 'distance': 1, 'categories': ["noun"]}]
+    assert spelling.suggest("xyzxyz", lexicon) == []
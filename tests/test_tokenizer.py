@@ -0,0 +1,56 @@
+import general
+import grammar
+import parse_cache
+import tokenizer
+
+def test_longest_multi_word_entry_wins():
+    lexicon = general.Lexicon(words={
+        "noun": ["jaba", "jaba tengah", "jaba tengah pura"],
+        "propnoun": ["gusti ngurah"],
+        "prep": ["ring"]
+    })
+    assert tokenizer.tokenize("Ring Jaba Tengah Pura Gusti Ngurah", lexicon) == [
+        "ring", "jaba tengah pura", "gusti ngurah"
+    ]
+    assert tokenizer.tokenize("ring jaba tengah", lexicon) == ["ring", "jaba tengah"]
+    # Prefix entri yang tidak lengkap kembali ke kata tunggal
+    assert tokenizer.tokenize("ring jaba gusti", lexicon) == ["ring", "jaba", "gusti"]
+
+def test_unknown_words_stay_separate_tokens():
+    tokens = tokenizer.tokenize("Ring  pura   Xyz I Nyoman")
+    assert tokens == ["ring", "pura", "xyz", "i nyoman"]
+    assert general.check_alphabet(tokens) == (False, ["xyz"])
+
+def test_default_lexicon_multi_word_entries():
+    assert tokenizer.tokenize("Ring Jaba Tengah Gusti Ngurah") == ["ring", "jaba tengah", "gusti ngurah"]
+
+def subject_of(words):
+    _, pattern_info = parse_cache.parse(words, grammar.compiled)
+    return pattern_info['pattern'], pattern_info['parse_tree']['right']
+
+def test_honorific_name_is_one_subject():
+    """
+    "I Nyoman" adalah satu nama diri: subjeknya seluruh nama. Tanpa entri
+    multiword, "i" (det) menempel ke keterangan tempat ("pura i").
+    """
+    words = tokenizer.tokenize("Ring pura I Nyoman")
+    assert words == ["ring", "pura", "i nyoman"]
+    pattern, subject = subject_of(words)
+    assert (pattern, subject['label'], subject['word']) == ("K → P S", "S", "i nyoman")
+    
+    _, subject = subject_of(["ring", "pura", "i", "nyoman"])
+    assert subject['word'] == "nyoman"
+
+def test_i_before_common_noun_stays_determiner():
+    words = tokenizer.tokenize("Di Paon I Meme")
+    assert words == ["di", "paon", "i", "meme"]
+    assert "i" in general.default_lexicon.words("det")
+    pattern, subject = subject_of(words)
+    assert (pattern, subject['word']) == ("K → P S", "meme")
+
+def test_tokenizer_is_rebuilt_for_new_lexicon():
+    old = general.Lexicon(words={"noun": ["bale"]})
+    new = general.Lexicon(words={"noun": ["bale", "bale banjar"]})
+    assert tokenizer.get_tokenizer(old) is tokenizer.get_tokenizer(old)
+    assert tokenizer.tokenize("bale banjar", old) == ["bale", "banjar"]
+    assert tokenizer.tokenize("bale banjar", new) == ["bale banjar"]
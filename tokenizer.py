@@ -0,0 +1,106 @@
+import general
+
+# Penanda akhir entri pada node trie
+END = ""
+
+class Tokenizer:
+    """
+    Tokenizer satu kali jalan dengan longest match atas entri kamus multi-kata
+    (mis. "gusti ngurah", "jaba tengah"). Trie disusun per kata: setiap node
+    adalah dict kata -> node anak, dan kunci END menandai entri lengkap.
+    Entri multi-kata menjadi satu token sehingga kalimat lebih pendek
+    sebelum masuk CYK (biaya chart O(n^3)).
+    
+    Contoh:
+        Tokenizer().tokenize("Ring Jaba Tengah Gusti Ngurah")
+        # ["ring", "jaba tengah", "gusti ngurah"]
+    """
+    def __init__(self, lexicon=None):
+        self.lexicon = lexicon if lexicon is not None else general.default_lexicon
+        self.trie = {}
+        for entry in self.lexicon.alphabet:
+            parts = entry.split()
+            if len(parts) < 2:
+                continue
+            node = self.trie
+            for part in parts:
+                node = node.setdefault(part, {})
+            node[END] = entry
+    
+    def tokenize(self, sentence):
+        """
+        Memecah kalimat menjadi token (huruf kecil). Di setiap posisi dipilih
+        entri multi-kata terpanjang yang cocok; jika tidak ada, satu kata
+        menjadi satu token (termasuk kata yang tidak dikenal, agar tetap
+        dilaporkan oleh check_alphabet).
+        
+        Args:
+            sentence (str): Kalimat input
+        
+        Returns:
+            list: List token
+        """
+        words = sentence.lower().split()
+        if not self.trie:
+            return words
+        
+        tokens = []
+        i = 0
+        n = len(words)
+        while i < n:
+            node = self.trie
+            match = None
+            match_end = i
+            j = i
+            while j < n:
+                node = node.get(words[j])
+                if node is None:
+                    break
+                j += 1
+                if END in node:
+                    match = node[END]
+                    match_end = j
+            
+            if match is None:
+                tokens.append(words[i])
+                i += 1
+            else:
+                tokens.append(match)
+                i = match_end
+        return tokens
+
+_tokenizers = {}
+
+def get_tokenizer(lexicon=None):
+    """
+    Tokenizer untuk sebuah kamus, dibuat sekali per objek Lexicon. Hot reload
+    kamus menghasilkan objek Lexicon baru sehingga trie ikut dibangun ulang.
+    
+    Args:
+        lexicon (Lexicon): Kamus (default: general.default_lexicon)
+    
+    Returns:
+        Tokenizer: Tokenizer untuk kamus tersebut
+    """
+    if lexicon is None:
+        lexicon = general.default_lexicon
+    tokenizer = _tokenizers.get(id(lexicon))
+    if tokenizer is None or tokenizer.lexicon is not lexicon:
+        tokenizer = Tokenizer(lexicon)
+        if len(_tokenizers) >= 8:
+            _tokenizers.clear()
+        _tokenizers[id(lexicon)] = tokenizer
+    return tokenizer
+
+def tokenize(sentence, lexicon=None):
+    """
+    Tokenisasi kalimat dengan entri multi-kata kamus (pengganti sentence.lower().split()).
+    
+    Args:
+        sentence (str): Kalimat input
+        lexicon (Lexicon): Kamus (default: general.default_lexicon)
+    
+    Returns:
+        list: List token
+    """
+    return get_tokenizer(lexicon).tokenize(sentence)